@@ -1,6 +1,10 @@
 from machine import I2C, Pin
 import time
 
+from binlog import (BinaryLog, STATUS_OK, STATUS_FAILED, STATUS_TIMEOUT, EV_CHECK_CHIP_ID, EV_SOFT_RESET,
+                    EV_READ_CALIBRATION, EV_SET_OSR, EV_SET_MODE, EV_START_MEASUREMENT, EV_WAIT_MEASUREMENT,
+                    EV_READ_RAW, EV_COMPENSATE_TEMPERATURE, EV_COMPENSATE_PRESSURE, EV_MEASUREMENT)
+
 # 상수 정의
 ADDRESS = 0x77
 REG_CHIP_ID = 0x00
@@ -17,43 +21,38 @@ CALIB_LEN = 21
 # I2C 설정
 i2c = I2C(1, sda=Pin(6), scl=Pin(7), freq=100000)
 
+# 바이너리 로그 (호스트에서 python binlog.py log.bin log.csv로 변환)
+log = BinaryLog("log.bin")
+
 # CHIP_ID 확인
-logs = []
-start_time = time.ticks_ms()
+start_time = time.ticks_us()
 try:
     chip_id = i2c.readfrom_mem(ADDRESS, REG_CHIP_ID, 1)[0]
     success = (chip_id == 0x50)
-    if not success:
-        raise ValueError("Invalid CHIP_ID")
-except Exception as e:
+except Exception:
     success = False
-    logs.append(f"Check CHIP_ID: failed with {e}")
-end_time = time.ticks_ms()
-logs.append(f"Check CHIP_ID: time={time.ticks_diff(end_time, start_time)}ms, success={success}")
+log.log(EV_CHECK_CHIP_ID, STATUS_OK if success else STATUS_FAILED, time.ticks_diff(time.ticks_us(), start_time))
 if not success:
     print("Sensor not found")
+    log.close()
     raise SystemExit
 
 # 소프트 리셋
 def soft_reset(i2c, address):
-    global logs
-    start_time = time.ticks_ms()
+    start_time = time.ticks_us()
     try:
         i2c.writeto_mem(address, REG_CMD, b'\xB6')
-        success = True
-    except Exception as e:
-        success = False
-        logs.append(f"Soft reset: failed with {e}")
-    end_time = time.ticks_ms()
-    logs.append(f"Soft reset: time={time.ticks_diff(end_time, start_time)}ms, success={success}")
+        status = STATUS_OK
+    except Exception:
+        status = STATUS_FAILED
+    log.log(EV_SOFT_RESET, status, time.ticks_diff(time.ticks_us(), start_time))
     time.sleep_ms(10)
 
 soft_reset(i2c, ADDRESS)
 
 # 보정 데이터 읽기
 def read_calibration(i2c, address):
-    global logs
-    start_time = time.ticks_ms()
+    start_time = time.ticks_us()
     try:
         calib_data = i2c.readfrom_mem(address, CALIB_START, CALIB_LEN)
         # 보정 계수 파싱
@@ -114,17 +113,16 @@ def read_calibration(i2c, address):
             'par_p7': par_p7, 'par_p8': par_p8, 'par_p9': par_p9,
             'par_p10': par_p10, 'par_p11': par_p11
         }
-    except Exception as e:
+    except Exception:
         success = False
         result = None
-        logs.append(f"Read calibration: failed with {e}")
-    end_time = time.ticks_ms()
-    logs.append(f"Read calibration: time={time.ticks_diff(end_time, start_time)}ms, success={success}")
+    log.log(EV_READ_CALIBRATION, STATUS_OK if success else STATUS_FAILED, time.ticks_diff(time.ticks_us(), start_time))
     return result, success
 
 cal, success = read_calibration(i2c, ADDRESS)
 if not success:
     print("Failed to read calibration data")
+    log.close()
     raise SystemExit
 
 # 보정 함수
@@ -151,77 +149,55 @@ def compensate_pressure(uncomp_press, t_lin, cal):
     return comp_press
 
 # 작업 수행 및 로깅
-def perform_action(action_name, func, logs):
-    start_time = time.ticks_ms()
+def perform_action(event, func):
+    start_time = time.ticks_us()
     try:
         result = func()
         success = True
-    except Exception as e:
+    except Exception:
         result = None
         success = False
-        logs.append(f"{action_name}: failed with {e}")
-    end_time = time.ticks_ms()
-    elapsed = time.ticks_diff(end_time, start_time)
-    logs.append(f"{action_name}: time={elapsed}ms, success={success}")
+    log.log(event, STATUS_OK if success else STATUS_FAILED, time.ticks_diff(time.ticks_us(), start_time))
     return result, success
 
 # 측정 대기
-def wait_for_measurement(i2c, address, logs):
-    start_time = time.ticks_ms()
-    timeout = 1000  # 1 second
+def wait_for_measurement(i2c, address):
+    start_time = time.ticks_us()
+    timeout = 1000000  # 1 second
     while True:
         try:
             status = i2c.readfrom_mem(address, REG_STATUS, 1)[0]
             if (status & 0x60) == 0x60:
                 break
-            if time.ticks_diff(time.ticks_ms(), start_time) > timeout:
-                logs.append("Wait for measurement: timeout")
+            if time.ticks_diff(time.ticks_us(), start_time) > timeout:
+                log.log(EV_WAIT_MEASUREMENT, STATUS_TIMEOUT, time.ticks_diff(time.ticks_us(), start_time))
                 return False
             time.sleep_ms(1)
-        except Exception as e:
-            logs.append(f"Wait for measurement: failed with {e}")
+        except Exception:
+            log.log(EV_WAIT_MEASUREMENT, STATUS_FAILED, time.ticks_diff(time.ticks_us(), start_time))
             return False
-    end_time = time.ticks_ms()
-    logs.append(f"Wait for measurement: time={time.ticks_diff(end_time, start_time)}ms, success=True")
+    log.log(EV_WAIT_MEASUREMENT, STATUS_OK, time.ticks_diff(time.ticks_us(), start_time))
     return True
 
 # 데이터 처리
 def read_data():
     # 원시 데이터 읽기
-    raw_data, success = perform_action("Read raw data", lambda: i2c.readfrom_mem(ADDRESS, REG_DATA, 6), logs)
+    raw_data, success = perform_action(EV_READ_RAW, lambda: i2c.readfrom_mem(ADDRESS, REG_DATA, 6))
     if not success:
         return None
     # 원시 기압 및 온도 추출
     raw_press = raw_data[0] | (raw_data[1] << 8) | (raw_data[2] << 16)
     raw_temp = raw_data[3] | (raw_data[4] << 8) | (raw_data[5] << 16)
     # 온도 보정
-    start_time = time.ticks_ms()
-    try:
-        t_lin = compensate_temperature(raw_temp, cal)
-        success = True
-    except Exception as e:
-        t_lin = None
-        success = False
-        logs.append(f"Compensate temperature: failed with {e}")
-    end_time = time.ticks_ms()
-    logs.append(f"Compensate temperature: time={time.ticks_diff(end_time, start_time)}ms, success={success}")
+    t_lin, success = perform_action(EV_COMPENSATE_TEMPERATURE, lambda: compensate_temperature(raw_temp, cal))
     if not success:
         return None
     # 기압 보정
-    start_time = time.ticks_ms()
-    try:
-        comp_press = compensate_pressure(raw_press, t_lin, cal)
-        success = True
-    except Exception as e:
-        comp_press = None
-        success = False
-        logs.append(f"Compensate pressure: failed with {e}")
-    end_time = time.ticks_ms()
-    logs.append(f"Compensate pressure: time={time.ticks_diff(end_time, start_time)}ms, success={success}")
+    comp_press, success = perform_action(EV_COMPENSATE_PRESSURE, lambda: compensate_pressure(raw_press, t_lin, cal))
     if not success:
         return None
-    # 결과 출력
-    logs.append(f"Mode: {mode}, Measurement {i + 1}: Temp = {t_lin:.2f} ℃, Press = {comp_press:.2f} Pa")
+    # 결과 기록 (원시 값만 기록, 문자열 변환은 출력할 때만)
+    log.log(EV_MEASUREMENT, STATUS_OK, 0, raw_press, raw_temp)
     print(f"Mode: {mode}, Measurement {i + 1}: Temp = {t_lin:.2f} ℃, Press = {comp_press:.2f} Pa")
     return None
 
@@ -236,43 +212,42 @@ for mode in ['low_power', 'normal']:
     osr_value = modes[mode]['osr_value']
     pwr_ctrl = modes[mode]['pwr_ctrl']
 
-    # perform_action("Set to sleep mode", lambda: i2c.writeto_mem(ADDRESS, REG_PWR_CTRL, b'\x00'), logs)
+    # perform_action(EV_SET_MODE, lambda: i2c.writeto_mem(ADDRESS, REG_PWR_CTRL, b'\x00'))
 
     if mode == 'normal':
         soft_reset(i2c, ADDRESS)
 
-        perform_action("Set OSR", lambda: i2c.writeto_mem(ADDRESS, REG_OSR, bytes([osr_value])), logs)
+        perform_action(EV_SET_OSR, lambda: i2c.writeto_mem(ADDRESS, REG_OSR, bytes([osr_value])))
         i2c.writeto_mem(ADDRESS, REG_ODR, b'\x03')
         i2c.writeto_mem(ADDRESS, REG_IIR, b'\x08')
 
-        perform_action("Set to normal mode", lambda: i2c.writeto_mem(ADDRESS, REG_PWR_CTRL, bytes([pwr_ctrl])), logs)
+        perform_action(EV_SET_MODE, lambda: i2c.writeto_mem(ADDRESS, REG_PWR_CTRL, bytes([pwr_ctrl])))
         # time.sleep_ms(50)
 
         for i in range(10):
             # 측정 대기
-            success = wait_for_measurement(i2c, ADDRESS, logs)
+            success = wait_for_measurement(i2c, ADDRESS)
             if not success:
                 continue
             read_data()
+            log.service()  # 찬 로그 버퍼는 측정 사이에 기록
             time.sleep_ms(500)  # beyond 50ms
     else:   # 'low power mode' 측정 시작
-        logs.append("Set to low power mode")
-        perform_action("Set OSR", lambda: i2c.writeto_mem(ADDRESS, REG_OSR, bytes([osr_value])), logs)
+        perform_action(EV_SET_OSR, lambda: i2c.writeto_mem(ADDRESS, REG_OSR, bytes([osr_value])))
         # time.sleep_ms(20)
         for i in range(10):
-            perform_action("Start measurement", lambda: i2c.writeto_mem(ADDRESS, REG_PWR_CTRL, bytes([pwr_ctrl])), logs)
+            perform_action(EV_START_MEASUREMENT, lambda: i2c.writeto_mem(ADDRESS, REG_PWR_CTRL, bytes([pwr_ctrl])))
             # 측정 대기
-            success = wait_for_measurement(i2c, ADDRESS, logs)
+            success = wait_for_measurement(i2c, ADDRESS)
             if not success:
                 continue
             read_data()
+            log.service()  # 찬 로그 버퍼는 측정 사이에 기록
             time.sleep_ms(500)  # Wait for next measurement after 100 ms
 
-# 로그 파일 작성
+# 로그 파일 마무리
 try:
-    with open("log.txt", "w") as f:
-        for log in logs:
-            f.write(log + "\n")
-    print("Log file written: log.txt")
+    log.close()
+    print(f"Log file written: log.bin ({log.records} records)")
 except Exception as e:
     print(f"Failed to write log file : {e}")
\ No newline at end of file
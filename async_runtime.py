@@ -0,0 +1,142 @@
+"""
+asyncio 기반 측정 런타임
+센서마다 별도 태스크가 준비 상태를 확인하며 기다리고(sleep_ms로 전체 루프를 멈추지 않음),
+읽은 샘플을 공유 큐에 넣는다. 한 센서가 느려도 다른 센서의 측정은 지연되지 않는다.
+MicroPython(uasyncio)과 CPython(asyncio) 모두에서 동작한다.
+
+센서는 is_data_ready()와 read(wait=False)를 제공해야 한다 (BMP280, BMP388, DPS310).
+
+사용 예:
+    runtime = AsyncRuntime()
+    runtime.add("BMP388", mgr.bmp388, 50)
+    runtime.add("DPS310", mgr.dps310, 130)
+
+    async def main():
+        runtime.start()
+        while True:
+            name, ts, p, t = await runtime.queue.get()
+
+    asyncio.run(main())
+"""
+import time
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+
+try:
+    from collections import deque
+except ImportError:
+    from ucollections import deque
+
+try:
+    from time import ticks_ms, ticks_diff
+except ImportError:  # CPython
+    def ticks_ms():
+        return int(time.monotonic() * 1000)
+
+    def ticks_diff(a, b):
+        return a - b
+
+if hasattr(asyncio, "sleep_ms"):
+    _sleep_ms = asyncio.sleep_ms
+else:
+    def _sleep_ms(ms):
+        return asyncio.sleep(ms / 1000)
+
+
+async def read_async(sensor, poll_ms=5, timeout_ms=1000):
+    """준비될 때까지 다른 태스크에 양보하며 기다린 뒤 기압과 온도 읽기
+    :param poll_ms: 준비 상태 확인 간격
+    :param timeout_ms: 최대 대기 시간
+    :return: (기압 hPa, 온도 °C)
+    """
+    waited = 0
+    while not sensor.is_data_ready():
+        if waited >= timeout_ms:
+            raise RuntimeError("Sensor measurement timed out.")
+        await _sleep_ms(poll_ms)
+        waited += poll_ms
+    return sensor.read(wait=False)
+
+
+class SampleQueue:
+    """태스크 사이 공유 샘플 큐
+
+    uasyncio에는 Queue가 없으므로 deque와 Event로 구현한다.
+    가득 차면 가장 오래된 샘플을 버리고 dropped를 증가시킨다 (생산자는 기다리지 않음).
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._items = deque((), maxsize)
+        self._count = 0
+        self._event = asyncio.Event()
+
+    def put_nowait(self, item):
+        """샘플 추가"""
+        if self._count == self.maxsize:
+            self._items.popleft()
+            self._count -= 1
+            self.dropped += 1
+        self._items.append(item)
+        self._count += 1
+        self._event.set()
+
+    async def get(self):
+        """가장 오래된 샘플 꺼내기 (비어 있으면 기다림)"""
+        while not self._count:
+            self._event.clear()
+            await self._event.wait()
+        self._count -= 1
+        return self._items.popleft()
+
+    def qsize(self):
+        """큐에 쌓인 샘플 수"""
+        return self._count
+
+
+class AsyncRuntime:
+    """센서별 측정 태스크와 공유 큐"""
+
+    def __init__(self, queue_size=64):
+        """
+        :param queue_size: 공유 큐 크기 (샘플 수)
+        """
+        self.queue = SampleQueue(queue_size)
+        self.errors = 0  # 시간 초과 등으로 실패한 측정 수
+        self._sensors = []
+        self._tasks = []
+
+    def add(self, name, sensor, period_ms, poll_ms=5):
+        """측정할 센서 등록
+        :param name: 샘플에 붙는 센서 이름
+        :param period_ms: 측정 주기 (ms)
+        :param poll_ms: 준비 상태 확인 간격 (ms)
+        """
+        self._sensors.append((name, sensor, period_ms, poll_ms))
+
+    def start(self):
+        """센서마다 측정 태스크 시작 (이벤트 루프 안에서 호출)"""
+        for entry in self._sensors:
+            self._tasks.append(asyncio.create_task(self._acquire(*entry)))
+
+    def stop(self):
+        """측정 태스크 모두 취소"""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+    async def _acquire(self, name, sensor, period_ms, poll_ms):
+        """센서 하나의 측정 루프: 준비 대기 -> 읽기 -> 큐에 넣기 -> 다음 주기까지 대기"""
+        while True:
+            start = ticks_ms()
+            try:
+                pressure, temperature = await read_async(sensor, poll_ms)
+            except (OSError, RuntimeError):
+                self.errors += 1
+            else:
+                self.queue.put_nowait((name, ticks_ms(), pressure, temperature))
+            await _sleep_ms(max(0, period_ms - ticks_diff(ticks_ms(), start)))
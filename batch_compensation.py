@@ -0,0 +1,142 @@
+"""
+배치 보정
+기록해 둔 원시 ADC 값 배열을 보정 계수 묶음(coefficients)으로 한 번에 보정
+- 호스트(CPython): NumPy가 있으면 배열 연산으로 벡터화, 결과는 NumPy 배열
+- 디바이스(MicroPython): array.array 입력을 반복 처리, 결과는 array('d')
+각 커널은 드라이버의 스칼라 보정 경로와 같은 연산을 같은 순서로 수행하므로 결과가 비트 단위로 같다.
+
+사용 예:
+    press, temp = compensate_bmp388(sensor.coefficients, raw_press, raw_temp)
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _bmp280_kernel(c, adc_p, adc_t):
+    """bmp280.BMP280 정수 보정 (compensate_temperature/compensate_pressure)"""
+    var1 = (((adc_t >> 3) - (c.dig_T1 << 1)) * c.dig_T2) >> 11
+    var2 = (((((adc_t >> 4) - c.dig_T1) * ((adc_t >> 4) - c.dig_T1)) >> 12) * c.dig_T3) >> 14
+    t_fine = var1 + var2
+    temperature = ((t_fine * 5 + 128) >> 8) / 100.0
+
+    var1 = t_fine - 128000
+    var2 = var1 * var1 * c.dig_P6
+    var2 = var2 + ((var1 * c.dig_P5) << 17)
+    var2 = var2 + (c.dig_P4 << 35)
+    var1 = ((var1 * var1 * c.dig_P3) >> 8) + ((var1 * c.dig_P2) << 12)
+    var1 = ((1 << 47) + var1) * c.dig_P1 >> 33
+    valid = var1 != 0  # 0으로 나누기 방지 (스칼라 경로는 0 반환)
+
+    p = 1048576 - adc_p
+    p = (((p << 31) - var2) * 3125) // (var1 + (var1 == 0))
+    var1 = (c.dig_P9 * (p >> 13) * (p >> 13)) >> 25
+    var2 = (c.dig_P8 * p) >> 19
+    p = ((p + var1 + var2) >> 8) + (c.dig_P7 << 4)
+    return (p / 256.0) * valid / 100.0, temperature
+
+
+def _bmp280_float_kernel(c, adc_p, adc_t):
+    """lib/bmp280 BMP280 부동소수점 보정 (_calculate_temperature/_calculate_pressure)"""
+    var1 = (adc_t / 16384 - c.dig_T1 / 1024) * c.dig_T2
+    var2 = ((adc_t / 131072 - c.dig_T1 / 8192) * (adc_t / 131072 - c.dig_T1 / 8192)) * c.dig_T3
+    t_fine = var1 + var2
+    temperature = (var1 + var2) / 5120
+
+    var1 = (t_fine / 2) - 64000
+    var2 = var1 * var1 * c.dig_P6 / 32768
+    var2 = var2 + var1 * c.dig_P5 * 2
+    var2 = (var2 / 4) + (c.dig_P4 * 65536)
+    var1 = (c.dig_P3 * var1 * var1 / 524288 + c.dig_P2 * var1) / 524288
+    var1 = (1 + var1 / 32768) * c.dig_P1
+    valid = var1 != 0
+
+    p = 1048576 - adc_p
+    p = (p - (var2 / 4096)) * 6250 / (var1 + (var1 == 0))
+    var1 = c.dig_P9 * p * p / 2147483648
+    var2 = p * c.dig_P8 / 32768
+    p = p + (var1 + var2 + c.dig_P7) / 16
+    return p / 100 * valid, temperature
+
+
+def _bmp388_kernel(c, raw_press, raw_temp):
+    """bmp388.BMP388 부동소수점 보정 (compensate_temperature/compensate_pressure)"""
+    partial_data1 = raw_temp - c.par_t1
+    partial_data2 = partial_data1 * c.par_t2
+    t_lin = partial_data2 + (partial_data1 * partial_data1) * c.par_t3
+
+    offset = c.par_p5 + t_lin * (c.par_p6 + t_lin * (c.par_p7 + t_lin * c.par_p8))
+    sensitivity = c.par_p1 + t_lin * (c.par_p2 + t_lin * (c.par_p3 + t_lin * c.par_p4))
+    quadratic = c.par_p9 + t_lin * c.par_p10
+    pressure = offset + raw_press * (sensitivity + raw_press * (quadratic + raw_press * c.par_p11))
+    return pressure / 100.0, t_lin
+
+
+def _dps310_kernel(c, raw_pressure, raw_temp, press_scale, temp_scale):
+    """dps310.DPS310 보정 (read)"""
+    scaled_temp = raw_temp / temp_scale
+    scaled_pressure = raw_pressure / press_scale
+    pressure = (
+            c.c00 +
+            scaled_pressure * (c.c10 + scaled_pressure * (c.c20 + scaled_pressure * c.c30)) +
+            scaled_temp * (c.c01 + scaled_pressure * (c.c11 + scaled_pressure * c.c21))
+    )
+    return pressure / 100.0, c.c0 * 0.5 + c.c1 * scaled_temp
+
+
+def _run(kernel, coefficients, raw_press, raw_temp, integer, *args):
+    """NumPy가 있으면 배열 전체에 한 번에, 없으면 샘플마다 커널 적용"""
+    if len(raw_press) != len(raw_temp):
+        raise ValueError("raw_press와 raw_temp의 길이가 같아야 합니다.")
+    if np is not None:
+        dtype = np.int64 if integer else np.float64
+        pressure, temperature = kernel(coefficients, np.asarray(raw_press, dtype=dtype),
+                                       np.asarray(raw_temp, dtype=dtype), *args)
+        return np.asarray(pressure, dtype=np.float64), np.asarray(temperature, dtype=np.float64)
+
+    count = len(raw_press)
+    pressure = array('d', bytes(8 * count))
+    temperature = array('d', bytes(8 * count))
+    convert = int if integer else float
+    for i in range(count):
+        pressure[i], temperature[i] = kernel(coefficients, convert(raw_press[i]), convert(raw_temp[i]), *args)
+    return pressure, temperature
+
+
+def compensate_bmp280(coefficients, raw_press, raw_temp):
+    """BMP280 배치 보정 (bmp280.BMP280과 같은 정수 알고리즘)
+    :param coefficients: bmp280.BMP280Coefficients
+    :return: (기압 hPa 배열, 온도 °C 배열)
+    """
+    return _run(_bmp280_kernel, coefficients, raw_press, raw_temp, True)
+
+
+def compensate_bmp280_float(coefficients, raw_press, raw_temp):
+    """BMP280 배치 보정 (lib/bmp280과 같은 부동소수점 알고리즘)
+    :param coefficients: lib.bmp280.BMP280Coefficients
+    :return: (기압 hPa 배열, 온도 °C 배열)
+    """
+    return _run(_bmp280_float_kernel, coefficients, raw_press, raw_temp, False)
+
+
+def compensate_bmp388(coefficients, raw_press, raw_temp):
+    """BMP388 배치 보정
+    :param coefficients: bmp388.BMP388Coefficients
+    :return: (기압 hPa 배열, 온도 °C 배열)
+    """
+    return _run(_bmp388_kernel, coefficients, raw_press, raw_temp, False)
+
+
+def compensate_dps310(coefficients, raw_press, raw_temp, press_scale, temp_scale):
+    """DPS310 배치 보정
+    :param coefficients: DPS310Coefficients (lib/dps310/coefficients.py)
+    :param raw_press: 부호 있는 24비트 원시 압력 값
+    :param raw_temp: 부호 있는 24비트 원시 온도 값
+    :param press_scale: 압력 오버샘플링 스케일 (DPS310.press_scale)
+    :param temp_scale: 온도 오버샘플링 스케일 (DPS310.temp_scale)
+    :return: (기압 hPa 배열, 온도 °C 배열)
+    """
+    return _run(_dps310_kernel, coefficients, raw_press, raw_temp, False, press_scale, temp_scale)
@@ -0,0 +1,50 @@
+"""
+BMP388 정수/실수 보정 경로 샘플당 시간 비교
+    python benchmarks/bench_bmp388_integer.py        (CPython)
+    micropython benchmarks/bench_bmp388_integer.py   (MicroPython unix 포트, 저장소 루트에서)
+"""
+import sys
+
+sys.path.insert(0, (__file__.rsplit("/", 1)[0] if "/" in __file__ else ".") + "/../tests")  # host, fakes
+import host  # noqa: E402
+
+host.install()
+
+import time  # noqa: E402
+
+from bmp388 import BMP388  # noqa: E402
+from fakes import FakeI2C  # noqa: E402
+
+N = 20000
+CALIBRATION = bytes((0xA2, 0x6B, 0x18, 0x4B, 0xF6, 0x98, 0xF2, 0x25, 0xF6, 0x23, 0x00,
+                     0x80, 0x62, 0x30, 0x76, 0x03, 0xFA, 0x85, 0x37, 0x05, 0xC4))
+
+
+def per_sample_us(func, *args):
+    start = time.ticks_us()
+    for _ in range(N):
+        func(*args)
+    return time.ticks_diff(time.ticks_us(), start) / N
+
+
+def main():
+    i2c = FakeI2C()
+    i2c.set(0x77, 0x00, 0x50)
+    i2c.set(0x77, 0x31, CALIBRATION)
+    sensor = BMP388(i2c, integer=True)
+    raw_press, raw_temp = 6000000, 8000000
+    t_int = sensor.compensate_temperature_int(raw_temp)
+    t_float = sensor.compensate_temperature(raw_temp)
+
+    rows = (
+        ("temperature int", per_sample_us(sensor.compensate_temperature_int, raw_temp)),
+        ("temperature float", per_sample_us(sensor.compensate_temperature, raw_temp)),
+        ("pressure int", per_sample_us(sensor.compensate_pressure_int, raw_press, t_int)),
+        ("pressure float", per_sample_us(sensor.compensate_pressure, raw_press, t_float)),
+    )
+    print("%s, %d samples" % (sys.implementation.name, N))
+    for name, us in rows:
+        print("%-18s %8.2f us/sample" % (name, us))
+
+
+main()
@@ -0,0 +1,73 @@
+"""
+bmpxxx 지연 import 비용 비교: 파사드 + BMP390만 vs 칩 모듈 다섯 개 모두 (분할 전 단일 모듈과 같은 양)
+    python benchmarks/bench_bmpxxx_import.py               (CPython, 경우마다 새 인터프리터에서 잼)
+    micropython benchmarks/bench_bmpxxx_import.py lazy     (MicroPython unix 포트, 저장소 루트에서
+    micropython benchmarks/bench_bmpxxx_import.py eager     경우마다 따로 실행)
+RAM은 CPython에서 tracemalloc, MicroPython에서 gc.mem_alloc() 증가량이다.
+"""
+import sys
+
+sys.path.insert(0, (__file__.rsplit("/", 1)[0] if "/" in __file__ else ".") + "/../tests")  # host
+import host  # noqa: E402
+
+host.install()  # 장치와 같이 저장소 루트('')가 먼저, 패키지는 lib.bmp388로 불러온다
+
+import gc  # noqa: E402
+import time  # noqa: E402
+
+CHIPS = ("bmp581", "bmp585", "bmp390", "bmp280", "bme280")
+
+
+def lazy():
+    from lib.bmp388 import bmpxxx
+    return bmpxxx.BMP390
+
+
+def eager():
+    for chip in CHIPS:
+        __import__("lib.bmp388." + chip)
+
+
+def measure(case):
+    """현재 인터프리터에서 한 경우 import, (마이크로초, 바이트, 불러온 칩 모듈)"""
+    gc.collect()
+    try:
+        import tracemalloc
+    except ImportError:
+        tracemalloc = None
+    if tracemalloc is None:
+        before = gc.mem_alloc()
+    else:
+        tracemalloc.start()
+    start = time.ticks_us()
+    case()
+    us = time.ticks_diff(time.ticks_us(), start)
+    if tracemalloc is None:
+        gc.collect()
+        used = gc.mem_alloc() - before
+    else:
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    loaded = [chip for chip in CHIPS if "lib.bmp388." + chip in sys.modules]
+    return us, used, loaded
+
+
+def report(name, us, used, loaded):
+    print("%-6s %9d %10d  %s" % (name, us, used, " ".join(loaded)))
+
+
+def main():
+    cases = {"lazy": lazy, "eager": eager}
+    print("%s, import cost" % sys.implementation.name)
+    print("%-6s %9s %10s  %s" % ("case", "us", "bytes", "chip modules loaded"))
+    if len(sys.argv) > 1:
+        name = sys.argv[1]
+        report(name, *measure(cases[name]))
+        return
+    import subprocess  # CPython: 모듈 캐시가 섞이지 않도록 경우마다 새 프로세스
+    for name in cases:
+        out = subprocess.run((sys.executable, __file__, name), capture_output=True, text=True, check=True).stdout
+        print(out.splitlines()[-1])
+
+
+main()
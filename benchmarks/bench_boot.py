@@ -0,0 +1,90 @@
+"""
+센서 초기화 비용 비교: 캐시 없음 vs 보정 계수 캐시 콜드(첫 부팅) vs 웜(다음 부팅)
+    python benchmarks/bench_boot.py        (CPython)
+    micropython benchmarks/bench_boot.py   (MicroPython unix 포트, 저장소 루트에서)
+가짜 버스 위에서 BMP280, BMP388, DPS310을 차례로 만들고
+요청한 고정 대기(sleep_ms 합), 버스 트랜잭션 수, 실제 경과 시간을 잰다.
+가짜 버스는 리셋 직후부터 준비 상태이므로 폴링 대기는 한 번에 끝난다 (실제 칩은 수 ms).
+"""
+import sys
+
+sys.path.insert(0, (__file__.rsplit("/", 1)[0] if "/" in __file__ else ".") + "/../tests")  # host, fakes
+import host  # noqa: E402
+
+host.install()
+
+import os  # noqa: E402
+import time  # noqa: E402
+
+from bmp280 import BMP280  # noqa: E402
+from bmp388 import BMP388  # noqa: E402
+from calib_cache import CalibrationCache  # noqa: E402
+from dps310 import DPS310  # noqa: E402
+from fakes import BMP280_CALIBRATION, BMP388_CALIBRATION, FakeI2C  # noqa: E402
+
+CACHE_PATH = "bench_boot_calib.bin"
+
+_sleep_ms = time.sleep_ms
+requested_ms = [0]
+
+
+def counting_sleep_ms(ms):
+    requested_ms[0] += ms
+    _sleep_ms(ms)
+
+
+def buses():
+    """센서마다 리셋 직후 준비 상태인 가짜 버스"""
+    bmp280 = FakeI2C()
+    bmp280.set(0x76, 0xD0, 0x58)
+    bmp280.set(0x76, 0x88, BMP280_CALIBRATION)
+    bmp388 = FakeI2C()
+    bmp388.set(0x77, 0x00, 0x50)
+    bmp388.set(0x77, 0x03, 0x10)  # 명령 준비
+    bmp388.set(0x77, 0x31, BMP388_CALIBRATION)
+    dps310 = FakeI2C()
+    dps310.set(0x77, 0x0D, 0x10)
+    dps310.set(0x77, 0x08, 0xC0)  # 계수/센서 준비
+    return ((BMP280, bmp280), (BMP388, bmp388), (DPS310, dps310))
+
+
+def boot(cache):
+    """세 센서 초기화, (요청 대기 ms, 트랜잭션 수, 경과 ms)"""
+    requested_ms[0] = 0
+    transactions = 0
+    start = time.ticks_us()
+    for bus, (driver, i2c) in enumerate(buses()):
+        driver(i2c, cache=cache, bus=bus)
+        transactions += i2c.transactions
+    return requested_ms[0], transactions, time.ticks_diff(time.ticks_us(), start) / 1000
+
+
+def main():
+    try:
+        time.sleep_ms = counting_sleep_ms
+        counted = True
+    except AttributeError:  # MicroPython 내장 모듈은 속성을 바꿀 수 없음
+        counted = False
+    try:
+        os.remove(CACHE_PATH)
+    except OSError:
+        pass
+
+    rows = [("no cache", boot(None))]
+    cold = CalibrationCache(CACHE_PATH)
+    rows.append(("cold cache", boot(cold)))
+    warm = CalibrationCache(CACHE_PATH)  # 다음 부팅: 파일에서 다시 읽음
+    rows.append(("warm cache", boot(warm)))
+    assert warm.hits == 3 and warm.misses == 0
+    os.remove(CACHE_PATH)
+    if counted:
+        time.sleep_ms = _sleep_ms
+
+    print("%s, BMP280 + BMP388 + DPS310" % sys.implementation.name)
+    print("%-11s %12s %13s %9s" % ("case", "sleep_ms sum", "transactions", "wall ms"))
+    for name, (slept, transactions, wall) in rows:
+        slept = "%d" % slept if counted else "n/a"
+        print("%-11s %12s %13d %9.1f" % (name, slept, transactions, wall))
+
+
+main()
@@ -0,0 +1,126 @@
+"""
+기압 보정식 샘플당 시간 비교: 예전 식(샘플마다 온도 항 전부 계산, ** 거듭제곱) vs 호너식 + 온도 항 캐시
+    python benchmarks/bench_compensation.py        (CPython)
+    micropython benchmarks/bench_compensation.py   (MicroPython unix 포트, 저장소 루트에서)
+BMP388(최상위 bmp388.py)과 BMP390(lib/bmp388/bmp390.py) 두 드라이버를 같은 보정 계수로 잰다.
+연속 측정에서는 온도가 거의 바뀌지 않으므로 같은 온도("캐시 적중")와 매번 다른 온도("캐시 실패")를 따로 잰다.
+"""
+import sys
+
+sys.path.insert(0, (__file__.rsplit("/", 1)[0] if "/" in __file__ else ".") + "/../tests")  # host, fakes
+import host  # noqa: E402
+
+host.install()
+
+import time  # noqa: E402
+
+from bmp388 import BMP388  # noqa: E402
+from fakes import FakeI2C  # noqa: E402
+
+N = 20000
+CALIBRATION = bytes((0xA2, 0x6B, 0x18, 0x4B, 0xF6, 0x98, 0xF2, 0x25, 0xF6, 0x23, 0x00,
+                     0x80, 0x62, 0x30, 0x76, 0x03, 0xFA, 0x85, 0x37, 0x05, 0xC4))
+RAW_PRESS, RAW_TEMP = 6000000, 8000000
+
+
+def bmp388_reference(s, raw_press, t_lin):
+    """호너식 이전 bmp388.py compensate_pressure"""
+    partial_data1 = s.par_p6 * t_lin
+    partial_data2 = s.par_p7 * (t_lin ** 2)
+    partial_data3 = s.par_p8 * (t_lin ** 3)
+    partial_out1 = s.par_p5 + partial_data1 + partial_data2 + partial_data3
+    partial_data1 = s.par_p2 * t_lin
+    partial_data2 = s.par_p3 * (t_lin ** 2)
+    partial_data3 = s.par_p4 * (t_lin ** 3)
+    partial_out2 = float(raw_press) * (s.par_p1 + partial_data1 + partial_data2 + partial_data3)
+    partial_data1 = float(raw_press) * float(raw_press)
+    partial_data2 = s.par_p9 + s.par_p10 * t_lin
+    partial_data3 = partial_data1 * partial_data2
+    partial_data4 = partial_data3 + (float(raw_press) ** 3) * s.par_p11
+    return partial_out1 + partial_out2 + partial_data4
+
+
+def bmp390_reference(s, raw_pressure, tempc):
+    """계수 선계산 이전 lib/bmp388/bmp390.py _calculate_pressure_compensation"""
+    p1 = (s.p1 - 2 ** 14) / 2 ** 20
+    p2 = (s.p2 - 2 ** 14) / 2 ** 29
+    p3 = s.p3 / 2 ** 32
+    p4 = s.p4 / 2 ** 37
+    p5 = s.p5 * 2 ** 3
+    p6 = s.p6 / 2 ** 6
+    p7 = s.p7 / 2 ** 8
+    p8 = s.p8 / 2 ** 15
+    p9 = s.p9 / 2 ** 48
+    p10 = s.p10 / 2 ** 48
+    p11 = s.p11 / 2 ** 65
+    pd1 = p6 * tempc
+    pd2 = p7 * (tempc ** 2)
+    pd3 = p8 * (tempc ** 3)
+    po1 = p5 + pd1 + pd2 + pd3
+    pd1 = p2 * tempc
+    pd2 = p3 * (tempc ** 2)
+    pd3 = p4 * (tempc ** 3)
+    po2 = raw_pressure * (p1 + pd1 + pd2 + pd3)
+    pd1 = raw_pressure ** 2
+    pd2 = p9 + p10 * tempc
+    pd3 = pd1 * pd2
+    pd4 = pd3 + (raw_pressure ** 3) * p11
+    return po1 + po2 + pd4
+
+
+def make_bmp390():
+    """lib/bmp388 패키지의 BMP390"""
+    from lib.bmp388 import bmp390
+
+    host.class_consts(bmp390)
+    i2c = FakeI2C()
+    i2c.set(0x7F, 0x00, 0x60)
+    i2c.set(0x7F, 0x31, CALIBRATION)
+    return bmp390.BMP390(i2c)
+
+
+def per_sample_us(func, temps):
+    """temps를 돌아가며 func(raw_press, t) 호출, 샘플당 마이크로초"""
+    count = len(temps)
+    start = time.ticks_us()
+    for i in range(N):
+        func(RAW_PRESS, temps[i % count])
+    return time.ticks_diff(time.ticks_us(), start) / N
+
+
+def compare(name, old, new, t):
+    hit = [t]
+    miss = [t + i * 0.001 for i in range(64)]
+    for temps in (hit, miss):  # 두 식이 같은 값을 내는지 먼저 확인
+        for x in temps:
+            a, b = old(RAW_PRESS, x), new(RAW_PRESS, x)
+            assert abs(a - b) <= abs(a) * 1e-12, (name, a, b)
+    rows = []
+    for label, temps in (("cache hit", hit), ("cache miss", miss)):
+        before = per_sample_us(old, temps)
+        after = per_sample_us(new, temps)
+        rows.append((name, label, before, after))
+    return rows
+
+
+def main():
+    i2c = FakeI2C()
+    i2c.set(0x77, 0x00, 0x50)
+    i2c.set(0x77, 0x31, CALIBRATION)
+    bmp388 = BMP388(i2c)
+    bmp390 = make_bmp390()
+
+    # 호출 비용을 맞추려고 양쪽 모두 람다 한 겹을 거친다
+    rows = compare("BMP388", lambda p, t: bmp388_reference(bmp388, p, t),
+                   lambda p, t: bmp388.compensate_pressure(p, t), bmp388.compensate_temperature(RAW_TEMP))
+    rows += compare("BMP390", lambda p, t: bmp390_reference(bmp390, p, t),
+                    lambda p, t: bmp390._calculate_pressure_compensation(p, t),
+                    bmp390._calculate_temperature_compensation(RAW_TEMP))
+
+    print("%s, %d samples, us/sample" % (sys.implementation.name, N))
+    print("%-7s %-10s %9s %9s %8s" % ("sensor", "case", "old", "horner", "speedup"))
+    for name, label, before, after in rows:
+        print("%-7s %-10s %9.2f %9.2f %7.1fx" % (name, label, before, after, before / after))
+
+
+main()
@@ -0,0 +1,52 @@
+"""
+delta_codec 압축률과 인코드/디코드 속도 측정
+    python benchmarks/bench_delta_codec.py            (합성 캡처 사용)
+    python benchmarks/bench_delta_codec.py log.bin    (장치에서 받은 binlog 캡처 사용)
+캡처를 주지 않으면 원시 압력/온도가 무작위 걸음(random walk)으로 변하는 측정 레코드를
+binlog 형식으로 만들어 같은 경로(delta_codec._benchmark)로 잰다.
+"""
+import sys
+
+sys.path.insert(0, (__file__.rsplit("/", 1)[0] if "/" in __file__ else ".") + "/../tests")  # host
+import host  # noqa: E402
+
+host.install()
+
+import os  # noqa: E402
+import random  # noqa: E402
+
+import binlog  # noqa: E402
+import delta_codec  # noqa: E402
+
+SAMPLES = 20000
+CAPTURE_PATH = "bench_delta_codec.bin"
+
+
+def synthetic_capture(path, samples=SAMPLES, seed=1):
+    """BMP388 25Hz 연속 측정과 비슷한 원시 값 캡처 만들기
+    압력: 6,000,000 근처에서 샘플마다 ±8 카운트 걸음 + ±3 카운트 잡음
+    온도: 8,000,000 근처에서 천천히 변함 (샘플마다 -1~+1 카운트)
+    """
+    random.seed(seed)
+    press = 6000000
+    temp = 8000000
+    with binlog.BinaryLog(path) as log:
+        for _ in range(samples):
+            press += random.randint(-8, 8)
+            temp += random.randint(-1, 1)
+            log.log(binlog.EV_MEASUREMENT, raw_press=press + random.randint(-3, 3), raw_temp=temp)
+
+
+def main():
+    if len(sys.argv) > 1:
+        delta_codec._benchmark(sys.argv[1])
+        return
+    synthetic_capture(CAPTURE_PATH)
+    try:
+        print("synthetic random-walk capture, %d samples" % SAMPLES)
+        delta_codec._benchmark(CAPTURE_PATH)
+    finally:
+        os.remove(CAPTURE_PATH)
+
+
+main()
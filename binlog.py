@@ -0,0 +1,180 @@
+"""
+바이너리 로그
+측정 동작마다 문자열을 만들어 리스트에 쌓는 대신 고정 크기 레코드를 struct로 패킹해
+이중 버퍼(bytearray 2개)에 기록하고, 버퍼가 차면 블록 단위로 플래시에 쓴다.
+RAM 사용량은 버퍼 2개로 고정되고, 루프 안에서 실수를 문자열로 바꾸지 않는다.
+호스트(CPython)에서는 같은 모듈로 로그를 CSV로 변환한다:
+    python binlog.py log.bin log.csv
+
+파일 형식 (리틀 엔디언):
+    헤더: b"BLOG" | 버전 u8 | 레코드 크기 u8 | 예약 u16
+    레코드: ticks_ms u32 | 센서 ID u8 | 이벤트 u8 | 상태 u8 | 예약 u8 |
+            소요 시간 us u32 | 원시 압력 i32 | 원시 온도 i32
+"""
+try:
+    import struct
+except ImportError:
+    import ustruct as struct
+
+import time
+
+_MAGIC = b"BLOG"
+_VERSION = 1
+_HEADER = "<4sBBH"
+RECORD = "<IBBBBIii"
+RECORD_SIZE = struct.calcsize(RECORD)  # 20바이트
+
+# 이벤트 코드
+EV_CHECK_CHIP_ID = 1
+EV_SOFT_RESET = 2
+EV_READ_CALIBRATION = 3
+EV_SET_OSR = 4
+EV_SET_MODE = 5
+EV_START_MEASUREMENT = 6
+EV_WAIT_MEASUREMENT = 7
+EV_READ_RAW = 8
+EV_COMPENSATE_TEMPERATURE = 9
+EV_COMPENSATE_PRESSURE = 10
+EV_MEASUREMENT = 11
+
+EVENT_NAMES = {
+    EV_CHECK_CHIP_ID: "Check CHIP_ID",
+    EV_SOFT_RESET: "Soft reset",
+    EV_READ_CALIBRATION: "Read calibration",
+    EV_SET_OSR: "Set OSR",
+    EV_SET_MODE: "Set mode",
+    EV_START_MEASUREMENT: "Start measurement",
+    EV_WAIT_MEASUREMENT: "Wait for measurement",
+    EV_READ_RAW: "Read raw data",
+    EV_COMPENSATE_TEMPERATURE: "Compensate temperature",
+    EV_COMPENSATE_PRESSURE: "Compensate pressure",
+    EV_MEASUREMENT: "Measurement",
+}
+
+# 상태 코드
+STATUS_OK = 0
+STATUS_FAILED = 1
+STATUS_TIMEOUT = 2
+
+STATUS_NAMES = ("ok", "failed", "timeout")
+
+
+class BinaryLog:
+    """이중 버퍼 바이너리 로그 기록기
+
+    log()는 현재 버퍼에 레코드를 패킹만 한다. 버퍼가 차면 다른 버퍼로 바꾸고,
+    찬 버퍼는 service() 또는 다음 버퍼 전환 때 파일에 쓴다.
+    """
+
+    def __init__(self, path="log.bin", block_size=4096):
+        """
+        :param path: 로그 파일 경로
+        :param block_size: 한 번에 쓰는 최대 바이트 수 (플래시 블록 크기)
+        """
+        if block_size < RECORD_SIZE:
+            raise ValueError("block_size는 레코드 크기보다 커야 합니다.")
+        self.path = path
+        size = block_size // RECORD_SIZE * RECORD_SIZE
+        self._buffers = (bytearray(size), bytearray(size))
+        self._active = 0
+        self._pos = 0  # 현재 버퍼에 쓴 바이트 수
+        self._pending = None  # 파일에 쓰지 않은 찬 버퍼
+        self.records = 0
+        self.blocks = 0  # 파일에 쓴 블록 수
+        self._file = open(path, "wb")
+        self._file.write(struct.pack(_HEADER, _MAGIC, _VERSION, RECORD_SIZE, 0))
+
+    def log(self, event, status=STATUS_OK, elapsed_us=0, raw_press=0, raw_temp=0, sensor=0):
+        """레코드 하나 기록
+        :param event: 이벤트 코드 (EV_*)
+        :param status: 상태 코드 (STATUS_*)
+        :param elapsed_us: 단계 소요 시간 (us)
+        """
+        self._record(time.ticks_ms(), event, status, elapsed_us, raw_press, raw_temp, sensor)
+
+    def log_sample(self, sample, event=EV_MEASUREMENT, status=STATUS_OK, elapsed_us=0):
+        """sample_store.Sample 하나 기록 (시각은 샘플의 ts, 센서 ID는 sample.sensor)"""
+        self._record(sample.ts, event, status, elapsed_us, sample.raw_pressure, sample.raw_temp, sample.sensor)
+
+    def _record(self, ts, event, status, elapsed_us, raw_press, raw_temp, sensor):
+        buf = self._buffers[self._active]
+        struct.pack_into(RECORD, buf, self._pos, ts & 0xFFFFFFFF, sensor, event, status, 0,
+                         elapsed_us, raw_press, raw_temp)
+        self._pos += RECORD_SIZE
+        self.records += 1
+        if self._pos == len(buf):
+            self._swap()
+
+    def _swap(self):
+        """버퍼 전환 (이전 찬 버퍼가 아직 있으면 먼저 파일에 씀)"""
+        self.service()
+        self._pending = self._active
+        self._active ^= 1
+        self._pos = 0
+
+    def service(self):
+        """찬 버퍼가 있으면 파일에 쓰기 (측정 사이 여유 시간에 호출)"""
+        if self._pending is not None:
+            self._file.write(self._buffers[self._pending])
+            self._pending = None
+            self.blocks += 1
+
+    def flush(self):
+        """찬 버퍼와 현재 버퍼의 남은 레코드를 모두 파일에 쓰기"""
+        self.service()
+        if self._pos:
+            self._file.write(memoryview(self._buffers[self._active])[:self._pos])
+            self._pos = 0
+            self.blocks += 1
+        self._file.flush()
+
+    def close(self):
+        """남은 레코드를 쓰고 파일 닫기"""
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def decode(path):
+    """바이너리 로그 읽기
+    :return: (ticks_ms, 센서 ID, 이벤트, 상태, 소요 시간 us, 원시 압력, 원시 온도) 튜플 목록
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    header_size = struct.calcsize(_HEADER)
+    magic, version, record_size, _ = struct.unpack_from(_HEADER, data, 0)
+    if magic != _MAGIC or version != _VERSION or record_size != RECORD_SIZE:
+        raise ValueError("바이너리 로그 형식이 아닙니다.")
+
+    records = []
+    for pos in range(header_size, len(data) - RECORD_SIZE + 1, RECORD_SIZE):
+        ts, sensor, event, status, _, elapsed_us, raw_press, raw_temp = struct.unpack_from(RECORD, data, pos)
+        records.append((ts, sensor, event, status, elapsed_us, raw_press, raw_temp))
+    return records
+
+
+def to_csv(src, dst):
+    """바이너리 로그를 CSV로 변환
+    :return: 변환한 레코드 수
+    """
+    records = decode(src)
+    with open(dst, "w") as f:
+        f.write("ticks_ms,sensor,event,status,elapsed_us,raw_press,raw_temp\n")
+        for ts, sensor, event, status, elapsed_us, raw_press, raw_temp in records:
+            name = EVENT_NAMES.get(event, str(event))
+            state = STATUS_NAMES[status] if status < len(STATUS_NAMES) else str(status)
+            f.write(f"{ts},{sensor},{name},{state},{elapsed_us},{raw_press},{raw_temp}\n")
+    return len(records)
+
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) != 3:
+        print("사용법: python binlog.py log.bin log.csv")
+        sys.exit(1)
+    print(f"{to_csv(sys.argv[1], sys.argv[2])} records -> {sys.argv[2]}")
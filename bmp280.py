@@ -6,6 +6,13 @@ I2C 인터페이스를 통한 온도 및 기압 측정 지원
 import time
 from micropython import const
 
+try:
+    from collections import namedtuple
+except ImportError:
+    from ucollections import namedtuple
+
+from temperature_refresh import TemperatureRefresh
+
 # BMP280 레지스터 주소
 _BMP280_CHIP_ID = const(0xD0)
 _BMP280_RESET = const(0xE0)
@@ -49,29 +56,51 @@ _BMP280_IIR_FILTER_4 = const(0x02)
 _BMP280_IIR_FILTER_8 = const(0x03)
 _BMP280_IIR_FILTER_16 = const(0x04)
 
+# 보정 계수 묶음 (배치 보정 등 드라이버 밖에서 사용)
+BMP280Coefficients = namedtuple(
+    "BMP280Coefficients",
+    ("dig_T1", "dig_T2", "dig_T3", "dig_P1", "dig_P2", "dig_P3",
+     "dig_P4", "dig_P5", "dig_P6", "dig_P7", "dig_P8", "dig_P9")
+)
+
 
 class BMP280:
     """BMP280 디지털 압력 센서 드라이버"""
 
-    def __init__(self, i2c, addr=0x76):
+    def __init__(self, i2c, addr=0x76, cache=None, bus=0, start=True):
         """
         BMP280 센서 초기화
         :param i2c: I2C 인터페이스 객체
         :param addr: 센서의 I2C 주소 (기본값 0x76)
+        :param cache: calib_cache.CalibrationCache (주면 보정 계수를 캐시에서 읽고 리셋 대기를 폴링으로 대체)
+        :param bus: 캐시 키로 쓰는 I2C 버스 번호
+        :param start: False면 ID 확인만 하고 리셋/보정/모드 설정은 호출자가 단계별로 수행
         """
         self.i2c = i2c
         self.addr = addr
+        self.cache = cache
+        self.bus = bus
         self.t_fine = 0
+        self.temperature_refresh = TemperatureRefresh()  # 기본값: 매 샘플 온도 갱신
+
+        # 샘플마다 힙 할당이 생기지 않도록 고정 버퍼를 재사용
+        self._buf1 = bytearray(1)
+        self._buf2 = bytearray(2)
+        self._buf3 = bytearray(3)
+        self._buf6 = bytearray(6)
 
         # 센서 ID 확인
-        chip_id = self._read_byte(_BMP280_CHIP_ID)
+        self.chip_id = chip_id = self._read_byte(_BMP280_CHIP_ID)
         if chip_id != _BMP280_ID:
             raise RuntimeError("BMP280 센서를 찾을 수 없습니다. ID: %x" % chip_id)
 
+        if not start:
+            return  # 단계별 초기화 (bringup.staged_bringup)
+
         # 초기화 및 보정 데이터 읽기
-        self._reset()
+        self.reset()
 
-        self._read_coefficients()
+        self.load_calibration()
 
         # 기본 설정: 일반 모드, 16x 압력 오버샘플링, 2x 온도 오버샘플링, 0.5ms 대기 시간, 필터 끔
         # self._write_byte(_BMP280_CONFIG, (_BMP280_STANDBY_0_5 << 5) | (_BMP280_IIR_FILTER_OFF << 2))
@@ -79,16 +108,18 @@ class BMP280:
 
     def _read_byte(self, register):
         """레지스터에서 1바이트 읽기"""
-        result = self.i2c.readfrom_mem(self.addr, register, 1)
-        return result[0]
+        self.i2c.readfrom_mem_into(self.addr, register, self._buf1)
+        return self._buf1[0]
 
     def _write_byte(self, register, value):
         """레지스터에 1바이트 쓰기"""
-        self.i2c.writeto_mem(self.addr, register, bytes([value]))
+        self._buf1[0] = value
+        self.i2c.writeto_mem(self.addr, register, self._buf1)
 
     def _read_word(self, register):
         """레지스터에서 2바이트(16비트) 읽기 (리틀 엔디안)"""
-        data = self.i2c.readfrom_mem(self.addr, register, 2)
+        data = self._buf2
+        self.i2c.readfrom_mem_into(self.addr, register, data)
         return data[0] | (data[1] << 8)
 
     def _read_signed_word(self, register):
@@ -98,32 +129,72 @@ class BMP280:
             raw = raw - 0x10000
         return raw
 
-    def _reset(self):
-        """센서 리셋"""
+    def reset(self, wait=True):
+        """센서 리셋
+        :param wait: False면 리셋 명령만 보내고 바로 반환 (준비 대기는 wait_ready())
+        """
         self._write_byte(_BMP280_RESET, 0xB6)
-        time.sleep_ms(200)  # 리셋 후 대기
+        if not wait:
+            return
+        if self.cache is None:
+            time.sleep_ms(200)  # 리셋 후 대기
+        else:
+            time.sleep_ms(2)  # 시작 시간
+            self.wait_ready()
+
+    def is_ready(self):
+        """리셋 후 센서 준비 완료 여부"""
+        return not self._read_byte(_BMP280_STATUS) & 0x01  # NVM 복사 완료 (im_update)
+
+    def wait_ready(self, timeout_ms=200):
+        """준비 상태 폴링 (리셋 직후에는 I2C 응답이 없을 수 있음)"""
+        start = time.ticks_ms()
+        while time.ticks_diff(time.ticks_ms(), start) < timeout_ms:
+            try:
+                if self.is_ready():
+                    return
+            except OSError:
+                pass
+            time.sleep_ms(1)
+        raise RuntimeError("센서 준비 시간 초과")
+
+    def _cached_calibration(self, length):
+        """캐시에 저장된 보정 계수 바이트 (없으면 None)"""
+        if self.cache is None:
+            return None
+        return self.cache.get(self.bus, self.addr, self.chip_id, length)
+
+    def _store_calibration(self, data):
+        """NVM에서 읽은 보정 계수 바이트를 캐시에 저장"""
+        if self.cache is not None:
+            self.cache.put(self.bus, self.addr, self.chip_id, data)
+
+    def load_calibration(self):
+        """보정 계수 읽기 (리셋 후 준비가 끝난 다음 호출)"""
+        self._read_coefficients()
 
     def _read_coefficients(self):
-        """보정 계수 읽기"""
-        while True:
-            if self._read_signed_word(_BMP280_STATUS) == 0:
-                break
-            time.sleep_ms(5)
-        self.dig_T1 = self._read_word(_BMP280_DIG_T1)
-        self.dig_T2 = self._read_signed_word(_BMP280_DIG_T1 + 2)
-        self.dig_T3 = self._read_signed_word(_BMP280_DIG_T1 + 4)
-
-        self.dig_P1 = self._read_word(_BMP280_DIG_T1 + 6)
-        self.dig_P2 = self._read_signed_word(_BMP280_DIG_T1 + 8)
-        self.dig_P3 = self._read_signed_word(_BMP280_DIG_T1 + 10)
-        self.dig_P4 = self._read_signed_word(_BMP280_DIG_T1 + 12)
-        self.dig_P5 = self._read_signed_word(_BMP280_DIG_T1 + 14)
-        self.dig_P6 = self._read_signed_word(_BMP280_DIG_T1 + 16)
-        self.dig_P7 = self._read_signed_word(_BMP280_DIG_T1 + 18)
-        self.dig_P8 = self._read_signed_word(_BMP280_DIG_T1 + 20)
-        self.dig_P9 = self._read_signed_word(_BMP280_DIG_T1 + 22)
-
-    def set_low_power_mode(self):
+        """보정 계수 읽기 (24바이트, 캐시가 있으면 캐시 사용)"""
+        data = self._cached_calibration(24)
+        if data is None:
+            while True:
+                if self._read_signed_word(_BMP280_STATUS) == 0:
+                    break
+                time.sleep_ms(5)
+            data = self.i2c.readfrom_mem(self.addr, _BMP280_DIG_T1, 24)
+            self._store_calibration(data)
+
+        words = []
+        for i in range(0, 24, 2):
+            word = data[i] | (data[i + 1] << 8)
+            if i not in (0, 6) and word & 0x8000:  # dig_T1, dig_P1만 부호 없음
+                word -= 0x10000
+            words.append(word)
+        self.coefficients = BMP280Coefficients(*words)
+        (self.dig_T1, self.dig_T2, self.dig_T3, self.dig_P1, self.dig_P2, self.dig_P3,
+         self.dig_P4, self.dig_P5, self.dig_P6, self.dig_P7, self.dig_P8, self.dig_P9) = self.coefficients
+
+    def set_low_power_mode(self, settle=True):
         """저전력 모드 설정
         - 온도: 1x 오버샘플링
         - 압력: 1x 오버샘플링
@@ -133,9 +204,10 @@ class BMP280:
         self._write_byte(_BMP280_CONFIG, (_BMP280_STANDBY_1000 << 5) | (_BMP280_IIR_FILTER_OFF << 2))
         self._write_byte(_BMP280_CTRL_MEAS, (_BMP280_OS_1X << 5) | (_BMP280_OS_1X << 2) | _BMP280_POWER_NORMAL)
 
-        time.sleep_ms(20)
+        if settle:
+            time.sleep_ms(20)
 
-    def set_normal_mode(self):
+    def set_normal_mode(self, settle=True):
         """일반 모드 설정
         - 온도: 2x 오버샘플링
         - 압력: 16x 오버샘플링
@@ -145,7 +217,16 @@ class BMP280:
         self._write_byte(_BMP280_CONFIG, (_BMP280_STANDBY_0_5 << 5) | (_BMP280_IIR_FILTER_4 << 2))
         self._write_byte(_BMP280_CTRL_MEAS, (_BMP280_OS_16X << 5) | (_BMP280_OS_2X << 2) | _BMP280_POWER_NORMAL)
 
-        time.sleep_ms(20)
+        if settle:
+            time.sleep_ms(20)
+
+    def set_temperature_refresh(self, every=None, period_ms=None):
+        """기압 측정 시 온도(t_fine) 갱신 주기 설정
+        :param every: 온도를 갱신할 샘플 간격 (period_ms만 주면 사용 안 함)
+        :param period_ms: 온도를 갱신할 최대 시간 간격 (ms)
+        둘 다 생략하면 매 샘플 갱신
+        """
+        self.temperature_refresh = TemperatureRefresh(every, period_ms)
 
     def sleep(self):
         """슬립 모드로 전환"""
@@ -153,25 +234,49 @@ class BMP280:
         self._write_byte(_BMP280_CTRL_MEAS, (mode & 0xFC) | _BMP280_POWER_SLEEP)
 
     def force_measure(self):
-        """강제 측정 모드"""
+        """강제 측정 모드
+        BMP280에는 인터럽트 핀이 없으므로 상태 폴링 대신 오버샘플링 설정으로
+        계산한 최대 측정 시간만큼 한 번 대기한다
+        """
         mode = self._read_byte(_BMP280_CTRL_MEAS)
         self._write_byte(_BMP280_CTRL_MEAS, (mode & 0xFC) | _BMP280_POWER_FORCED)
-        while self.is_measuring():
-            time.sleep_ms(5)
+        time.sleep_us(self.measurement_time_us(mode))
+        while self.is_measuring():  # 정상이라면 반복하지 않음
+            time.sleep_ms(1)
+
+    @staticmethod
+    def measurement_time_us(ctrl_meas):
+        """CTRL_MEAS 값에 따른 최대 측정 시간 (데이터시트 부록 B, 마이크로초)"""
+        osrs_t = (ctrl_meas >> 5) & 0x07
+        osrs_p = (ctrl_meas >> 2) & 0x07
+        t_us = 1250
+        if osrs_t:
+            t_us += 2300 * (1 << (min(osrs_t, _BMP280_OS_16X) - 1))
+        if osrs_p:
+            t_us += 2300 * (1 << (min(osrs_p, _BMP280_OS_16X) - 1)) + 575
+        return t_us
 
     def is_measuring(self):
         """측정 중인지 확인"""
         return (self._read_byte(_BMP280_STATUS) & 0x08) > 0
 
+    def is_data_ready(self):
+        """읽을 수 있는 측정 결과가 있는지 확인 (대기 없음)
+        BMP280에는 데이터 준비 플래그가 없으므로 변환 중이 아니면 준비된 것으로 본다
+        """
+        return not self.is_measuring()
+
     def read_raw_temperature(self):
         """원시 온도 데이터 읽기"""
-        data = self.i2c.readfrom_mem(self.addr, _BMP280_TEMP_DATA, 3)
-        return (data[0] << 12 | data[1] << 4 | data[2]) >> 4
+        data = self._buf3
+        self.i2c.readfrom_mem_into(self.addr, _BMP280_TEMP_DATA, data)
+        return data[0] << 12 | data[1] << 4 | data[2] >> 4
 
     def read_raw_pressure(self):
         """원시 압력 데이터 읽기"""
-        data = self.i2c.readfrom_mem(self.addr, _BMP280_PRESS_DATA, 3)
-        return (data[0] << 12 | data[1] << 4 | data[2]) >> 4
+        data = self._buf3
+        self.i2c.readfrom_mem_into(self.addr, _BMP280_PRESS_DATA, data)
+        return data[0] << 12 | data[1] << 4 | data[2] >> 4
 
     def compensate_temperature(self, adc_t):
         """온도 보정 계산 데이터시트의 보정 공식 구현"""
@@ -208,7 +313,39 @@ class BMP280:
 
     @property
     def pressure(self):
-        """보정된 기압 읽기 (hPa)"""
-        self.read_raw_temperature()  # t_fine 업데이트
+        """보정된 기압 읽기 (hPa)
+        온도는 temperature_refresh 정책에 따라 갱신되고, 그 외에는 저장된 t_fine 사용
+        """
+        if self.temperature_refresh.due():
+            self.compensate_temperature(self.read_raw_temperature())  # t_fine 업데이트
         raw_pressure = self.read_raw_pressure()
-        return self.compensate_pressure(raw_pressure) / 100.0  # Pa -> hPa
\ No newline at end of file
+        return self.compensate_pressure(raw_pressure) / 100.0  # Pa -> hPa
+
+    def read_raw_data(self, wait=True):
+        """원시 압력/온도 데이터 읽기 (0xF7~0xFC 6바이트 한 번에)
+        :param wait: False면 측정 중 확인 생략 (is_data_ready()로 이미 확인한 경우)
+        :return: (원시 압력, 원시 온도)
+        """
+        while wait and self.is_measuring():
+            time.sleep_ms(1)
+
+        data = self._buf6
+        self.i2c.readfrom_mem_into(self.addr, _BMP280_PRESS_DATA, data)
+        raw_pressure = data[0] << 12 | data[1] << 4 | data[2] >> 4
+        raw_temp = data[3] << 12 | data[4] << 4 | data[5] >> 4
+        return raw_pressure, raw_temp
+
+    def compensate(self, raw_pressure, raw_temp):
+        """원시 압력/온도를 함께 보정 (t_fine 갱신)
+        :return: (기압 hPa, 온도 °C)
+        """
+        temperature = self.compensate_temperature(raw_temp) / 100.0
+        return self.compensate_pressure(raw_pressure) / 100.0, temperature
+
+    def read(self, wait=True):
+        """기압과 온도를 함께 읽기
+        :param wait: False면 측정 중 확인 생략 (is_data_ready()로 이미 확인한 경우)
+        :return: (기압 hPa, 온도 °C)
+        """
+        raw_pressure, raw_temp = self.read_raw_data(wait)
+        return self.compensate(raw_pressure, raw_temp)
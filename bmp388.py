@@ -2,10 +2,18 @@
 MicroPython BMP388 라이브러리
 I2C 인터페이스를 통한 온도 및 기압 측정 지원
 저전력 모드와 일반 모드 모두 지원
+BMP390은 레지스터 맵, 보정 계수, 보정식이 BMP388과 같고 칩 ID만 다르므로 같은 드라이버로 동작
 """
 import time
 from micropython import const
 
+try:
+    from collections import namedtuple
+except ImportError:
+    from ucollections import namedtuple
+
+from temperature_refresh import TemperatureRefresh
+
 # BMP388 레지스터 주소
 _BMP388_CHIP_ID = const(0x00)
 _BMP388_ERR_REG = const(0x02)
@@ -39,6 +47,7 @@ _BMP388_CMD = const(0x7E)
 
 # ID 값
 _BMP388_ID = const(0x50)
+_BMP390_ID = const(0x60)
 
 # 커맨드
 _BMP388_CMD_SOFTRESET = const(0xB6)
@@ -91,56 +100,160 @@ _BMP388_IIR_FILTER_COEFF_127 = const(0x07)
 _BMP388_DRDY_PRESS = const(0x20)
 _BMP388_DRDY_TEMP = const(0x40)
 
+# 인터럽트 설정 (INT_CTRL, INT_STATUS)
+_BMP388_INT_LEVEL_HIGH = const(0x02)  # INT 핀 액티브 하이
+_BMP388_INT_LATCH = const(0x04)  # INT_STATUS를 읽을 때까지 유지
+_BMP388_INT_DRDY_EN = const(0x40)
+_BMP388_INT_DRDY = const(0x08)  # INT_STATUS 데이터 준비 비트
+
+# FIFO 설정 (FIFO_CONFIG_1, FIFO_CONFIG_2)
+_BMP388_FIFO_MODE = const(0x01)
+_BMP388_FIFO_TIME_EN = const(0x04)
+_BMP388_FIFO_PRESS_EN = const(0x08)
+_BMP388_FIFO_TEMP_EN = const(0x10)
+_BMP388_FIFO_DATA_FILTERED = const(0x08)
+
+# FIFO 프레임 헤더
+_BMP388_FIFO_HEADER_PRESS_TEMP = const(0x94)  # 헤더 + 온도 3바이트 + 압력 3바이트
+_BMP388_FIFO_HEADER_TEMP = const(0x90)
+_BMP388_FIFO_HEADER_PRESS = const(0x84)
+_BMP388_FIFO_HEADER_TIME = const(0xA0)
+_BMP388_FIFO_HEADER_CONFIG_CHANGE = const(0x48)
+_BMP388_FIFO_HEADER_CONFIG_ERROR = const(0x44)
+
+_BMP388_FIFO_SIZE = const(512)
+_BMP388_FIFO_FRAME_LEN = const(7)  # 압력 + 온도 프레임 길이
+_BMP388_FIFO_TIME_LEN = const(4)  # FIFO가 비면 뒤에 붙는 센서 시간 프레임
+_BMP388_INT_FWM = const(0x01)  # INT_STATUS 워터마크 비트
+
+# 스케일링된 보정 계수 묶음 (배치 보정 등 드라이버 밖에서 사용)
+BMP388Coefficients = namedtuple(
+    "BMP388Coefficients",
+    ("par_t1", "par_t2", "par_t3", "par_p1", "par_p2", "par_p3", "par_p4",
+     "par_p5", "par_p6", "par_p7", "par_p8", "par_p9", "par_p10", "par_p11")
+)
+
+
+def _tdiv(a, b):
+    """C 정수 나눗셈 (0 방향 버림, b > 0)"""
+    return a // b if a >= 0 else -(-a // b)
+
 
 class BMP388:
-    """BMP388 디지털 압력 센서 드라이버"""
+    """BMP388/BMP390 디지털 압력 센서 드라이버"""
 
-    def __init__(self, i2c, addr=0x77):
+    def __init__(self, i2c, addr=0x77, integer=False, cache=None, bus=0, start=True):
         """
         BMP388 센서 초기화
         :param i2c: I2C 인터페이스 객체
         :param addr: 센서의 I2C 주소 (기본값 0x76)
+        :param integer: True면 정수 보정 경로 사용 (Bosch BMP3 정수 참조 구현)
+        :param cache: calib_cache.CalibrationCache (주면 보정 계수를 캐시에서 읽고 리셋 대기를 폴링으로 대체)
+        :param bus: 캐시 키로 쓰는 I2C 버스 번호
+        :param start: False면 ID 확인만 하고 리셋/보정/모드 설정은 호출자가 단계별로 수행
         """
         self.i2c = i2c
         self.addr = addr
+        self.cache = cache
+        self.bus = bus
+        self.integer = integer
+        self.sensor_time = None
+        self._fifo_buf = None  # enable_fifo()에서 할당
+        self._fifo_view = None
+        self._fifo_t_lin = None
+        self.t_lin = None
+        self.t_lin_int = None
+        self.temperature_refresh = TemperatureRefresh()  # 기본값: 매 샘플 온도 갱신
+
+        # 샘플마다 힙 할당이 생기지 않도록 고정 버퍼를 재사용
+        self._buf1 = bytearray(1)
+        self._buf2 = bytearray(2)
+        self._buf3 = bytearray(3)
+        self._buf6 = bytearray(6)
 
         # 센서 ID 확인
-        chip_id = self._read_byte(_BMP388_CHIP_ID)
-        if chip_id != _BMP388_ID:
-            raise RuntimeError("BMP388 센서를 찾을 수 없습니다. ID: %x" % chip_id)
+        self.chip_id = chip_id = self._read_byte(_BMP388_CHIP_ID)
+        if chip_id != _BMP388_ID and chip_id != _BMP390_ID:
+            raise RuntimeError("BMP388/BMP390 센서를 찾을 수 없습니다. ID: %x" % chip_id)
+
+        if not start:
+            return  # 단계별 초기화 (bringup.staged_bringup)
 
         # 소프트 리셋 및 초기화
-        self._reset()
+        self.reset()
 
-        self._read_calibration_data()
+        self.load_calibration()
 
         # 기본 설정: 일반 모드
         self.set_normal_mode()
 
     def _read_byte(self, register):
         """레지스터에서 1바이트 읽기"""
-        result = self.i2c.readfrom_mem(self.addr, register, 1)
-        return result[0]
+        self.i2c.readfrom_mem_into(self.addr, register, self._buf1)
+        return self._buf1[0]
 
     def _write_byte(self, register, value):
         """레지스터에 1바이트 쓰기"""
-        self.i2c.writeto_mem(self.addr, register, bytes([value]))
+        self._buf1[0] = value
+        self.i2c.writeto_mem(self.addr, register, self._buf1)
 
     def _read_bytes(self, register, count):
         """레지스터에서 여러 바이트 읽기"""
         return self.i2c.readfrom_mem(self.addr, register, count)
 
-    def _reset(self):
-        """소프트 리셋 수행"""
+    def reset(self, wait=True):
+        """소프트 리셋 수행
+        :param wait: False면 리셋 명령만 보내고 바로 반환 (준비 대기는 wait_ready())
+        """
         self._write_byte(_BMP388_CMD, _BMP388_CMD_SOFTRESET)
-        time.sleep_ms(200)  # 리셋 후 대기
+        if not wait:
+            return
+        if self.cache is None:
+            time.sleep_ms(200)  # 리셋 후 대기
+        else:
+            time.sleep_ms(2)  # 시작 시간
+            self.wait_ready()
+
+    def is_ready(self):
+        """리셋 후 센서 준비 완료 여부"""
+        return bool(self._read_byte(_BMP388_STATUS) & 0x10)  # 명령 수신 가능 (cmd_rdy)
+
+    def wait_ready(self, timeout_ms=200):
+        """준비 상태 폴링 (리셋 직후에는 I2C 응답이 없을 수 있음)"""
+        start = time.ticks_ms()
+        while time.ticks_diff(time.ticks_ms(), start) < timeout_ms:
+            try:
+                if self.is_ready():
+                    return
+            except OSError:
+                pass
+            time.sleep_ms(1)
+        raise RuntimeError("센서 준비 시간 초과")
+
+    def _cached_calibration(self, length):
+        """캐시에 저장된 보정 계수 바이트 (없으면 None)"""
+        if self.cache is None:
+            return None
+        return self.cache.get(self.bus, self.addr, self.chip_id, length)
+
+    def _store_calibration(self, data):
+        """NVM에서 읽은 보정 계수 바이트를 캐시에 저장"""
+        if self.cache is not None:
+            self.cache.put(self.bus, self.addr, self.chip_id, data)
+
+    def load_calibration(self):
+        """보정 계수 읽기 (리셋 후 준비가 끝난 다음 호출)"""
+        self._read_calibration_data()
 
     def _read_calibration_data(self):
-        """보정 데이터 읽기"""
+        """보정 데이터 읽기 (캐시가 있으면 캐시 사용)"""
         # BMP388 보정 데이터 읽기 (총 21바이트)
-        calib_data = self._read_bytes(_BMP388_CALIB_DATA, 21)
-        if len(calib_data) != 21:
-            raise ValueError("BMP388 calibration data read failed.")
+        calib_data = self._cached_calibration(21)
+        if calib_data is None:
+            calib_data = self._read_bytes(_BMP388_CALIB_DATA, 21)
+            if len(calib_data) != 21:
+                raise ValueError("BMP388 calibration data read failed.")
+            self._store_calibration(calib_data)
 
         # 데이터시트에 따라 보정 계수 추출
         self.T1 = (calib_data[1] << 8) | calib_data[0]  # 부호 없는 16비트
@@ -197,8 +310,21 @@ class BMP388:
         self.par_p9 = float(self.P9) / (1 << 48)
         self.par_p10 = float(self.P10) / (1 << 48)
         self.par_p11 = float(self.P11) / (1 << 65)
+        self._kernel_t_lin = None
+
+        self.coefficients = BMP388Coefficients(
+            self.par_t1, self.par_t2, self.par_t3, self.par_p1, self.par_p2, self.par_p3, self.par_p4,
+            self.par_p5, self.par_p6, self.par_p7, self.par_p8, self.par_p9, self.par_p10, self.par_p11)
+
+        # 정수 보정 계수 (Bosch BMP3 정수 참조 구현의 상수 곱을 미리 계산)
+        self.int_t1 = self.T1 << 8
+        self.int_p2 = (self.P2 - 16384) << 21
+        self.int_p5 = self.P5 << 47
+        self.int_p6 = self.P6 << 22
+        self.int_p9 = self.P9 << 16
+        self.int_p1 = (self.P1 - 16384) << 46
 
-    def set_low_power_mode(self):
+    def set_low_power_mode(self, settle=True):
         """저전력 모드 설정
         - 온도: 1x 오버샘플링
         - 압력: 1x 오버샘플링
@@ -217,9 +343,10 @@ class BMP388:
         # 전력 모드 설정 (일반 모드)
         self._write_byte(_BMP388_PWR_CTRL, _BMP388_POWER_NORMAL)
 
-        time.sleep_ms(20)
+        if settle:
+            time.sleep_ms(20)
 
-    def set_normal_mode(self):
+    def set_normal_mode(self, settle=True):
         """일반 모드 설정
         - 온도: 2x 오버샘플링
         - 압력: 16x 오버샘플링
@@ -238,7 +365,16 @@ class BMP388:
         # 전력 모드 설정 (일반 모드)
         self._write_byte(_BMP388_PWR_CTRL, _BMP388_POWER_NORMAL)
 
-        time.sleep_ms(20)
+        if settle:
+            time.sleep_ms(20)
+
+    def set_temperature_refresh(self, every=None, period_ms=None):
+        """기압 측정 시 온도(t_lin) 갱신 주기 설정
+        :param every: 온도를 갱신할 샘플 간격 (period_ms만 주면 사용 안 함)
+        :param period_ms: 온도를 갱신할 최대 시간 간격 (ms)
+        둘 다 생략하면 매 샘플 갱신
+        """
+        self.temperature_refresh = TemperatureRefresh(every, period_ms)
 
     def sleep(self):
         """슬립 모드로 전환"""
@@ -251,25 +387,132 @@ class BMP388:
         while self.is_measuring():
             time.sleep_ms(5)
 
+    def enable_fifo(self, watermark=16):
+        """FIFO 스트리밍 모드 활성화
+        - 압력, 온도, 센서 시간 프레임 저장 (IIR 필터 적용 데이터)
+        - watermark: 워터마크까지 쌓을 압력+온도 프레임 수 (50Hz에서 16프레임 = 320ms)
+        일반 모드에서 사용하며, read_fifo()로 한 번에 읽어온다
+        """
+        watermark_bytes = watermark * _BMP388_FIFO_FRAME_LEN
+        if watermark < 1 or watermark_bytes >= _BMP388_FIFO_SIZE:
+            raise ValueError("FIFO 워터마크는 1~73 프레임이어야 합니다.")
+
+        if self._fifo_buf is None:
+            self._fifo_buf = bytearray(_BMP388_FIFO_SIZE + _BMP388_FIFO_TIME_LEN)
+            self._fifo_view = memoryview(self._fifo_buf)
+        self._fifo_t_lin = None
+
+        self._write_byte(_BMP388_FIFO_CONFIG_1, 0x00)
+        self._write_byte(_BMP388_CMD, _BMP388_CMD_FIFO_FLUSH)
+        self._write_byte(_BMP388_FIFO_WTM_0, watermark_bytes & 0xFF)
+        self._write_byte(_BMP388_FIFO_WTM_1, watermark_bytes >> 8)
+        self._write_byte(_BMP388_FIFO_CONFIG_2, _BMP388_FIFO_DATA_FILTERED)
+        self._write_byte(_BMP388_FIFO_CONFIG_1, _BMP388_FIFO_MODE | _BMP388_FIFO_TIME_EN |
+                         _BMP388_FIFO_PRESS_EN | _BMP388_FIFO_TEMP_EN)
+
+    def disable_fifo(self):
+        """FIFO 스트리밍 모드 해제"""
+        self._write_byte(_BMP388_FIFO_CONFIG_1, 0x00)
+        self._write_byte(_BMP388_CMD, _BMP388_CMD_FIFO_FLUSH)
+
+    def fifo_length(self):
+        """FIFO에 쌓인 바이트 수 (FIFO를 켜지 않았으면 0)"""
+        data = self._buf2
+        self.i2c.readfrom_mem_into(self.addr, _BMP388_FIFO_LENGTH_0, data)
+        return (data[1] & 0x01) << 8 | data[0]
+
+    def fifo_watermark_reached(self):
+        """워터마크 도달 여부 (INT_STATUS 읽기로 플래그 해제)"""
+        return bool(self._read_byte(_BMP388_INT_STATUS) & _BMP388_INT_FWM)
+
+    def read_fifo(self):
+        """FIFO를 한 번의 버스트 읽기로 비우고 보정된 샘플 목록 반환
+        :return: [(기압 hPa, 온도 °C), ...] 오래된 것부터
+        센서 시간 프레임이 있으면 sensor_time 갱신
+        """
+        if self._fifo_buf is None:
+            raise RuntimeError("FIFO가 활성화되지 않았습니다. enable_fifo()를 먼저 호출하세요.")
+        length = self.fifo_length()
+        if length == 0:
+            return []
+        count = length + _BMP388_FIFO_TIME_LEN
+        self.i2c.readfrom_mem_into(self.addr, _BMP388_FIFO_DATA, self._fifo_view[:count])
+        return self._parse_fifo(self._fifo_buf, count)
+
+    def _parse_fifo(self, data, count):
+        """FIFO 프레임 해석 (온도 프레임이 압력 프레임보다 앞에 온다)"""
+        samples = []
+        t_lin = self._fifo_t_lin
+        i = 0
+        while i < count:
+            header = data[i]
+            if header == _BMP388_FIFO_HEADER_PRESS_TEMP and i + 7 <= count:
+                t_lin = self.compensate_temperature((data[i + 3] << 16) | (data[i + 2] << 8) | data[i + 1])
+                raw_press = (data[i + 6] << 16) | (data[i + 5] << 8) | data[i + 4]
+                samples.append((self.compensate_pressure(raw_press, t_lin) / 100.0, t_lin))
+                i += 7
+            elif header == _BMP388_FIFO_HEADER_TEMP and i + 4 <= count:
+                t_lin = self.compensate_temperature((data[i + 3] << 16) | (data[i + 2] << 8) | data[i + 1])
+                i += 4
+            elif header == _BMP388_FIFO_HEADER_PRESS and i + 4 <= count:
+                if t_lin is not None:
+                    raw_press = (data[i + 3] << 16) | (data[i + 2] << 8) | data[i + 1]
+                    samples.append((self.compensate_pressure(raw_press, t_lin) / 100.0, t_lin))
+                i += 4
+            elif header == _BMP388_FIFO_HEADER_TIME and i + 4 <= count:
+                self.sensor_time = (data[i + 3] << 16) | (data[i + 2] << 8) | data[i + 1]
+                i += 4
+            elif header == _BMP388_FIFO_HEADER_CONFIG_CHANGE or header == _BMP388_FIFO_HEADER_CONFIG_ERROR:
+                i += 2
+            else:
+                break  # 빈 프레임(0x80) 또는 잘린 프레임
+        self._fifo_t_lin = t_lin
+        return samples
+
     def is_measuring(self):
         """측정 중인지 확인"""
         return not (self._read_byte(_BMP388_STATUS) & 0x10)  # 압력 또는 온도 변환 중인지 확인
 
     def is_data_ready(self):
+        """새 압력/온도 데이터가 준비됐는지 확인 (대기 없음)"""
         status = self._read_byte(_BMP388_STATUS)
         return (status & _BMP388_DRDY_TEMP) and (status & _BMP388_DRDY_PRESS)
 
-    def read_raw_data(self):
-        timeout = 200   # 최대 200번 반복
-        while self.is_measuring() and not self.is_data_ready() and timeout > 0:
-            time.sleep_ms(5)
-            timeout -= 1
-        if timeout == 0:
-            raise RuntimeError("Sensor measurement timed out.")
+    def enable_drdy_interrupt(self, latch=False):
+        """데이터 준비 인터럽트 활성화 (INT 핀, 액티브 하이 푸시풀)
+        - 새 측정이 끝날 때마다 INT 핀에 상승 에지 발생
+        - latch: True면 INT_STATUS를 읽을 때까지 핀 레벨 유지
+        """
+        value = _BMP388_INT_DRDY_EN | _BMP388_INT_LEVEL_HIGH
+        if latch:
+            value |= _BMP388_INT_LATCH
+        self._write_byte(_BMP388_INT_CTRL, value)
+
+    def disable_interrupt(self):
+        """INT 핀 인터럽트 해제"""
+        self._write_byte(_BMP388_INT_CTRL, _BMP388_INT_LEVEL_HIGH)
+
+    def handle_drdy(self):
+        """데이터 준비 인터럽트 처리 (INT 핀 핸들러에서 호출)
+        INT_STATUS를 읽어 플래그를 해제하고, 새 데이터가 있으면 폴링 없이 바로 읽는다
+        보정은 compensate()를 거치므로 integer 설정을 따른다
+        :return: (원시 압력, 원시 온도, 기압 hPa, 온도 °C) 또는 새 데이터가 없으면 None
+        """
+        if not self._read_byte(_BMP388_INT_STATUS) & _BMP388_INT_DRDY:
+            return None
+        raw_press, raw_temp = self.read_raw_data(wait=False)
+        pressure, temperature = self.compensate(raw_press, raw_temp)
+        return raw_press, raw_temp, pressure, temperature
+
+    def read_raw_data(self, wait=True):
+        """원시 압력/온도 데이터 읽기
+        :param wait: False면 준비 상태 폴링 생략 (인터럽트로 준비가 확인된 경우)
+        """
+        if wait:
+            self._wait_data_ready()
 
-        data = self._read_bytes(_BMP388_DATA_0, 6)
-        if len(data) != 6:
-            raise ValueError("Sensor data read failed.")
+        data = self._buf6
+        self.i2c.readfrom_mem_into(self.addr, _BMP388_DATA_0, data)
 
         # 압력 데이터 조합 (리틀 엔디언)
         raw_pressure = (data[2] << 16) | (data[1] << 8) | data[0]
@@ -279,6 +522,23 @@ class BMP388:
 
         return raw_pressure, raw_temperature
 
+    def read_raw_pressure(self, wait=True):
+        """원시 압력 데이터만 읽기 (온도 3바이트 생략)"""
+        if wait:
+            self._wait_data_ready()
+
+        data = self._buf3
+        self.i2c.readfrom_mem_into(self.addr, _BMP388_DATA_0, data)
+        return (data[2] << 16) | (data[1] << 8) | data[0]
+
+    def _wait_data_ready(self):
+        timeout = 200   # 최대 200번 반복
+        while self.is_measuring() and not self.is_data_ready() and timeout > 0:
+            time.sleep_ms(5)
+            timeout -= 1
+        if timeout == 0:
+            raise RuntimeError("Sensor measurement timed out.")
+
     def compensate_temperature(self, raw_temp):
         """온도 보정 계산 (데이터시트 9.2)"""
         partial_data1 = float(raw_temp) - self.par_t1
@@ -287,35 +547,100 @@ class BMP388:
         return t_lin  # 섭씨 온도 (°C)
 
     def compensate_pressure(self, raw_press, t_lin):
-        """기압 보정 계산 (데이터시트 9.3)"""
-        partial_data1 = self.par_p6 * t_lin
-        partial_data2 = self.par_p7 * (t_lin ** 2)
-        partial_data3 = self.par_p8 * (t_lin ** 3)
-        partial_out1 = self.par_p5 + partial_data1 + partial_data2 + partial_data3
-
-        partial_data1 = self.par_p2 * t_lin
-        partial_data2 = self.par_p3 * (t_lin ** 2)
-        partial_data3 = self.par_p4 * (t_lin ** 3)
-        partial_out2 = float(raw_press) * (self.par_p1 + partial_data1 + partial_data2 + partial_data3)
-
-        partial_data1 = float(raw_press) * float(raw_press)
-        partial_data2 = self.par_p9 + self.par_p10 * t_lin
-        partial_data3 = partial_data1 * partial_data2
-        partial_data4 = partial_data3 + (float(raw_press) ** 3) * self.par_p11
-
-        comp_press = partial_out1 + partial_out2 + partial_data4
-        return comp_press  # 파스칼 (Pa)
+        """기압 보정 계산 (데이터시트 9.3)
+        온도 항(partial_out1, 압력 1차/2차 계수)은 t_lin이 바뀔 때만 다시 계산하고
+        압력은 원시값에 대한 3차 호너식 하나로 계산
+        """
+        if t_lin != self._kernel_t_lin:
+            self._update_pressure_terms(t_lin)
+        raw = float(raw_press)
+        return self._offset + raw * (self._sensitivity + raw * (self._quadratic + raw * self.par_p11))  # 파스칼 (Pa)
+
+    def _update_pressure_terms(self, t_lin):
+        """t_lin에 따른 기압 보정 항 계산 (호너식)"""
+        self._offset = self.par_p5 + t_lin * (self.par_p6 + t_lin * (self.par_p7 + t_lin * self.par_p8))
+        self._sensitivity = self.par_p1 + t_lin * (self.par_p2 + t_lin * (self.par_p3 + t_lin * self.par_p4))
+        self._quadratic = self.par_p9 + t_lin * self.par_p10
+        self._kernel_t_lin = t_lin
+
+    def compensate_temperature_int(self, raw_temp):
+        """정수 온도 보정 (Bosch BMP3 정수 참조 구현)
+        :return: t_lin (°C x 65536), 0.01°C 단위 온도는 _tdiv(t_lin * 25, 16384)
+        """
+        partial_data1 = raw_temp - self.int_t1
+        partial_data5 = ((self.T2 * partial_data1) << 18) + partial_data1 * partial_data1 * self.T3
+        return _tdiv(partial_data5, 4294967296)
+
+    def compensate_pressure_int(self, raw_press, t_lin):
+        """정수 기압 보정 (Bosch BMP3 정수 참조 구현)
+        :param t_lin: compensate_temperature_int() 결과
+        :return: 기압 (0.01 Pa 단위 정수)
+        """
+        partial_data1 = t_lin * t_lin
+        partial_data2 = _tdiv(partial_data1, 64)
+        partial_data3 = _tdiv(partial_data2 * t_lin, 256)
+        partial_data4 = _tdiv(self.P8 * partial_data3, 32)
+        partial_data5 = (self.P7 * partial_data1) << 4
+        offset = self.int_p5 + partial_data4 + partial_data5 + self.int_p6 * t_lin
+
+        partial_data2 = _tdiv(self.P4 * partial_data3, 32)
+        partial_data4 = (self.P3 * partial_data1) << 2
+        sensitivity = self.int_p1 + partial_data2 + partial_data4 + self.int_p2 * t_lin
+
+        partial_data1 = _tdiv(sensitivity, 16777216) * raw_press
+        partial_data3 = self.P10 * t_lin + self.int_p9
+        partial_data4 = _tdiv(partial_data3 * raw_press, 8192)
+        partial_data5 = _tdiv(raw_press * _tdiv(partial_data4, 10), 512) * 10
+        partial_data2 = _tdiv(self.P11 * raw_press * raw_press, 65536)
+        partial_data3 = _tdiv(partial_data2 * raw_press, 128)
+        partial_data4 = _tdiv(offset, 4) + partial_data1 + partial_data5 + partial_data3
+        return (partial_data4 * 25) // 1099511627776
 
     @property
     def temperature(self):
         """보정된 온도 읽기 (°C)"""
         _, raw_temp = self.read_raw_data()
+        if self.integer:
+            return _tdiv(self.compensate_temperature_int(raw_temp) * 25, 16384) / 100.0
         return self.compensate_temperature(raw_temp)
 
     @property
     def pressure(self):
-        """보정된 기압 읽기 (hPa)"""
-        raw_press, raw_temp = self.read_raw_data()
-        t_lin = self.compensate_temperature(raw_temp)
-        pressure_pa = self.compensate_pressure(raw_press, t_lin)
-        return pressure_pa / 100.0  # Pa -> hPa
\ No newline at end of file
+        """보정된 기압 읽기 (hPa)
+        온도는 temperature_refresh 정책에 따라 갱신되고, 그 외에는 저장된 t_lin 사용
+        """
+        cached = self.t_lin_int if self.integer else self.t_lin
+        refresh = self.temperature_refresh.due() or cached is None
+        if refresh:
+            raw_press, raw_temp = self.read_raw_data()
+        else:
+            raw_press = self.read_raw_pressure()
+
+        if self.integer:
+            if refresh:
+                self.t_lin_int = self.compensate_temperature_int(raw_temp)
+            return self.compensate_pressure_int(raw_press, self.t_lin_int) / 10000.0  # 0.01 Pa -> hPa
+
+        if refresh:
+            self.t_lin = self.compensate_temperature(raw_temp)
+        pressure_pa = self.compensate_pressure(raw_press, self.t_lin)
+        return pressure_pa / 100.0  # Pa -> hPa
+
+    def compensate(self, raw_press, raw_temp):
+        """원시 압력/온도를 함께 보정 (저장된 t_lin 갱신)
+        :return: (기압 hPa, 온도 °C)
+        """
+        if self.integer:
+            self.t_lin_int = t_lin = self.compensate_temperature_int(raw_temp)
+            return self.compensate_pressure_int(raw_press, t_lin) / 10000.0, _tdiv(t_lin * 25, 16384) / 100.0
+
+        self.t_lin = t_lin = self.compensate_temperature(raw_temp)
+        return self.compensate_pressure(raw_press, t_lin) / 100.0, t_lin
+
+    def read(self, wait=True):
+        """기압과 온도를 함께 읽기 (데이터 6바이트 한 번에)
+        :param wait: False면 준비 상태 폴링 생략 (is_data_ready()로 이미 확인한 경우)
+        :return: (기압 hPa, 온도 °C)
+        """
+        raw_press, raw_temp = self.read_raw_data(wait)
+        return self.compensate(raw_press, raw_temp)
@@ -0,0 +1,72 @@
+"""
+단계별 센서 초기화
+센서를 하나씩 초기화하면 리셋 대기와 모드 설정 대기가 센서 수만큼 쌓인다.
+모든 센서에 리셋을 먼저 보내고, 한 번에 준비 완료를 기다린 뒤
+보정 계수 읽기와 모드 설정을 진행해 칩 내부 시작 시간을 겹치게 한다.
+
+드라이버는 start=False로 생성해야 한다 (ID 확인만 수행).
+"""
+import time
+
+# 단계 이름 (보고 순서)
+STAGES = ("probe", "reset", "ready", "calibration", "mode", "settle")
+
+
+def staged_bringup(sensors, mode="normal", settle_ms=20, timeout_ms=200):
+    """센서들을 단계별로 초기화
+    :param sensors: start=False로 생성한 드라이버 목록
+    :param mode: "normal" 또는 "low_power"
+    :param settle_ms: 모드 설정 후 한 번만 기다리는 시간
+    :param timeout_ms: 준비 완료 대기 제한 시간
+    :return: 단계별 소요 시간 dict (ms)
+    """
+    timing = {}
+    start = time.ticks_ms()
+
+    # 1. 모든 센서에 리셋 명령 전송
+    for sensor in sensors:
+        sensor.reset(wait=False)
+    start = _mark(timing, "reset", start)
+
+    # 2. 모든 센서 준비 완료 대기 (리셋이 동시에 진행되므로 가장 느린 센서만큼만 기다림)
+    time.sleep_ms(2)  # 시작 시간
+    for sensor in sensors:
+        sensor.wait_ready(timeout_ms)
+    start = _mark(timing, "ready", start)
+
+    # 3. 보정 계수 읽기
+    for sensor in sensors:
+        sensor.load_calibration()
+    start = _mark(timing, "calibration", start)
+
+    # 4. 측정 모드 설정 (대기 없이)
+    for sensor in sensors:
+        if mode == "low_power":
+            sensor.set_low_power_mode(settle=False)
+        else:
+            sensor.set_normal_mode(settle=False)
+    start = _mark(timing, "mode", start)
+
+    # 5. 모든 센서 공통 안정화 대기 한 번
+    time.sleep_ms(settle_ms)
+    _mark(timing, "settle", start)
+    return timing
+
+
+def _mark(timing, stage, start):
+    """단계 소요 시간 기록 후 현재 시각 반환"""
+    now = time.ticks_ms()
+    timing[stage] = time.ticks_diff(now, start)
+    return now
+
+
+def format_boot_report(timing):
+    """단계별 소요 시간을 출력용 문자열로 변환"""
+    lines = []
+    total = 0
+    for stage in STAGES:
+        if stage in timing:
+            lines.append(f"{stage:<12}{timing[stage]:>6} ms")
+            total += timing[stage]
+    lines.append(f"{'total':<12}{total:>6} ms")
+    return "\n".join(lines)
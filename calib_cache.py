@@ -0,0 +1,99 @@
+"""
+보정 계수 캐시
+센서의 원시 보정 계수(NVM) 바이트를 플래시의 작은 바이너리 파일에 저장
+(버스 번호, I2C 주소, 칩 ID)를 키로 사용하고 파일 전체를 CRC32로 검증한다.
+웜 부팅에서는 드라이버가 NVM을 다시 읽지 않고 캐시의 계수를 사용한다.
+
+파일 형식 (리틀 엔디언):
+    b"CALB" | 버전 u8 | 항목 수 u8
+    항목마다: 버스 u8 | 주소 u8 | 칩 ID u8 | 길이 u8 | 계수 바이트
+    CRC32 u32 (앞의 모든 바이트)
+"""
+try:
+    import struct
+except ImportError:
+    import ustruct as struct
+
+try:
+    from binascii import crc32
+except ImportError:
+    from ubinascii import crc32
+
+_MAGIC = b"CALB"
+_VERSION = 1
+
+
+class CalibrationCache:
+    """플래시에 저장되는 보정 계수 캐시"""
+
+    def __init__(self, path="calib.bin"):
+        """
+        :param path: 캐시 파일 경로
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = self._load()
+
+    def _load(self):
+        """캐시 파일 읽기 (없거나 손상되었으면 빈 캐시)"""
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return {}
+
+        if len(data) < 10 or data[:4] != _MAGIC or data[4] != _VERSION:
+            return {}
+        if struct.unpack("<I", data[-4:])[0] != crc32(data[:-4]) & 0xFFFFFFFF:
+            return {}
+
+        entries = {}
+        pos = 6
+        for _ in range(data[5]):
+            if pos + 4 > len(data) - 4:
+                return {}
+            bus, addr, chip_id, length = data[pos:pos + 4]
+            pos += 4
+            if pos + length > len(data) - 4:
+                return {}
+            entries[(bus, addr, chip_id)] = bytes(data[pos:pos + length])
+            pos += length
+        return entries
+
+    def _save(self):
+        """캐시 파일 쓰기"""
+        data = bytearray(_MAGIC)
+        data.append(_VERSION)
+        data.append(len(self._entries))
+        for (bus, addr, chip_id), payload in self._entries.items():
+            data.extend(bytes((bus, addr, chip_id, len(payload))))
+            data.extend(payload)
+        data.extend(struct.pack("<I", crc32(data) & 0xFFFFFFFF))
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+    def get(self, bus, addr, chip_id, length):
+        """저장된 보정 계수 바이트 반환
+        :param length: 기대하는 계수 길이 (다르면 캐시 미스)
+        :return: bytes 또는 없으면 None
+        """
+        payload = self._entries.get((bus, addr, chip_id))
+        if payload is None or len(payload) != length:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return payload
+
+    def put(self, bus, addr, chip_id, payload):
+        """보정 계수 바이트 저장 (내용이 바뀐 경우에만 파일 쓰기)"""
+        payload = bytes(payload)
+        if self._entries.get((bus, addr, chip_id)) == payload:
+            return
+        self._entries[(bus, addr, chip_id)] = payload
+        self._save()
+
+    def clear(self):
+        """모든 항목 삭제"""
+        self._entries = {}
+        self._save()
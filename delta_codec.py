@@ -0,0 +1,188 @@
+"""
+델타/가변 길이 정수 압축 코덱
+연속된 원시 ADC 값(압력, 온도)은 몇 카운트씩만 변하므로 채널별로 2차 차분(delta-of-delta)을 구해
+zigzag로 부호를 없앤 뒤 가변 길이 정수(varint, LEB128)로 저장한다.
+대부분의 샘플이 채널당 1바이트가 되어 24비트 정수나 실수로 저장할 때보다 훨씬 작다.
+
+스트림 형식 (샘플마다 채널 순서대로 varint 하나씩):
+    첫 샘플: 값
+    둘째 샘플: 값 - 이전 값
+    이후: (값 - 이전 값) - 이전 차분
+
+- 디바이스: DeltaEncoder로 샘플마다 bytearray에 이어 붙임
+- 호스트: decode_numpy()가 NumPy로 한 번에 복원 (없으면 decode() 사용)
+- 벤치마크: python delta_codec.py log.bin (binlog 측정 레코드의 원시 압력/온도로 압축률과 처리 속도 출력)
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def zigzag(value):
+    """부호 있는 정수를 부호 없는 정수로 (0, -1, 1, -2 ... -> 0, 1, 2, 3 ...)"""
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+def unzigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+def write_varint(out, value):
+    """부호 없는 정수를 7비트씩 나눠 out(bytearray)에 추가"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class DeltaEncoder:
+    """채널별 2차 차분 + zigzag varint 증분 인코더"""
+
+    def __init__(self, channels=2):
+        """
+        :param channels: 샘플당 값 개수 (예: 원시 압력, 원시 온도)
+        """
+        self.channels = channels
+        self._prev = [0] * channels
+        self._delta = [0] * channels
+        self.count = 0  # 인코딩한 샘플 수
+
+    def reset(self):
+        """새 스트림 시작 (블록 경계 등, 다음 샘플은 원래 값으로 저장)"""
+        self.count = 0
+
+    def encode(self, values, out):
+        """샘플 하나를 인코딩해 out에 추가
+        :param values: 채널 수만큼의 정수
+        :param out: 결과를 이어 붙일 bytearray
+        :return: 추가한 바이트 수
+        """
+        start = len(out)
+        prev = self._prev
+        delta = self._delta
+        count = self.count
+        for c in range(self.channels):
+            value = values[c]
+            if count == 0:
+                x = value
+            else:
+                d = value - prev[c]
+                x = d if count == 1 else d - delta[c]
+                delta[c] = d
+            prev[c] = value
+            write_varint(out, zigzag(x))
+        self.count = count + 1
+        return len(out) - start
+
+
+def encode(samples, channels=2):
+    """샘플 목록을 한 스트림으로 인코딩"""
+    out = bytearray()
+    encoder = DeltaEncoder(channels)
+    for values in samples:
+        encoder.encode(values, out)
+    return out
+
+
+def decode(data, channels=2):
+    """스트림 복원 (순수 Python, 디바이스와 호스트 공용)
+    :return: 샘플 튜플 목록
+    """
+    samples = []
+    prev = [0] * channels
+    delta = [0] * channels
+    row = [0] * channels
+    count = 0
+    c = 0
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        x = unzigzag(value)
+        value = 0
+        shift = 0
+        if count == 0:
+            row[c] = x
+        elif count == 1:
+            delta[c] = x
+            row[c] = prev[c] + x
+        else:
+            delta[c] += x
+            row[c] = prev[c] + delta[c]
+        prev[c] = row[c]
+        c += 1
+        if c == channels:
+            samples.append(tuple(row))
+            count += 1
+            c = 0
+    return samples
+
+
+def decode_numpy(data, channels=2):
+    """스트림 복원 (NumPy 벡터화, 호스트용)
+    :return: (샘플 수, 채널 수) int64 배열
+    """
+    b = np.frombuffer(bytes(data), dtype=np.uint8)
+    ends = np.flatnonzero(b < 0x80)
+    if not len(ends):
+        return np.zeros((0, channels), dtype=np.int64)
+    b = b[:ends[-1] + 1]
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    group = np.repeat(np.arange(len(starts)), ends - starts + 1)
+    shift = (np.arange(len(b)) - starts[group]) * 7
+    raw = np.add.reduceat((b & 0x7F).astype(np.uint64) << shift.astype(np.uint64), starts)
+    x = (raw >> np.uint64(1)).astype(np.int64) ^ -(raw & np.uint64(1)).astype(np.int64)
+    x = x[:len(x) // channels * channels].reshape(-1, channels)
+
+    values = np.empty_like(x)
+    if len(x):
+        values[0] = x[0]
+        delta = np.cumsum(x[1:], axis=0)  # 1차 차분 복원
+        values[1:] = x[0] + np.cumsum(delta, axis=0)
+    return values
+
+
+def _benchmark(path):
+    """binlog 측정 레코드의 원시 압력/온도로 압축률과 처리 속도 측정"""
+    import time
+    import binlog
+
+    samples = [(r[5], r[6]) for r in binlog.decode(path) if r[2] == binlog.EV_MEASUREMENT]
+    if not samples:
+        print("측정 레코드가 없습니다.")
+        return
+    raw_size = len(samples) * 6  # 24비트 원시 값 2개
+
+    start = time.perf_counter()
+    data = encode(samples)
+    encode_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decoded = decode(data)
+    decode_s = time.perf_counter() - start
+    assert decoded == samples
+
+    print(f"samples      {len(samples)}")
+    print(f"raw 24-bit   {raw_size} B")
+    print(f"encoded      {len(data)} B ({len(data) / len(samples):.2f} B/sample)")
+    print(f"ratio        {raw_size / len(data):.2f}x")
+    print(f"encode       {len(samples) / encode_s:.0f} samples/s")
+    print(f"decode       {len(samples) / decode_s:.0f} samples/s")
+    if np is not None:
+        start = time.perf_counter()
+        fast = decode_numpy(data)
+        fast_s = time.perf_counter() - start
+        assert fast.tolist() == [list(s) for s in samples]
+        print(f"decode numpy {len(samples) / fast_s:.0f} samples/s")
+
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) != 2:
+        print("사용법: python delta_codec.py log.bin")
+        sys.exit(1)
+    _benchmark(sys.argv[1])
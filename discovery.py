@@ -0,0 +1,114 @@
+"""
+센서 자동 탐색
+버스마다 scan()을 한 번만 호출하고, 응답한 주소에서 칩 ID 레지스터를 한 번씩만 읽어
+칩 표와 비교한 뒤 준비된 드라이버 인스턴스를 레지스트리로 돌려준다.
+드라이버는 생성될 때 ID 레지스터를 다시 읽어 확인한다 (판별 결과를 그대로 믿지 않음).
+
+사용 예:
+    registry = discover({0: i2c0, 1: i2c1})
+    bmp388 = registry.get("BMP388")
+"""
+
+
+def _bmp280(i2c, addr, chip_id, bus, cache, start):
+    from bmp280 import BMP280
+    return BMP280(i2c, addr=addr, cache=cache, bus=bus, start=start)
+
+
+def _bmp388(i2c, addr, chip_id, bus, cache, start):
+    from bmp388 import BMP388
+    return BMP388(i2c, addr=addr, cache=cache, bus=bus, start=start)
+
+
+def _dps310(i2c, addr, chip_id, bus, cache, start):
+    from dps310 import DPS310
+    return DPS310(i2c, addr=addr, cache=cache, bus=bus, start=start)
+
+
+# 칩 표: (이름, 가능한 주소, ID 레지스터, ID 값, 드라이버 생성 함수)
+# 위에서부터 비교한다. BMP3 계열의 0x0D는 계속 증가하는 SENSORTIME_1 카운터라서
+# 256번에 한 번꼴로 DPS310 ID(0x10)와 같아지므로, BMP3의 고정 ID(0x00)를 DPS310의 0x0D보다 먼저 확인한다.
+# (DPS310의 0x00은 압력 데이터 최상위 바이트로, 실제 기압 범위에서는 0x50/0x60이 나오지 않는다)
+CHIPS = (
+    ("BMP280", (0x76, 0x77), 0xD0, 0x58, _bmp280),
+    ("BMP388", (0x76, 0x77), 0x00, 0x50, _bmp388),
+    ("BMP390", (0x76, 0x77), 0x00, 0x60, _bmp388),  # 레지스터 맵이 같아 BMP388 드라이버 사용
+    ("DPS310", (0x76, 0x77), 0x0D, 0x10, _dps310),
+)
+
+
+class SensorRegistry:
+    """탐색된 센서 드라이버 모음"""
+
+    def __init__(self):
+        self.sensors = []  # (이름, 버스, 주소, 드라이버)
+        self.scans = 0  # scan() 호출 횟수
+        self.id_reads = 0  # ID 레지스터 읽기 횟수
+
+    def add(self, name, bus, addr, sensor):
+        self.sensors.append((name, bus, addr, sensor))
+
+    def get(self, name, index=0):
+        """이름으로 드라이버 찾기 (같은 칩이 여러 개면 index번째, 없으면 None)"""
+        for entry in self.sensors:
+            if entry[0] == name:
+                if index == 0:
+                    return entry[3]
+                index -= 1
+        return None
+
+    def find_all(self, name):
+        """같은 이름의 드라이버 목록"""
+        return [entry[3] for entry in self.sensors if entry[0] == name]
+
+    def __iter__(self):
+        return iter(self.sensors)
+
+    def __len__(self):
+        return len(self.sensors)
+
+
+def identify(i2c, addr, chips=CHIPS, registry=None):
+    """응답한 주소의 칩 판별 (같은 레지스터는 한 번만 읽음)
+    :return: (칩 표 항목, 칩 ID) 또는 판별 실패 시 (None, None)
+    """
+    ids = {}
+    for chip in chips:
+        if addr not in chip[1]:
+            continue
+        register = chip[2]
+        if register not in ids:
+            try:
+                ids[register] = i2c.readfrom_mem(addr, register, 1)[0]
+            except OSError:
+                ids[register] = None
+            if registry is not None:
+                registry.id_reads += 1
+        if ids[register] == chip[3]:
+            return chip, ids[register]
+    return None, None
+
+
+def discover(buses, cache=None, start=True, chips=CHIPS):
+    """버스마다 한 번 스캔해서 알려진 센서의 드라이버 생성
+    :param buses: {버스 번호: I2C 객체}
+    :param cache: calib_cache.CalibrationCache (드라이버에 전달)
+    :param start: False면 드라이버를 ID 확인 상태로만 만들어 bringup.staged_bringup에 넘길 수 있음
+    :param chips: 칩 표 (기본값 CHIPS)
+    :return: SensorRegistry
+    """
+    registry = SensorRegistry()
+    known = set()
+    for chip in chips:
+        known.update(chip[1])
+
+    for bus, i2c in buses.items():
+        found = i2c.scan()
+        registry.scans += 1
+        for addr in found:
+            if addr not in known:
+                continue  # 칩 표에 없는 주소는 건드리지 않음
+            chip, chip_id = identify(i2c, addr, chips, registry)
+            if chip is not None:
+                registry.add(chip[0], bus, addr, chip[4](i2c, addr, chip_id, bus, cache, start))
+    return registry
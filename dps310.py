@@ -6,6 +6,9 @@ I2C 인터페이스를 통한 온도 및 기압 측정 지원
 import time
 from micropython import const
 
+from lib.dps310.coefficients import COEFFICIENT_BYTES, decode_coefficients
+from temperature_refresh import TemperatureRefresh
+
 # DPS310 레지스터 주소
 _DPS310_PROD_ID = const(0x0D)
 _DPS310_SPI_WRITE = const(0x00)
@@ -61,111 +64,143 @@ _DPS310_SENSOR_RDY = const(0x40)
 _DPS310_TMP_RDY = const(0x20)
 _DPS310_PRS_RDY = const(0x10)
 
+# FIFO 설정
+_DPS310_FIFO_EN = const(0x02)  # CFG_REG FIFO 활성화 비트
+_DPS310_FIFO_FLUSH = const(0x80)  # RESET 레지스터 FIFO 비우기 비트
+_DPS310_FIFO_EMPTY = const(0x01)
+_DPS310_FIFO_FULL = const(0x02)
+_DPS310_FIFO_SIZE = const(32)  # FIFO 항목 수 (항목당 3바이트)
+_DPS310_FIFO_EMPTY_VAL = const(0x800000)  # FIFO가 비었을 때 읽히는 값
+
+# 인터럽트 설정 (CFG_REG, INT_STS)
+_DPS310_INT_HL = const(0x80)  # 인터럽트 액티브 하이
+_DPS310_INT_TMP_EN = const(0x20)
+_DPS310_INT_PRS_EN = const(0x10)
+_DPS310_INT_PRS = const(0x01)
+_DPS310_INT_TMP = const(0x02)
+
 
 class DPS310:
     """DPS310 디지털 압력 센서 드라이버"""
 
-    def __init__(self, i2c, addr=0x77):
+    MEASUREMENT_TIMEOUT_MS = 2000  # 측정 결과 대기 한도 (1Hz 측정 주기 + 여유)
+
+    def __init__(self, i2c, addr=0x77, cache=None, bus=0, start=True):
         """
         DPS310 센서 초기화
         :param i2c: I2C 인터페이스 객체
         :param addr: 센서의 I2C 주소 (기본값 0x77)
+        :param cache: calib_cache.CalibrationCache (주면 보정 계수를 캐시에서 읽고 리셋 대기를 폴링으로 대체)
+        :param bus: 캐시 키로 쓰는 I2C 버스 번호
+        :param start: False면 ID 확인만 하고 리셋/보정/모드 설정은 호출자가 단계별로 수행
         """
         self.i2c = i2c
         self.addr = addr
+        self.cache = cache
+        self.bus = bus
         self.temp_scale = 524288.0  # 기본값 (1x 오버샘플링)
         self.press_scale = 524288.0  # 기본값 (1x 오버샘플링)
 
+        # 샘플마다 힙 할당이 생기지 않도록 고정 버퍼를 재사용
+        self._buf1 = bytearray(1)
+        self._buf3 = bytearray(3)
+        self._buf6 = bytearray(6)
+        self._fifo_buf = None  # enable_fifo()에서 할당
+        self._fifo_view = None
+        self._fifo_temp = None
+        self._irq_raw_temp = None
+        self.scaled_temp = None
+        self.temperature_refresh = TemperatureRefresh()  # 기본값: 매 샘플 온도 갱신
+
         # 센서 ID 확인
-        prod_id = self._read_byte(_DPS310_PROD_ID)
+        self.chip_id = prod_id = self._read_byte(_DPS310_PROD_ID)
         if prod_id != _DPS310_PROD_ID_VAL:
             raise RuntimeError("DPS310 센서를 찾을 수 없습니다. ID: %x" % prod_id)
 
+        if not start:
+            return  # 단계별 초기화 (bringup.staged_bringup)
+
         # 소프트 리셋 수행
-        self._reset()
+        self.reset()
 
         # 보정 계수 읽기
-        self._read_calibration()
+        self.load_calibration()
 
         # 기본 설정: 일반 모드
         self.set_normal_mode()
 
     def _read_byte(self, register):
         """레지스터에서 1바이트 읽기"""
-        result = self.i2c.readfrom_mem(self.addr, register, 1)
-        return result[0]
+        self.i2c.readfrom_mem_into(self.addr, register, self._buf1)
+        return self._buf1[0]
 
     def _write_byte(self, register, value):
         """레지스터에 1바이트 쓰기"""
-        self.i2c.writeto_mem(self.addr, register, bytes([value]))
+        self._buf1[0] = value
+        self.i2c.writeto_mem(self.addr, register, self._buf1)
 
     def _read_bytes(self, register, count):
         """레지스터에서 여러 바이트 읽기"""
         return self.i2c.readfrom_mem(self.addr, register, count)
 
-    def _reset(self):
-        """소프트 리셋 수행"""
+    def reset(self, wait=True):
+        """소프트 리셋 수행
+        :param wait: False면 리셋 명령만 보내고 바로 반환 (준비 대기는 wait_ready())
+        """
         self._write_byte(_DPS310_RESET, 0x89)
-        time.sleep_ms(200)  # 리셋 후 대기
+        if not wait:
+            return
+        if self.cache is None:
+            time.sleep_ms(200)  # 리셋 후 대기
+        else:
+            time.sleep_ms(2)  # 시작 시간
+            self.wait_ready()
+
+    def is_ready(self):
+        """리셋 후 센서 준비 완료 여부"""
+        status = self._read_byte(_DPS310_MEAS_CFG)
+        return bool(status & _DPS310_SENSOR_RDY) and bool(status & _DPS310_COEF_RDY)
+
+    def wait_ready(self, timeout_ms=200):
+        """준비 상태 폴링 (리셋 직후에는 I2C 응답이 없을 수 있음)"""
+        start = time.ticks_ms()
+        while time.ticks_diff(time.ticks_ms(), start) < timeout_ms:
+            try:
+                if self.is_ready():
+                    return
+            except OSError:
+                pass
+            time.sleep_ms(1)
+        raise RuntimeError("센서 준비 시간 초과")
+
+    def _cached_calibration(self, length):
+        """캐시에 저장된 보정 계수 바이트 (없으면 None)"""
+        if self.cache is None:
+            return None
+        return self.cache.get(self.bus, self.addr, self.chip_id, length)
+
+    def _store_calibration(self, data):
+        """NVM에서 읽은 보정 계수 바이트를 캐시에 저장"""
+        if self.cache is not None:
+            self.cache.put(self.bus, self.addr, self.chip_id, data)
+
+    def load_calibration(self):
+        """보정 계수 읽기 (리셋 후 준비가 끝난 다음 호출)"""
+        self._read_calibration()
 
     def _read_calibration(self):
-        """보정 계수 읽기"""
-        while True:
-            status = self._read_byte(_DPS310_MEAS_CFG)
-            if (status & _DPS310_SENSOR_RDY) and (status & _DPS310_COEF_RDY):
-                break
-            time.sleep_ms(5)
-        # 보정 계수 블록 읽기 (18바이트)
-        coef_data = self._read_bytes(_DPS310_COEF, 18)
-
-        # 보정 계수 추출
-        c0 = (coef_data[0] << 4) | (coef_data[1] >> 4)
-        if c0 & 0x0800:  # 음수 처리
-            c0 -= 0x1000
-
-        c1 = ((coef_data[1] & 0x0F) << 8) | coef_data[2]
-        if c1 & 0x0800:  # 음수 처리
-            c1 -= 0x1000
-
-        c00 = (coef_data[3] << 12) | (coef_data[4] << 4) | (coef_data[5] >> 4)
-        if c00 & 0x80000:  # 음수 처리
-            c00 -= 0x100000
-
-        c10 = ((coef_data[5] & 0x0000F) << 16) | (coef_data[6] << 8) | coef_data[7]
-        if c10 & 0x80000:  # 음수 처리
-            c10 -= 0x100000
-
-        c01 = ((coef_data[8] << 8) | coef_data[9])
-        if c01 & 0x8000:  # 음수 처리
-            c01 -= 0x10000
-
-        c11 = ((coef_data[10] << 8) | coef_data[11])
-        if c11 & 0x8000:  # 음수 처리
-            c11 -= 0x10000
-
-        c20 = ((coef_data[12] << 8) | coef_data[13])
-        if c20 & 0x8000:  # 음수 처리
-            c20 -= 0x10000
-
-        c21 = ((coef_data[14] << 8) | coef_data[15])
-        if c21 & 0x8000:  # 음수 처리
-            c21 -= 0x10000
-
-        c30 = ((coef_data[16] << 8) | coef_data[17])
-        if c30 & 0x8000:  # 음수 처리
-            c30 -= 0x10000
-
-        self.c0 = c0
-        self.c1 = c1
-        self.c00 = c00
-        self.c10 = c10
-        self.c01 = c01
-        self.c11 = c11
-        self.c20 = c20
-        self.c21 = c21
-        self.c30 = c30
-
-    def set_low_power_mode(self):
+        """보정 계수 읽기 (캐시가 있으면 캐시 사용)"""
+        data = self._cached_calibration(COEFFICIENT_BYTES)
+        if data is None:
+            self.wait_ready()  # 센서/계수 준비 (시간 초과 시 RuntimeError)
+            # 보정 계수 블록을 한 번에 읽어 공용 디코더로 해석 (18바이트)
+            data = self._read_bytes(_DPS310_COEF, COEFFICIENT_BYTES)
+            self._store_calibration(data)
+        self.coefficients = decode_coefficients(data)
+        (self.c0, self.c1, self.c00, self.c10, self.c01,
+         self.c11, self.c20, self.c21, self.c30) = self.coefficients
+
+    def set_low_power_mode(self, settle=True):
         """저전력 모드 설정
         - 온도: 1x 오버샘플링, 1Hz
         - 압력: 1x 오버샘플링, 1Hz
@@ -184,9 +219,10 @@ class DPS310:
         self.press_scale = 524288.0  # 1x 오버샘플링
 
         # 대기
-        time.sleep_ms(20)
+        if settle:
+            time.sleep_ms(20)
 
-    def set_normal_mode(self):
+    def set_normal_mode(self, settle=True):
         """일반 모드 설정
         - 온도: 16x 오버샘플링, 8Hz
         - 압력: 64x 오버샘플링, 8Hz
@@ -204,36 +240,161 @@ class DPS310:
         self.temp_scale = 253952.0  # 16x 오버샘플링
         self.press_scale = 1040384.0  # 64x 오버샘플링
         # 대기
-        time.sleep_ms(20)
+        if settle:
+            time.sleep_ms(20)
 
-    def read_raw_pressure(self):
-        """원시 압력 데이터 읽기"""
-        while True:
-            status = self._read_byte(_DPS310_MEAS_CFG)
-            if (status & _DPS310_SENSOR_RDY) and (status & _DPS310_PRS_RDY):
-                break
+    def _wait_result(self, mask):
+        """MEAS_CFG의 mask 비트가 모두 설 때까지 대기
+        가장 느린 측정 주기(1Hz)보다 긴 MEASUREMENT_TIMEOUT_MS 안에 준비되지 않으면 RuntimeError
+        """
+        start = time.ticks_ms()
+        while self._read_byte(_DPS310_MEAS_CFG) & mask != mask:
+            if time.ticks_diff(time.ticks_ms(), start) >= self.MEASUREMENT_TIMEOUT_MS:
+                raise RuntimeError("측정 시간 초과")
             time.sleep_ms(5)
 
-        data = self._read_bytes(_DPS310_PRS_B2, 3)
+    def set_temperature_refresh(self, every=None, period_ms=None):
+        """기압 측정 시 온도(scaled_temp) 갱신 주기 설정
+        :param every: 온도를 갱신할 샘플 간격 (period_ms만 주면 사용 안 함)
+        :param period_ms: 온도를 갱신할 최대 시간 간격 (ms)
+        둘 다 생략하면 매 샘플 갱신
+        """
+        self.temperature_refresh = TemperatureRefresh(every, period_ms)
+
+    def read_raw_pressure(self, wait=True):
+        """원시 압력 데이터 읽기
+        :param wait: False면 준비 상태 폴링 생략 (인터럽트로 준비가 확인된 경우)
+        """
+        if wait:
+            self._wait_result(_DPS310_SENSOR_RDY | _DPS310_PRS_RDY)
+
+        data = self._buf3
+        self.i2c.readfrom_mem_into(self.addr, _DPS310_PRS_B2, data)
         raw_pressure = (data[0] << 16) | (data[1] << 8) | data[2]
         if raw_pressure & 0x800000:  # 음수 처리
             raw_pressure -= 0x1000000
         return raw_pressure
 
-    def read_raw_temperature(self):
-        """원시 온도 데이터 읽기"""
-        while True:
-            status = self._read_byte(_DPS310_MEAS_CFG)
-            if (status & _DPS310_SENSOR_RDY) and (status & _DPS310_TMP_RDY):
-                break
-            time.sleep_ms(5)
+    def read_raw_temperature(self, wait=True):
+        """원시 온도 데이터 읽기
+        :param wait: False면 준비 상태 폴링 생략 (인터럽트로 준비가 확인된 경우)
+        """
+        if wait:
+            self._wait_result(_DPS310_SENSOR_RDY | _DPS310_TMP_RDY)
 
-        data = self._read_bytes(_DPS310_TMP_B2, 3)
+        data = self._buf3
+        self.i2c.readfrom_mem_into(self.addr, _DPS310_TMP_B2, data)
         raw_temperature = (data[0] << 16) | (data[1] << 8) | data[2]
         if raw_temperature & 0x800000:  # 음수 처리
             raw_temperature -= 0x1000000
         return raw_temperature
 
+    def enable_drdy_interrupt(self):
+        """측정 완료 인터럽트 활성화 (SDO/INT 핀, 액티브 하이)
+        - 압력/온도 측정이 끝날 때마다 인터럽트 발생
+        - I2C 모드에서는 SDO 핀이 인터럽트 출력으로 쓰인다
+        """
+        self._irq_raw_temp = None
+        value = self._read_byte(_DPS310_CFG_REG) & 0x0F  # 시프트/FIFO 비트 유지
+        self._write_byte(_DPS310_CFG_REG, value | _DPS310_INT_HL | _DPS310_INT_TMP_EN | _DPS310_INT_PRS_EN)
+
+    def disable_interrupt(self):
+        """인터럽트 해제"""
+        self._write_byte(_DPS310_CFG_REG, self._read_byte(_DPS310_CFG_REG) & 0x0F)
+
+    def handle_drdy(self):
+        """측정 완료 인터럽트 처리 (INT 핀 핸들러에서 호출)
+        INT_STS를 읽어 플래그를 해제하고, 준비된 결과만 폴링 없이 읽는다
+        원시 온도는 저장해 두었다가 다음 압력과 함께 compensate()로 보정
+        :return: (원시 압력, 원시 온도, 기압 hPa, 온도 °C) 또는 새 압력이 없으면 None
+        """
+        status = self._read_byte(_DPS310_INT_STS)
+        if status & _DPS310_INT_TMP:
+            self._irq_raw_temp = self.read_raw_temperature(wait=False)
+        if not status & _DPS310_INT_PRS or self._irq_raw_temp is None:
+            return None
+        raw_press = self.read_raw_pressure(wait=False)
+        raw_temp = self._irq_raw_temp
+        pressure, temperature = self.compensate(raw_press, raw_temp)
+        return raw_press, raw_temp, pressure, temperature
+
+    def enable_fifo(self):
+        """FIFO 모드 활성화
+        - 백그라운드 모드의 압력/온도 결과를 32항목 FIFO에 저장
+        - read_fifo()로 한 번에 읽어온다 (FIFO 모드에서는 temperature/pressure 대신 사용)
+        """
+        if self._fifo_buf is None:
+            self._fifo_buf = bytearray(_DPS310_FIFO_SIZE * 3)
+            self._fifo_view = memoryview(self._fifo_buf)
+        self._fifo_temp = None
+
+        self._write_byte(_DPS310_RESET, _DPS310_FIFO_FLUSH)
+        # 시프트 비트 등 다른 설정은 유지
+        self._write_byte(_DPS310_CFG_REG, self._read_byte(_DPS310_CFG_REG) | _DPS310_FIFO_EN)
+        self._write_byte(_DPS310_MEAS_CFG, _DPS310_BACKGROUND_MODE)
+
+    def disable_fifo(self):
+        """FIFO 모드 해제"""
+        self._write_byte(_DPS310_CFG_REG, self._read_byte(_DPS310_CFG_REG) & ~_DPS310_FIFO_EN)
+        self._write_byte(_DPS310_RESET, _DPS310_FIFO_FLUSH)
+
+    def fifo_full(self):
+        """FIFO가 가득 찼는지 여부 (가득 차면 새 결과는 버려짐)"""
+        return bool(self._read_byte(_DPS310_FIFO_STS) & _DPS310_FIFO_FULL)
+
+    def read_fifo(self):
+        """FIFO를 비우고 보정된 샘플 목록 반환
+        :return: [(기압 hPa, 온도 °C), ...] 오래된 것부터
+        각 압력 항목은 인덱스가 가장 가까운 온도 항목으로 보정
+        """
+        if self._fifo_buf is None:
+            raise RuntimeError("FIFO가 활성화되지 않았습니다. enable_fifo()를 먼저 호출하세요.")
+        view = self._fifo_view
+        count = 0
+        # PSR_B2~B0를 읽을 때마다 FIFO 항목이 하나씩 꺼내짐
+        while count < _DPS310_FIFO_SIZE:
+            entry = view[count * 3:count * 3 + 3]
+            self.i2c.readfrom_mem_into(self.addr, _DPS310_PRS_B2, entry)
+            if (entry[0] << 16) | (entry[1] << 8) | entry[2] == _DPS310_FIFO_EMPTY_VAL:
+                break
+            count += 1
+        return self._parse_fifo(self._fifo_buf, count)
+
+    def _parse_fifo(self, data, count):
+        """FIFO 항목 분류 (LSB 1 = 압력, 0 = 온도)"""
+        raws = []
+        temp_index = []
+        for i in range(count):
+            raw = (data[i * 3] << 16) | (data[i * 3 + 1] << 8) | data[i * 3 + 2]
+            if raw & 0x800000:  # 음수 처리
+                raw -= 0x1000000
+            raws.append(raw)
+            if not raw & 1:
+                temp_index.append(i)
+
+        samples = []
+        scaled_temp = self._fifo_temp  # 이전 배치의 마지막 온도
+        n = len(temp_index)
+        k = 0  # i 이후 첫 온도 항목 위치
+        for i in range(count):
+            raw = raws[i]
+            if not raw & 1:
+                k += 1
+                continue
+            # 앞뒤 온도 항목 중 인덱스가 가까운 쪽 선택 (같으면 앞쪽)
+            if k < n and (k == 0 or temp_index[k] - i < i - temp_index[k - 1]):
+                scaled_temp = float(raws[temp_index[k]]) / self.temp_scale
+            elif k > 0:
+                scaled_temp = float(raws[temp_index[k - 1]]) / self.temp_scale
+            if scaled_temp is None:
+                continue  # 보정할 온도가 아직 없음
+            pressure = self.compensate_pressure(raw, scaled_temp)
+            samples.append((pressure / 100.0, self.c0 * 0.5 + self.c1 * scaled_temp))
+
+        if n:
+            self._fifo_temp = float(raws[temp_index[-1]]) / self.temp_scale
+        return samples
+
     def compensate_temperature(self, raw_temp):
         """온도 보정 계산"""
         scaled_temp = float(raw_temp) / self.temp_scale
@@ -260,9 +421,51 @@ class DPS310:
 
     @property
     def pressure(self):
-        """보정된 기압 읽기 (hPa)"""
-        raw_temp = self.read_raw_temperature()
+        """보정된 기압 읽기 (hPa)
+        온도는 temperature_refresh 정책에 따라 갱신되고, 그 외에는 저장된 scaled_temp 사용
+        """
+        if self.temperature_refresh.due() or self.scaled_temp is None:
+            return self.read()[0]
+        pressure = self.compensate_pressure(self.read_raw_pressure(), self.scaled_temp)
+        return pressure / 100.0  # Pa -> hPa
+
+    def is_data_ready(self):
+        """새 압력/온도 결과가 모두 준비됐는지 확인 (대기 없음)"""
+        status = self._read_byte(_DPS310_MEAS_CFG)
+        return bool((status & _DPS310_SENSOR_RDY) and (status & _DPS310_PRS_RDY) and (status & _DPS310_TMP_RDY))
+
+    def read_raw_data(self, wait=True):
+        """원시 압력/온도 결과(0x00~0x05)를 한 번에 읽기
+        :param wait: False면 준비 상태 폴링 생략 (is_data_ready()로 이미 확인한 경우)
+        :return: (원시 압력, 원시 온도), 부호 있는 24비트 값
+        """
+        if wait:
+            self._wait_result(_DPS310_SENSOR_RDY | _DPS310_PRS_RDY | _DPS310_TMP_RDY)
+
+        data = self._buf6
+        self.i2c.readfrom_mem_into(self.addr, _DPS310_PRS_B2, data)
+        raw_pressure = (data[0] << 16) | (data[1] << 8) | data[2]
+        if raw_pressure & 0x800000:  # 음수 처리
+            raw_pressure -= 0x1000000
+        raw_temp = (data[3] << 16) | (data[4] << 8) | data[5]
+        if raw_temp & 0x800000:
+            raw_temp -= 0x1000000
+        return raw_pressure, raw_temp
+
+    def compensate(self, raw_pressure, raw_temp):
+        """원시 압력/온도를 함께 보정 (저장된 scaled_temp 갱신)
+        :return: (기압 hPa, 온도 °C)
+        """
         scaled_temp = float(raw_temp) / self.temp_scale
-        raw_pressure = self.read_raw_pressure()
+        self.scaled_temp = scaled_temp
         pressure = self.compensate_pressure(raw_pressure, scaled_temp)
-        return pressure / 100.0  # Pa -> hPa
\ No newline at end of file
+        return pressure / 100.0, self.c0 * 0.5 + self.c1 * scaled_temp  # Pa -> hPa
+
+    def read(self, wait=True):
+        """기압과 온도를 함께 읽기
+        준비 상태를 한 번만 확인하고 압력/온도 결과(0x00~0x05)를 한 번에 읽는다
+        :param wait: False면 준비 상태 폴링 생략 (is_data_ready()로 이미 확인한 경우)
+        :return: (기압 hPa, 온도 °C)
+        """
+        raw_pressure, raw_temp = self.read_raw_data(wait)
+        return self.compensate(raw_pressure, raw_temp)
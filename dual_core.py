@@ -0,0 +1,130 @@
+"""
+듀얼 코어 측정 엔진
+두 번째 코어(_thread)에서는 I2C 읽기와 원시 샘플 저장만 하고,
+코어 0에서는 보정 계산과 출력(고도 계산, 문자열 포맷)을 한다.
+두 코어는 sample_store.SampleRing(배열 열로 된 단일 생산자/단일 소비자 링 버퍼)으로 원시 샘플을 주고받는다.
+코어 1은 원시 값과 센서 번호를 쓰고, 코어 0은 꺼낸 뒤 보정한다.
+CPython에서는 같은 코드가 스레드(_thread)로 동작한다.
+
+센서는 is_data_ready(), read_raw_data(wait=False), compensate(raw_press, raw_temp)를
+제공해야 한다 (BMP280, BMP388, DPS310). 엔진이 동작하는 동안 코어 0에서 같은 센서의
+I2C 메서드를 호출하면 안 된다.
+
+사용 예:
+    engine = DualCoreEngine()
+    engine.add("BMP388", mgr.bmp388, 50)
+    engine.start()
+    while True:
+        for name, ts, p, t in engine.process():
+            ...
+"""
+import _thread
+import time
+
+from sample_store import Sample, SampleRing
+
+try:
+    from time import sleep_ms, ticks_ms, ticks_diff, ticks_add
+except ImportError:  # CPython: MicroPython과 같은 30비트 ticks
+    def sleep_ms(ms):
+        time.sleep(ms / 1000)
+
+    def ticks_ms():
+        return int(time.monotonic() * 1000) & 0x3FFFFFFF
+
+    def ticks_diff(a, b):
+        return ((a - b + 0x20000000) & 0x3FFFFFFF) - 0x20000000
+
+    def ticks_add(a, b):
+        return (a + b) & 0x3FFFFFFF
+
+
+class DualCoreEngine:
+    """코어 1에서 원시 샘플을 읽고 코어 0에서 보정하는 측정 엔진"""
+
+    def __init__(self, size=64):
+        """
+        :param size: 링 버퍼 크기 (샘플 수)
+        """
+        self.ring = SampleRing(size)
+        self._sample = Sample()  # process()에서 재사용 (코어 0 전용)
+        self.captured = 0  # 코어 1에서 읽은 샘플 수
+        self.errors = 0  # 코어 1에서 실패한 읽기 수
+        self._names = []
+        self._sensors = []
+        self._periods = []
+        self._running = False
+        self._stopped = True
+
+    def add(self, name, sensor, period_ms):
+        """측정할 센서 등록 (start() 전에 호출)
+        :param period_ms: 측정 주기 (ms)
+        """
+        if len(self._sensors) >= 256:
+            raise ValueError("센서는 최대 256개까지 등록할 수 있습니다.")
+        self._names.append(name)
+        self._sensors.append(sensor)
+        self._periods.append(period_ms)
+
+    def start(self):
+        """코어 1에서 측정 루프 시작"""
+        if self._running:
+            return
+        self._running = True
+        self._stopped = False
+        _thread.start_new_thread(self._capture_loop, ())
+
+    def stop(self, timeout_ms=1000):
+        """측정 루프 종료 요청 후 끝날 때까지 대기"""
+        self._running = False
+        start = ticks_ms()
+        while not self._stopped and ticks_diff(ticks_ms(), start) < timeout_ms:
+            sleep_ms(1)
+
+    def _capture_loop(self):
+        """코어 1: 마감 시각이 된 센서에서 원시 데이터를 읽어 링 버퍼에 저장"""
+        sensors = self._sensors
+        periods = self._periods
+        ring = self.ring
+        now = ticks_ms()
+        due = [now] * len(sensors)
+        try:
+            while self._running:
+                now = ticks_ms()
+                wait = 1000
+                for i in range(len(sensors)):
+                    late = ticks_diff(now, due[i])
+                    if late >= 0:
+                        sensor = sensors[i]
+                        try:
+                            ready = sensor.is_data_ready()
+                            if ready:
+                                raw_press, raw_temp = sensor.read_raw_data(wait=False)
+                                ring.append(now, raw_press, raw_temp, 0.0, 0.0, i)
+                                self.captured += 1
+                        except OSError:
+                            self.errors += 1
+                            ready = True
+                        if ready:
+                            # 한 주기 이상 밀렸으면 현재 시각 기준으로 다시 맞춤
+                            due[i] = ticks_add(due[i] if late < periods[i] else now, periods[i])
+                        else:
+                            due[i] = ticks_add(now, 1)  # 아직 변환 중이면 1ms 뒤 다시 확인
+                    wait = min(wait, ticks_diff(due[i], now))
+                if wait > 0:
+                    sleep_ms(wait)
+        finally:
+            self._stopped = True
+
+    def process(self):
+        """코어 0: 쌓인 원시 샘플을 모두 보정
+        :return: [(센서 이름, ticks_ms, 기압 hPa, 온도 °C), ...]
+        """
+        samples = []
+        sample = self.ring.pop(self._sample)
+        while sample is not None:
+            i = sample.sensor
+            pressure, temperature = self._sensors[i].compensate(sample.raw_pressure, sample.raw_temp)
+            samples.append((self._names[i], sample.ts, pressure, temperature))
+            sample = self.ring.pop(self._sample)
+        return samples
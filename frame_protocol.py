@@ -0,0 +1,195 @@
+"""
+바이너리 텔레메트리 프레임 프로토콜
+USB 시리얼로 print() 문자열 대신 고정 크기 바이너리 프레임을 보낸다.
+디바이스는 FrameWriter로 측정 루프에서 프레임을 쓰고, 호스트(CPython)는 FrameDecoder로
+pty/시리얼 장치나 파일 스트림을 복원한다. 동기 워드와 CRC16으로 프레임 경계를 다시 찾고,
+순번(seq)이 건너뛴 만큼 손실된 프레임으로 집계한다.
+
+프레임 형식 (리틀 엔디언, 17바이트):
+    동기 워드 b"\xAA\x55" | 순번 u16 | 센서 ID u8 | ticks_ms u32 | 기압 i32 | 온도 i16 | CRC16 u16
+    기압은 0.1 Pa, 온도는 0.01 °C 단위 정수, 센서 ID는 sensor_ids.SENSOR_*
+    CRC16은 CRC-16/CCITT-FALSE (다항식 0x1021, 초기값 0xFFFF), 순번부터 온도까지 계산
+
+호스트 수신:
+    python frame_protocol.py /dev/ttyACM0 [out.csv]
+"""
+try:
+    import struct
+except ImportError:
+    import ustruct as struct
+
+try:
+    from binascii import crc_hqx
+except ImportError:
+    crc_hqx = None
+
+import sys
+from array import array
+
+from sensor_ids import SENSOR_IDS, SENSOR_NAMES
+
+SYNC = b"\xAA\x55"
+_BODY = "<HBIih"
+_BODY_SIZE = struct.calcsize(_BODY)  # 13바이트
+FRAME_SIZE = len(SYNC) + _BODY_SIZE + 2  # 17바이트
+
+_table = None
+
+
+def crc16(data, crc=0xFFFF):
+    """CRC-16/CCITT-FALSE (CPython은 binascii.crc_hqx, MicroPython은 테이블 계산)"""
+    global _table
+    if crc_hqx is not None:
+        return crc_hqx(data, crc)
+    if _table is None:
+        _table = array('H', [0] * 256)
+        for i in range(256):
+            c = i << 8
+            for _ in range(8):
+                c = ((c << 1) ^ 0x1021) if c & 0x8000 else c << 1
+            _table[i] = c & 0xFFFF
+    table = _table
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ byte]
+    return crc
+
+
+class FrameWriter:
+    """측정 샘플을 프레임으로 스트림에 쓰는 디바이스 측 기록기"""
+
+    def __init__(self, stream=None):
+        """
+        :param stream: 출력 스트림 (기본값 sys.stdout.buffer, USB CDC)
+        """
+        if stream is None:
+            stream = getattr(sys.stdout, "buffer", sys.stdout)
+        self._stream = stream
+        self._buf = bytearray(FRAME_SIZE)  # 프레임마다 재사용
+        self._buf[0:len(SYNC)] = SYNC
+        self._body = memoryview(self._buf)[len(SYNC):FRAME_SIZE - 2]
+        self.seq = 0
+        self.frames = 0
+
+    def write(self, sensor, ts_ms, pressure_hpa, temperature_c):
+        """샘플 하나를 프레임으로 쓰기
+        :param sensor: 센서 ID (SENSOR_*) 또는 센서 이름 ('BMP388' 등)
+        :param ts_ms: 샘플 시각 (ticks_ms)
+        """
+        if not isinstance(sensor, int):
+            sensor = SENSOR_IDS[sensor]
+        buf = self._buf
+        struct.pack_into(_BODY, buf, len(SYNC), self.seq, sensor, ts_ms & 0xFFFFFFFF,
+                         int(round(pressure_hpa * 1000)), int(round(temperature_c * 100)))
+        struct.pack_into("<H", buf, FRAME_SIZE - 2, crc16(self._body))
+        self._stream.write(buf)
+        self.seq = (self.seq + 1) & 0xFFFF
+        self.frames += 1
+
+    def write_sample(self, sample):
+        """sample_store.Sample 하나를 프레임으로 쓰기 (sample.sensor는 센서 ID)"""
+        self.write(sample.sensor, sample.ts, sample.pressure, sample.temperature)
+
+
+class FrameDecoder:
+    """바이트 스트림에서 프레임을 복원하는 호스트 측 디코더
+
+    feed()에 임의 길이로 나뉜 바이트를 넣으면 완성된 프레임만 반환하고 남은 바이트는 보관한다.
+    CRC가 맞지 않으면 동기 워드 다음 바이트부터 다시 찾는다 (print() 출력이 섞여도 복구).
+    """
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._seq = None  # 마지막으로 받은 순번
+        self.frames = 0  # 정상 프레임 수
+        self.dropped = 0  # 순번이 건너뛴 만큼 손실된 프레임 수
+        self.crc_errors = 0
+        self.skipped = 0  # 동기를 찾느라 버린 바이트 수
+
+    def feed(self, data):
+        """바이트 추가 후 완성된 프레임 반환
+        :return: [(순번, 센서 ID, ticks_ms, 기압 hPa, 온도 °C), ...]
+        """
+        buf = self._buf
+        buf += data
+        frames = []
+        pos = 0
+        end = len(buf) - FRAME_SIZE
+        while pos <= end:
+            start = buf.find(SYNC, pos)
+            if start < 0 or start > end:
+                if start < 0:
+                    # 마지막 바이트가 동기 워드의 앞부분일 수 있으므로 남김
+                    start = len(buf) - 1 if buf[-1] == SYNC[0] else len(buf)
+                self.skipped += start - pos
+                pos = start
+                break
+            self.skipped += start - pos
+            body = start + len(SYNC)
+            crc = buf[FRAME_SIZE - 2 + start] | buf[FRAME_SIZE - 1 + start] << 8
+            if crc16(memoryview(buf)[body:body + _BODY_SIZE]) != crc:
+                self.crc_errors += 1
+                self.skipped += 1
+                pos = start + 1
+                continue
+            seq, sensor, ts, press, temp = struct.unpack_from(_BODY, buf, body)
+            if self._seq is not None:
+                self.dropped += (seq - self._seq - 1) & 0xFFFF
+            self._seq = seq
+            frames.append((seq, sensor, ts, press / 1000.0, temp / 100.0))
+            pos = start + FRAME_SIZE
+        del buf[:pos]
+        self.frames += len(frames)
+        return frames
+
+    def format_stats(self):
+        return (f"frames {self.frames} dropped {self.dropped} crc_errors {self.crc_errors} "
+                f"skipped {self.skipped} B")
+
+
+def receive(path, on_frames, chunk=4096):
+    """장치나 파일을 끝까지 읽어 프레임 디코딩 (호스트용)
+    터미널 장치(pty, /dev/ttyACM*)는 개행 변환이 없도록 raw 모드로 연다
+    :param on_frames: 프레임 목록을 받는 함수
+    :return: FrameDecoder (통계)
+    """
+    import os
+    decoder = FrameDecoder()
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOCTTY", 0))
+    try:
+        if os.isatty(fd):
+            import tty
+            tty.setraw(fd)
+        while True:
+            try:
+                data = os.read(fd, chunk)
+            except OSError:
+                break  # pty 송신 측이 닫힘 (EIO)
+            if not data:
+                break
+            frames = decoder.feed(data)
+            if frames:
+                on_frames(frames)
+    finally:
+        os.close(fd)
+    return decoder
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("사용법: python frame_protocol.py /dev/ttyACM0 [out.csv]")
+        sys.exit(1)
+    out = open(sys.argv[2], "w") if len(sys.argv) == 3 else sys.stdout
+    out.write("seq,sensor,ticks_ms,pressure_hpa,temperature_c\n")
+
+    def write_csv(frames):
+        for seq, sensor, ts, press, temp in frames:
+            out.write(f"{seq},{SENSOR_NAMES.get(sensor, sensor)},{ts},{press:.3f},{temp:.2f}\n")
+
+    try:
+        decoder = receive(sys.argv[1], write_csv)
+    except KeyboardInterrupt:
+        decoder = None
+    if out is not sys.stdout:
+        out.close()
+    if decoder is not None:
+        print(decoder.format_stats(), file=sys.stderr)
@@ -0,0 +1,85 @@
+"""
+인터럽트 기반 측정 수집
+센서의 데이터 준비 인터럽트(INT 핀) 상승 에지마다 샘플을 읽어 링 버퍼에 저장
+sleep_ms 폴링 없이 측정 완료 즉시 읽으므로 지연과 버스 폴링 트래픽이 줄어든다
+
+사용 예:
+    acq = IrqAcquisition(mgr.bmp388, Pin(2, Pin.IN))
+    acq.start()
+    while True:
+        for ts, p, t in acq.drain():
+            ...
+"""
+import time
+
+from sample_store import Sample, SampleRing
+
+
+class IrqAcquisition:
+    """INT 핀 인터럽트로 구동되는 샘플 수집기
+
+    sensor는 enable_drdy_interrupt(), disable_interrupt(), handle_drdy()를 제공해야 한다
+    (BMP388, DPS310). handle_drdy()는 (원시 압력, 원시 온도, 기압, 온도) 또는 None을 반환한다.
+    핸들러는 소프트 IRQ로 실행되어 I2C 접근이 가능하다.
+    샘플은 sample_store.SampleRing(ring)에 저장되므로 peek()/consume()으로 복사 없이 읽을 수도 있다.
+    버퍼가 가득 차면 새 샘플을 버리고 dropped를 증가시킨다 (읽는 쪽만 tail을 변경).
+    """
+
+    def __init__(self, sensor, pin, size=64):
+        """
+        :param sensor: 데이터 준비 인터럽트를 지원하는 센서 드라이버
+        :param pin: 센서 INT 핀에 연결된 입력 Pin 객체
+        :param size: 링 버퍼 크기 (샘플 수)
+        """
+        self.sensor = sensor
+        self.pin = pin
+        self.size = size
+        self.ring = SampleRing(size)  # 인터럽트 핸들러가 쓰고 읽는 쪽이 꺼냄
+        self.acquired = 0
+        self._sample = Sample()  # pop()에서 재사용
+
+    @property
+    def dropped(self):
+        """버퍼가 가득 차서 버린 샘플 수"""
+        return self.ring.dropped
+
+    def start(self):
+        """센서 인터럽트 활성화 및 핀 핸들러 등록"""
+        self.sensor.enable_drdy_interrupt()
+        self.pin.irq(trigger=self.pin.IRQ_RISING, handler=self._on_irq)
+
+    def stop(self):
+        """핀 핸들러 해제 및 센서 인터럽트 비활성화"""
+        self.pin.irq(handler=None)
+        self.sensor.disable_interrupt()
+
+    def _on_irq(self, pin):
+        """INT 핀 상승 에지 핸들러"""
+        sample = self.sensor.handle_drdy()
+        if sample is None:
+            return
+        raw_press, raw_temp, pressure, temperature = sample
+        if self.ring.append(time.ticks_ms(), raw_press, raw_temp, pressure, temperature):
+            self.acquired += 1
+
+    def available(self):
+        """버퍼에 쌓인 샘플 수"""
+        return self.ring.available()
+
+    def pop(self):
+        """가장 오래된 샘플 꺼내기
+        :return: (ticks_ms, 기압 hPa, 온도 °C) 또는 비어 있으면 None
+        """
+        sample = self.ring.pop(self._sample)
+        if sample is None:
+            return None
+        return sample.ts, sample.pressure, sample.temperature
+
+    def drain(self):
+        """쌓인 샘플을 모두 꺼내 목록으로 반환"""
+        samples = []
+        sample = self.pop()
+        while sample is not None:
+            samples.append(sample)
+            sample = self.pop()
+        return samples
@@ -1,3 +1,4 @@
+from .bmp280 import BMP280Coefficients
 from .bmp280_configuration import BMP280Configuration
 from .bmp280_i2c import BMP280I2C
 from .bmp280_spi import BMP280SPI
@@ -3,13 +3,26 @@
 from ustruct import unpack
 from utime import sleep_ms
 
+try:
+    from collections import namedtuple
+except ImportError:
+    from ucollections import namedtuple
+
 from .bmp280_configuration import BMP280Configuration
 
+BMP280Coefficients = namedtuple(
+    "BMP280Coefficients",
+    ("dig_T1", "dig_T2", "dig_T3", "dig_P1", "dig_P2", "dig_P3",
+     "dig_P4", "dig_P5", "dig_P6", "dig_P7", "dig_P8", "dig_P9")
+)
+
 
 class BMP280:
     """The 'base class' for the BMP280I2C and BMP280SPI classes."""
     
     def __init__(self, configuration):
+        # reused on every reading so measurements and measure_into do not allocate a new buffer per sample
+        self._rxdata = bytearray(6)
         self.configuration = configuration
 
     def _unpack(self, format_str, *args):
@@ -35,6 +48,10 @@ class BMP280:
         self._dig_P7 = self._unpack_signed_short(rxdata[19], rxdata[18])
         self._dig_P8 = self._unpack_signed_short(rxdata[21], rxdata[20])
         self._dig_P9 = self._unpack_signed_short(rxdata[23], rxdata[22])
+
+        self.coefficients = BMP280Coefficients(
+            self._dig_T1, self._dig_T2, self._dig_T3, self._dig_P1, self._dig_P2, self._dig_P3,
+            self._dig_P4, self._dig_P5, self._dig_P6, self._dig_P7, self._dig_P8, self._dig_P9)
         
     def _read_compensation_parameters(self):
         rxdata = self._read(0x88, 24)
@@ -59,13 +76,14 @@ class BMP280:
 
         return p / 100
 
-    def _calculate_temperature(self, adc_t):
+    def _calculate_t_fine(self, adc_t):
         var1 = (adc_t / 16384 - self._dig_T1 / 1024) * self._dig_T2
         var2 = ((adc_t / 131072 - self._dig_T1 / 8192) * (adc_t / 131072 - self._dig_T1 / 8192)) * self._dig_T3
-        t_fine = var1 + var2
-        t = (var1 + var2) / 5120
+        return var1 + var2
 
-        return t, t_fine
+    def _calculate_temperature(self, adc_t):
+        t_fine = self._calculate_t_fine(adc_t)
+        return t_fine / 5120, t_fine
 
     @property
     def configuration(self) -> BMP280Configuration:
@@ -132,6 +150,17 @@ class BMP280:
         self._write(0xf4, self._configuration.ctrl_meas)
         sleep_ms(5)  # Wait briefly so the changes can be applied
     
+    def _read_adc(self):
+        if self._configuration.power_mode == BMP280Configuration.POWER_MODE_FORCED:
+            self._write_ctrl_meas()
+
+        rxdata = self._rxdata
+        self._read_into(0xf7, rxdata)
+
+        p_adc = rxdata[0] << 12 | rxdata[1] << 4 | rxdata[2] >> 4
+        t_adc = rxdata[3] << 12 | rxdata[4] << 4 | rxdata[5] >> 4
+        return p_adc, t_adc
+
     @property
     def measurements(self) -> dict:
         """Get measurements
@@ -143,20 +172,27 @@ class BMP280:
         'p': pressure,
         'p_adc': the 'raw' pressure as produced by the ADC
         """
-        if self._configuration.power_mode == BMP280Configuration.POWER_MODE_FORCED:
-            self._write_ctrl_meas()
-
-        rxdata = self._read(0xf7, 6)
-
-        p_adc = rxdata[0] << 12 | rxdata[1] << 4 | rxdata[2] >> 4
-        t_adc = rxdata[3] << 12 | rxdata[4] << 4 | rxdata[5] >> 4
-
-        temperature = self._calculate_temperature(t_adc)
-        pressure = self._calculate_pressure(p_adc, temperature[1])
+        p_adc, t_adc = self._read_adc()
+        t_fine = self._calculate_t_fine(t_adc)
 
         return {
-            't': temperature[0],
+            't': t_fine / 5120,
             't_adc': t_adc,
-            'p': pressure,
+            'p': self._calculate_pressure(p_adc, t_fine),
             'p_adc': p_adc
         }
+
+    def measure_into(self, sample):
+        """Read a measurement into ``sample`` without building a dictionary
+
+        Fills the ``raw_pressure``, ``raw_temp``, ``pressure`` (hPa) and ``temperature`` fields of a
+        ``sample_store.Sample`` (or any object with those attributes) and returns it.
+        """
+        p_adc, t_adc = self._read_adc()
+        t_fine = self._calculate_t_fine(t_adc)
+
+        sample.raw_pressure = p_adc
+        sample.raw_temp = t_adc
+        sample.pressure = self._calculate_pressure(p_adc, t_fine)
+        sample.temperature = t_fine / 5120
+        return sample
@@ -17,3 +17,6 @@ class BMP280I2C(BMP280):
         
     def _read(self, register, nbytes):        
         return self._i2c.readfrom_mem(self._address, register, nbytes)
+
+    def _read_into(self, register, buf):
+        self._i2c.readfrom_mem_into(self._address, register, buf)
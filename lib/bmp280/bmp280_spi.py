@@ -9,6 +9,7 @@ class BMP280SPI(BMP280):
     def __init__(self, spi, cs, configuration=BMP280Configuration()):        
         self._cs = cs
         self._spi = spi
+        self._rxframe = bytearray(7)  # command byte + 6 measurement bytes, reused by _read_into
         super().__init__(configuration)
         self._read_compensation_parameters()
 
@@ -29,3 +30,11 @@ class BMP280SPI(BMP280):
         self._spi.readinto(rxdata, register)
         self._cs.value(1)
         return rxdata[1:]
+
+    def _read_into(self, register, buf):
+        rxdata = self._rxframe
+        self._cs.value(0)
+        self._spi.readinto(rxdata, register)
+        self._cs.value(1)
+        for index in range(len(buf)):
+            buf[index] = rxdata[index + 1]
@@ -0,0 +1,337 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 Bradley Robert Carlile
+#
+# SPDX-License-Identifier: MIT
+# MIT License
+# 
+# Copyright (c) 2024 Bradley Robert Carlile
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+"""
+`bme280`
+================================================================================
+
+MicroPython Driver for the Bosch BME280 pressure sensor (part of the `bmpxxx` family)
+
+* Author: Brad Carlile
+
+Based on
+
+* micropython-bmp581/bmp581py. Author(s): Jose D. Montoya
+
+"""
+import time
+
+from micropython import const
+
+from lib.bmp388.i2c_helpers import CBits, RegisterStruct
+from lib.bmp388.bmp280 import BMP280
+from lib.bmp388.bmpxxx import WORLD_AVERAGE_SEA_LEVEL_PRESSURE
+
+try:
+    import struct
+except ImportError:
+    import ustruct as struct
+
+# const() is substituted per module, so the shared register values and
+# settings used unqualified below are declared again here
+STANDBY = const(0x00)
+NORMAL = const(0x01)
+FORCED = const(0x02)
+OSR1 = const(0x00)
+OSR2 = const(0x01)
+OSR4 = const(0x02)
+OSR8 = const(0x03)
+OSR16 = const(0x04)
+_SOFTRESET = const(0xB6)  # same value for 585,581,390,280
+
+
+class BME280(BMP280):
+    """Driver for the BME280 Sensor connected over I2C.
+
+    :param ~machine.I2C i2c: The I2C bus the BMP280 is connected to.
+    :param int address: The I2C device address. Defaults to :const:`0x7F`
+    :param bool shadow: Keep shadow copies of the configuration registers. Defaults to :const:`False`
+
+    :raises RuntimeError: if the sensor is not found
+
+     **Quickstart: Importing and using the device**
+
+    .. code-block:: python
+
+        from machine import Pin, I2C
+        from micropython_bmpxxx import bmpxxx
+
+    Once this is done you can define your `machine.I2C` object and define your sensor object
+
+    .. code-block:: python
+
+        i2c = I2C(1, sda=Pin(2), scl=Pin(3))
+        bme = bmpxxx.BME280(i2c)
+
+    Now you have access to the attributes,
+    NOTE: ONLY this BME280 sensor has humidity measurements !!
+
+    .. code-block:: python
+
+        press = bme.pressure
+        temp = bme.temperature
+        humid = bme.humidity
+        dew = bme.dew_point
+
+        # Highest recommended resolution for bme280
+        bmp.pressure_oversample_rate = bmp.OSR16
+        bmp.temperature_oversample_rate = bmp.OSR2
+        meters = bmp.altitude
+    """
+    # Power Modes for BME280
+    power_mode_values = (STANDBY, FORCED, NORMAL)
+    BME280_NORMAL_POWER = const(0x03)
+    BME280_FORCED_POWER = const(0x01)
+
+    # oversampling rates
+    # Below we give OSR_SKIP a unique value 0x05, but will remap it to bmp280 values
+    # When we get       OSR1=0, OSR2=1, OSR4=2, OSR8=3, OSR16=4, OSR_SKIP=5
+    # input to BMP280,  OSR1=1, OSR2=2, OSR4=3, OSR8=4, OSR16=5, OSR_SKIP=0
+    # this will be translated in _translate_osr_bmp280
+    # OSR_SKIP = const(0x05)
+
+    # OSR_SKIP turns off sampling and we do not present it as setable from outside the driver
+    pressure_oversample_rate_values = (OSR1, OSR2, OSR4, OSR8, OSR16)
+    temperature_oversample_rate_values = (OSR1, OSR2, OSR4, OSR8, OSR16)
+
+    BMP280_I2C_ADDRESS_DEFAULT = 0x77
+    BMP280_I2C_ADDRESS_SECONDARY = 0x76
+
+    ###  BME280 Constants - notice very different than bmp581
+    _REG_WHOAMI_BME280 = const(0xd0)
+    _PWR_CTRL_BME280 = const(0x1b)
+    _HUMID_CONTROL_REGISTER_BME280 = const(0xF2)
+    _CONTROL_REGISTER_BME280 = const(0xF4)
+    _CONFIG_BME280 = const(0xf5)
+    _RESET_BME280 = const(0xe0)
+    _TRIM_COEFF_BME280 = const(0x88)
+    _TRIM_HUMDID_COEFF_BME280 = const(0xe1)
+    
+
+    _device_id = RegisterStruct(_REG_WHOAMI_BME280, "B")
+
+    _mode = CBits(2, _CONTROL_REGISTER_BME280, 0)
+    _pressure_oversample_rate = CBits(3, _CONTROL_REGISTER_BME280, 2)
+    _temperature_oversample_rate = CBits(3, _CONTROL_REGISTER_BME280, 5)
+    _humidity_oversample_rate = CBits(3, _HUMID_CONTROL_REGISTER_BME280, 0)
+    _humid_control_register = CBits(3, _HUMID_CONTROL_REGISTER_BME280, 0)
+    _control_register = CBits(8, _CONTROL_REGISTER_BME280, 0)
+    _config_register = CBits(8, _CONFIG_BME280, 0)
+    _reset_register = CBits(8, _RESET_BME280, 0)
+    _iir_coefficient = CBits(3, _CONFIG_BME280, 2)
+
+    # read pressure 0xf7, temp 0xfa, humidity 0xfd
+    _d = CBits(64, 0xf7, 0, 8)
+
+    # ctrl_hum (0xf2) through hum_lsb (0xfe)
+    _snapshot_windows = ((_HUMID_CONTROL_REGISTER_BME280, 13),)
+    _shadow_registers = (_HUMID_CONTROL_REGISTER_BME280, _CONTROL_REGISTER_BME280, _CONFIG_BME280)
+
+    def __init__(self, i2c, address: int = None, shadow: bool = False) -> None:
+        time.sleep_ms(3)  # t_powup done in 2ms
+
+        # If no address is provided, try the default, then secondary
+        if address is None:
+            if self._check_address(i2c, self.BME280_I2C_ADDRESS_DEFAULT):
+                address = self.BME280_I2C_ADDRESS_DEFAULT
+            elif self._check_address(i2c, self.BME280_I2C_ADDRESS_SECONDARY):
+                address = self.BME280_I2C_ADDRESS_SECONDARY
+            else:
+                raise RuntimeError("BME280 sensor not found at I2C expected address (0x77,0x76).")
+        else:
+            # Check if the specified address is valid
+            if not self._check_address(i2c, address):
+                raise RuntimeError(f"BME280 sensor not found at specified I2C address ({hex(address)}).")
+
+        self._i2c = i2c
+        self._address = address
+        if self._read_device_id() != 0x60:  # check _device_id after i2c established
+            raise RuntimeError("Failed to find the BME280 sensor with id 0x60")
+
+        self._reset_register_BME280 = _SOFTRESET
+        time.sleep_ms(5)  # soft reset finishes in ?ms
+        self._start_shadow(shadow)
+
+        self._read_calibration_bme280()
+
+        # To start measurements: temp OSR1, pressure OSR1 must be init with Normal power mode
+        # set all values at onc
+        self._config_register = 0x00
+        self._humid_control_register = self._translate_osr_bmp280(OSR1)
+        self._control_register = (self._translate_osr_bmp280(OSR1) << 5) + (
+                self._translate_osr_bmp280(OSR1) << 2) + BME280_NORMAL_POWER
+        _ = self.pressure
+
+        time.sleep_ms(4)  # mode change takes 3ms
+        time.sleep_ms(63)  # OSR can be take up to 62.5ms standby
+
+        self.t_fine = 0
+        self.sea_level_pressure = WORLD_AVERAGE_SEA_LEVEL_PRESSURE
+
+    def _read_calibration_bme280(self):
+        """
+        Read & save the calibration coefficients
+        Unpack data specified in string: "<<HhhHhhhhhhhh"
+            Little-endian (<), 16-bit unsigned (H), 16-bit unsigned (H), 8-bit signed (b), 16-bit signed (h)
+        """
+        coeff = self._i2c.readfrom_mem(self._address, _TRIM_COEFF_BME280, 26)
+        values = struct.unpack("<HhhHhhhhhhhhBB", coeff)
+        self.t1, self.t2, self.t3, self.p1, self.p2, self.p3, self.p4, self.p5, self.p6, self.p7, self.p8, self.p9, _, self.h1 = values
+
+        coeff = self._i2c.readfrom_mem(self._address, _TRIM_HUMDID_COEFF_BME280, 7)
+        values = struct.unpack("<hBbhb", coeff)
+        self.h2, self.h3, self.h4, self.h5, self.h6 = values
+        # convert h4, h5, allow for signed values
+        self.h4 = (self.h4 * 16) + (self.h5 & 0xF)
+        self.h5 //= 16
+
+        # values for one of sensors in comments, each sensor different
+        #         print(f"t1 (16-bit unsigned, H): {self.t1}")    # 27753
+        #         print(f"t2 (16-bit signed, h): {self.t2}")      # 26492
+        #         print(f"t3 (16-bit signed, h): {self.t3}")      # -1000
+        #         print(f"p1 (16-bit unsigned, H): {self.p1}")    # 37585
+        #         print(f"p2 (16-bit signed, h): {self.p2}")      # -10627
+        #         print(f"p3 (16-bit signed, h): {self.p3}")      # 3024
+        #         print(f"p4 (16-bit signed, h): {self.p4}")      # 9631
+        #         print(f"p5 (16-bit signed, h): {self.p5}")      # 119
+        #         print(f"p6 (16-bit signed, h): {self.p6}")      # -7
+        #         print(f"p7 (16-bit signed, h): {self.p7}")      # 15500
+        #         print(f"p8 (16-bit signed, h): {self.p8}")      # -14600
+        #         print(f"p9 (16-bit signed, h): {self.p9}")      # 6000
+        #         print(f"h1 (8-bit unsigned, B): {self.h1}")     # 75
+        #         print(f"h2 (16-bit signed, h): {self.h2}")      # 370
+        #         print(f"h3 (8-bit unsigned, B): {self.h3}")     # 0
+        #         print(f"h4 (16-bit signed, h): {self.h4}")      # 301
+        #         print(f"h5 (8-bit signed, b): {self.h5}")       # 50
+        return
+
+    def _get_raw_temp_pressure_humid(self):
+        raw_data = self._d
+        h_lsb = (raw_data >> 56) & 0xFF
+        h_msb = (raw_data >> 48) & 0xFF
+        t_xlsb = (raw_data >> 40) & 0xFF
+        t_lsb = (raw_data >> 32) & 0xFF
+        t_msb = (raw_data >> 24) & 0xFF
+        p_xlsb = (raw_data >> 16) & 0xFF
+        p_lsb = (raw_data >> 8) & 0xFF
+        p_msb = raw_data & 0xFF
+        self._p_raw = (p_msb << 12) | (p_lsb << 4) | (p_xlsb >> 4)
+        self._t_raw = (t_msb << 12) | (t_lsb << 4) | (t_xlsb >> 4)
+        self._h_raw = (h_msb << 8) | h_lsb
+        return self._t_raw, self._p_raw, self._h_raw
+
+    def _calculate_humidity_compensation_bme280(self, raw_temp: float, raw_humid: float) -> float:
+        var1 = (((raw_temp / 16384) - (self.t1 / 1024)) * self.t2)
+        var2 = ((((raw_temp / 131072) - (self.t1 / 8192)) *
+                 ((raw_temp / 131072) - (self.t1 / 8192))) * self.t3)
+        self.t_fine = int(var1 + var2)  # Store t_fine as an instance variable
+        
+        h = (self.t_fine - 76800.0)
+        h = ((raw_humid - (self.h4 * 64.0 + self.h5 / 16384.0 * h)) *
+             (self.h2 / 65536.0 * (1.0 + self.h6 / 67108864.0 * h *
+                                       (1.0 + self.h3 / 67108864.0 * h))))
+        humidity = h * (1.0 - self.h1 * h / 524288.0)
+        if (humidity < 0):
+            humidity = 0
+        if (humidity > 100):
+            humidity = 100.0
+        return humidity
+
+    @property
+    def temperature(self) -> float:
+        """
+        The temperature sensor in Celsius
+        :return: Temperature in Celsius
+        """
+        raw_temp, raw_pressure, raw_humid = self._get_raw_temp_pressure_humid()
+        return self._calculate_temperature_compensation_bmp280(raw_temp)
+
+    @property
+    def pressure(self) -> float:
+        """
+        The sensor pressure in hPa
+        :return: Pressure in hPa
+        """
+        raw_temp, raw_pressure, raw_humid = self._get_raw_temp_pressure_humid()
+        tempc = self._calculate_temperature_compensation_bmp280(raw_temp)
+        comp_press = self._calculate_pressure_compensation_bmp280(raw_pressure, tempc)
+        return comp_press / 100.0  # Convert to hPa
+    
+    @property
+    def humidity(self) -> float:
+        """
+        The sensor humidity in %
+        :return: humidity in %
+        """
+        raw_temp, raw_pressure, raw_humid = self._get_raw_temp_pressure_humid()
+        return self._calculate_humidity_compensation_bme280(raw_temp, raw_humid)
+
+    def _calculate_dew_point(self, temperature, humidity, pressure) -> float:
+        """
+        Dew-point calculator uses the Sonntag formula (1990) for water vapor pressure
+        https://www.weather.gov/media/epz/wxcalc/rhTdFromWetBulb.pdf
+       
+        Calculation first determines the saturation vapor pressure (es),
+        the wet-bulb vapor pressure (ew), then computes the actual vapor pressure (e)
+        using a correction factor involving station pressure.
+        Finally, relative humidity and dew point temperature are derived using logarithmic equations.
+ 
+        [Sonntag90] Sonntag D.: Important New Values of the Physical Constants of 1986,
+        Vapour Pressure Formulations based on the IST-90 and Psychrometer Formulae;
+        Z. Meteorol., 70 (5), pp. 340-344, 1990.
+        
+        :return: dew point in celsius
+        """
+        from math import exp, log  
+        # Constants from the paper (Sonntag, 1990)
+        a = 17.67
+        b  = 243.5
+
+        # Compute saturation vapor pressure (es first parenthetical) in hPa
+        # Compute actual vapor pressure (e - 2nd parenthetical) in hPa
+        # Apply pressure correction factor (3rd parenthetical)
+        corrected_e = (6.112 * exp((a * temperature) / (b + temperature))) * (humidity / 100.0) * (pressure / 1013.25)
+
+        # Compute dew point temperature (Td)
+        alpha = log(corrected_e / 6.112)
+        dew_point = (b * alpha) / (a - alpha)
+        return dew_point
+
+    @property
+    def dew_point(self) -> float:
+        """
+        example:
+        Sensor pressure = 1008.5769 hPa
+        temp = 20.06 C
+        humidity = 33.9%
+        dew_point = 3.62
+
+        :return: dew point in celsius
+        """
+        raw_temp, raw_pressure, raw_humid = self._get_raw_temp_pressure_humid()
+        t = self._calculate_temperature_compensation_bmp280(raw_temp)
+        p = (self._calculate_pressure_compensation_bmp280(raw_pressure, t))/100.0
+        h = self._calculate_humidity_compensation_bme280(raw_temp, raw_humid)    
+        return self._calculate_dew_point(t, h, p)
@@ -0,0 +1,374 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 Bradley Robert Carlile
+#
+# SPDX-License-Identifier: MIT
+# MIT License
+# 
+# Copyright (c) 2024 Bradley Robert Carlile
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+"""
+`bmp280`
+================================================================================
+
+MicroPython Driver for the Bosch BMP280 pressure sensor (part of the `bmpxxx` family)
+
+* Author: Brad Carlile
+
+Based on
+
+* micropython-bmp581/bmp581py. Author(s): Jose D. Montoya
+
+"""
+import time
+
+from micropython import const
+
+from lib.bmp388.i2c_helpers import CBits, RegisterStruct
+from lib.bmp388.bmp581 import BMP581
+from lib.bmp388.bmpxxx import WORLD_AVERAGE_SEA_LEVEL_PRESSURE
+
+try:
+    import struct
+except ImportError:
+    import ustruct as struct
+
+# const() is substituted per module, so the shared register values and
+# settings used unqualified below are declared again here
+STANDBY = const(0x00)
+NORMAL = const(0x01)
+FORCED = const(0x02)
+OSR1 = const(0x00)
+OSR2 = const(0x01)
+OSR4 = const(0x02)
+OSR8 = const(0x03)
+OSR16 = const(0x04)
+BMP390_NORMAL_POWER = const(0x03)
+_SOFTRESET = const(0xB6)  # same value for 585,581,390,280
+
+
+class BMP280(BMP581):
+    """Driver for the BMP280 Sensor connected over I2C.
+
+    :param ~machine.I2C i2c: The I2C bus the BMP280 is connected to.
+    :param int address: The I2C device address. Defaults to :const:`0x7F`
+    :param bool shadow: Keep shadow copies of the configuration registers. Defaults to :const:`False`
+
+    :raises RuntimeError: if the sensor is not found
+
+     **Quickstart: Importing and using the device**
+
+    .. code-block:: python
+
+        from machine import Pin, I2C
+        from micropython_bmpxxx import bmpxxx
+
+    Once this is done you can define your `machine.I2C` object and define your sensor object
+
+    .. code-block:: python
+
+        i2c = I2C(1, sda=Pin(2), scl=Pin(3))
+        bmp = bmpxxx.BMP280(i2c)
+
+    Now you have access to the attributes
+
+    .. code-block:: python
+
+        press = bmp.pressure
+        temp = bmp.temperature
+
+        # Highest recommended resolution for bmp280
+        bmp.pressure_oversample_rate = bmp.OSR16
+        bmp.temperature_oversample_rate = bmp.OSR2
+        meters = bmp.altitude
+    """
+    # Power Modes for BMP280
+    power_mode_values = (STANDBY, FORCED, NORMAL)
+    BMP280_NORMAL_POWER = const(0x03)
+    BMP280_FORCED_POWER = const(0x01)
+
+    # oversampling rates
+    # Below we give OSR_SKIP a unique value 0x05, but will remap it to bmp280 values
+    # When we get       OSR1=0, OSR2=1, OSR4=2, OSR8=3, OSR16=4, OSR_SKIP=5
+    # input to BMP280,  OSR1=1, OSR2=2, OSR4=3, OSR8=4, OSR16=5, OSR_SKIP=0
+    # this will be translated in _translate_osr_bmp280
+    OSR_SKIP = const(0x05)
+
+    # OSR_SKIP turns off sampling and we do not present it as setable from outside the driver
+    pressure_oversample_rate_values = (OSR1, OSR2, OSR4, OSR8, OSR16)
+    temperature_oversample_rate_values = (OSR1, OSR2, OSR4, OSR8, OSR16)
+
+    BMP280_I2C_ADDRESS_DEFAULT = 0x77
+    BMP280_I2C_ADDRESS_SECONDARY = 0x76
+
+    ###  BMP390 Constants - notice very different than bmp581
+    _REG_WHOAMI_BMP280 = const(0xd0)
+    _PWR_CTRL_BMP280 = const(0x1b)
+    _CONTROL_REGISTER_BMP280 = const(0xF4)
+    _CONFIG_BMP280 = const(0xf5)
+    _RESET_BMP280 = const(0xe0)
+    _TRIM_COEFF_BMP280 = const(0x88)
+
+    _device_id = RegisterStruct(_REG_WHOAMI_BMP280, "B")
+
+    _mode = CBits(2, _CONTROL_REGISTER_BMP280, 0)
+    _pressure_oversample_rate = CBits(3, _CONTROL_REGISTER_BMP280, 2)
+    _temperature_oversample_rate = CBits(3, _CONTROL_REGISTER_BMP280, 5)
+    _control_register = CBits(8, _CONTROL_REGISTER_BMP280, 0)
+    _config_register = CBits(8, _CONFIG_BMP280, 0)
+    _reset_register = CBits(8, _RESET_BMP280, 0)
+    _iir_coefficient = CBits(3, _CONFIG_BMP280, 2)
+
+    # read pressure 0xf7 and temp 0xfa
+    _d = CBits(48, 0xf7, 0, 6)
+
+    # ctrl_meas (0xf4) through temp_xlsb (0xfc)
+    _snapshot_windows = ((_CONTROL_REGISTER_BMP280, 9),)
+    _shadow_registers = (_CONTROL_REGISTER_BMP280, _CONFIG_BMP280)
+
+    def __init__(self, i2c, address: int = None, shadow: bool = False) -> None:
+        time.sleep_ms(3)  # t_powup done in 2ms
+
+        # If no address is provided, try the default, then secondary
+        if address is None:
+            if self._check_address(i2c, self.BMP280_I2C_ADDRESS_DEFAULT):
+                address = self.BMP280_I2C_ADDRESS_DEFAULT
+            elif self._check_address(i2c, self.BMP280_I2C_ADDRESS_SECONDARY):
+                address = self.BMP280_I2C_ADDRESS_SECONDARY
+            else:
+                raise RuntimeError("BMP280 sensor not found at I2C expected address (0x77,0x76).")
+        else:
+            # Check if the specified address is valid
+            if not self._check_address(i2c, address):
+                raise RuntimeError(f"BMP280 sensor not found at specified I2C address ({hex(address)}).")
+
+        self._i2c = i2c
+        self._address = address
+        if self._read_device_id() != 0x58:  # check _device_id after i2c established
+            raise RuntimeError("Failed to find the BMP280 sensor with id 0x58")
+
+        self._reset_register_BMP280 = _SOFTRESET
+        time.sleep_ms(5)  # soft reset finishes in ?ms
+        self._start_shadow(shadow)
+
+        self._read_calibration_bmp280()
+
+        # To start measurements: temp OSR1, pressure OSR1 must be init with Normal power mode
+        # set all values at onc
+        self._config_register = 0x00
+        self._control_register = (self._translate_osr_bmp280(OSR1) << 5) + (
+                self._translate_osr_bmp280(OSR1) << 2) + BMP280_NORMAL_POWER
+        _ = self.pressure
+
+        time.sleep_ms(4)  # mode change takes 3ms
+        time.sleep_ms(63)  # OSR can be take up to 62.5ms standby
+
+        self.t_fine = 0
+        self.sea_level_pressure = WORLD_AVERAGE_SEA_LEVEL_PRESSURE
+
+    def _read_calibration_bmp280(self):
+        """
+        Read & save the calibration coefficients
+        Unpack data specified in string: "<<HhhHhhhhhhhh"
+            Little-endian (<), 16-bit unsigned (H), 16-bit unsigned (H), 8-bit signed (b), 16-bit signed (h)
+        """
+        coeff = self._i2c.readfrom_mem(self._address, _TRIM_COEFF_BMP280, 24)
+        values = struct.unpack("<HhhHhhhhhhhh", coeff)
+        self.t1, self.t2, self.t3, self.p1, self.p2, self.p3, self.p4, self.p5, self.p6, self.p7, self.p8, self.p9 = values
+
+        # values for one of sensors in comments, each sensor different
+        #         print(f"t1 (16-bit unsigned, H): {self.t1}")    # 27753
+        #         print(f"t2 (16-bit signed, h): {self.t2}")      # 26492
+        #         print(f"t3 (16-bit signed, h): {self.t3}")      # -1000
+        #         print(f"p1 (16-bit unsigned, H): {self.p1}")    # 37585
+        #         print(f"p2 (16-bit signed, h): {self.p2}")      # -10627
+        #         print(f"p3 (16-bit signed, h): {self.p3}")      # 3024
+        #         print(f"p4 (16-bit signed, h): {self.p4}")      # 9631
+        #         print(f"p5 (16-bit signed, h): {self.p5}")      # 119
+        #         print(f"p6 (16-bit signed, h): {self.p6}")      # -7
+        #         print(f"p7 (16-bit signed, h): {self.p7}")      # 15500
+        #         print(f"p8 (16-bit signed, h): {self.p8}")      # -14600
+        #         print(f"p9 (16-bit signed, h): {self.p9}")      # 6000
+        return
+
+    def _translate_osr_bmp280(self, osr_value):
+        """ Map the constants to their corresponding values """
+        osr_map = {
+            OSR1: 1,    # OSR1=0 for other sensors, but 1 for bmp280
+            OSR2: 2,     # OSR2=1 for other sensors, but 2 for bmp280
+            OSR4: 3,     # OSR4=2 for other sensors, but 3 for bmp280
+            OSR8: 4,     # OSR8=3 for other sensors, but 4 for bmp280
+            OSR16: 5,    # OSR16=4 for other sensors, but 5 for bmp280
+            OSR_SKIP: 0  # OSR_SKIP=0 for bmp280, no other sensor has OSR_SKIP, we assigned it to 0x05
+        }
+        return osr_map.get(osr_value, 0)
+
+    @property
+    def power_mode(self) -> str:
+        """
+        Sensor power_mode
+        notice: Bosch BMP280/BMP390 and BMP581/BMP585 have different power mode  numbers
+        +-----------------------------+------------------+------------------------------+------------------+
+        | Mode   rest of classes      | Value            | BMP390/BMP280 Mode           | Value            |
+        +=============================+==================+==============================+==================+
+        | :py:const:`bmp58x.STANDBY`  | :py:const:`0x00` | :py:const:`bmp280.SLEEP`     | :py:const:`0x00` |
+        | :py:const:`bmp58x.NORMAL`   | :py:const:`0x01` | :py:const:`bmp280.FORCED_ALT`| :py:const:`0x01` |
+        | :py:const:`bmp58x.FORCED`   | :py:const:`0x02` | :py:const:`bmp280.FORCED`    | :py:const:`0x02` |
+        | :py:const:`bmp58x.NON_STOP` | :py:const:`0X03` | :py:const:`bmp280.NORMAL`    | :py:const:`0X03` |
+        +-----------------------------+------------------+------------------------------+------------------+
+        :return: power_mode as string
+        """
+        # Notice ordering is different only for BMP390 & BMP280
+        string_name = ("STANDBY", "FORCED", "FORCED", "NORMAL",)
+        return string_name[self._mode]
+
+    @power_mode.setter
+    def power_mode(self, value: int) -> None:
+        if value not in self.power_mode_values:
+            raise ValueError("Value must be a valid power_mode setting: STANDBY,FORCED,NORMAL")
+        if value == 0x01:  # NORMAL mode requested, change value to 0x03 for bmp390
+            value = BMP390_NORMAL_POWER
+        # if value == 0x02:  FORCED mode requested, no need to remap value
+        self._mode = value
+
+    @property
+    def pressure_oversample_rate(self) -> str:
+        """
+        Sensor pressure_oversample_rate
+        Oversampling extends the measurement time per measurement by the oversampling
+        factor. Higher oversampling factors offer decreased noise at the cost of
+        higher power consumption.
+        +---------------------------+------------------+---------------------------+------------------+
+        | Mode-for all other classes| Value            | BMP280 Mode                | Value            |
+        +===========================+==================+===========================+==================+
+        | :py:const:`bmp58x.OSR1`   | :py:const:`0x00` | :py:const:`OSR_SKIP'      | :py:const:`0x00` |
+        | :py:const:`bmp58x.OSR2`   | :py:const:`0x01` | :py:const:`bmp280.OSR1`   | :py:const:`0x01` |
+        | :py:const:`bmp58x.OSR4`   | :py:const:`0x02` | :py:const:`bmp280.OSR2`   | :py:const:`0x02` |
+        | :py:const:`bmp58x.OSR8`   | :py:const:`0x03` | :py:const:`bmp280.OSR4`   | :py:const:`0x03` |
+        | :py:const:`bmp58x.OSR16`  | :py:const:`0x04` | :py:const:`bmp280.OSR8``  | :py:const:`0x04` |
+        |                           |                  | :py:const:`bmp280.OSR16`  | :py:const:`0x05` |
+        +---------------------------+------------------+---------------------------+------------------+
+        :return: sampling rate as string
+        """
+        # Notice these are in the order and numbering that is appropriate for bmp280, which is different
+        # than the other sensors
+        string_name = ("OSR_SKIP", "OSR1", "OSR2", "OSR4", "OSR8", "OSR16",)
+        return string_name[self._pressure_oversample_rate]
+
+    @pressure_oversample_rate.setter
+    def pressure_oversample_rate(self, value: int) -> None:
+        if value not in self.pressure_oversample_rate_values:
+            raise ValueError("Value must be a valid pressure_oversample_rate: OSR_SKIP,OSR1,OSR2,OSR4,OSR8,OSR16")
+        # Get whole control register for temp Oversample (3-bit), pressure Oversample (3-bit), & powermode (2-bit)
+        current_control_register = self._control_register
+        # only update pressure oversample
+        current_control_register = (current_control_register & 0xe3) + (self._translate_osr_bmp280(value) << 2)
+        # Write whole control register at once
+        self._config_register = 0x00
+        self._control_register = current_control_register
+
+    @property
+    def temperature_oversample_rate(self) -> str:
+        """
+        Sensor temperature_oversample_rate
+        +---------------------------+------------------+---------------------------+------------------+
+        | Mode-for all other classes| Value            | BMP280 Mode                | Value            |
+        +===========================+==================+===========================+==================+
+        | :py:const:`bmp58x.OSR1`   | :py:const:`0x00` | :py:const:`OSR_SKIP'      | :py:const:`0x00` |
+        | :py:const:`bmp58x.OSR2`   | :py:const:`0x01` | :py:const:`bmp280.OSR1`   | :py:const:`0x01` |
+        | :py:const:`bmp58x.OSR4`   | :py:const:`0x02` | :py:const:`bmp280.OSR2`   | :py:const:`0x02` |
+        | :py:const:`bmp58x.OSR8`   | :py:const:`0x03` | :py:const:`bmp280.OSR4`   | :py:const:`0x03` |
+        | :py:const:`bmp58x.OSR16`  | :py:const:`0x04` | :py:const:`bmp280.OSR8``  | :py:const:`0x04` |
+        |                           |                  | :py:const:`bmp280.OSR16`  | :py:const:`0x05` |
+        +---------------------------+------------------+---------------------------+------------------+
+        :return: sampling rate as string
+        """
+        string_name = ("OSR_SKIP", "OSR1", "OSR2", "OSR4", "OSR8", "OSR16",)
+        return string_name[self._temperature_oversample_rate]
+
+    @temperature_oversample_rate.setter
+    def temperature_oversample_rate(self, value: int) -> None:
+        if value not in self.temperature_oversample_rate_values:
+            raise ValueError("Value must be a valid pressure_oversample_rate: OSR_SKIP,OSR1,OSR2,OSR4,OSR8,OSR16")
+        # Get current control register for temp Oversample (3-bit), pressure Oversample (3-bit), powermode (8-bit)
+        current_control_register = self._control_register
+        # only update temperature oversample
+        current_control_register = (current_control_register & 0x1f) + (self._translate_osr_bmp280(value) << 5)
+        # Write whole control register at once
+        self._config_register = 0x00
+        self._control_register = current_control_register
+
+    def _get_raw_temp_pressure(self):
+        raw_data = self._d
+        t_xlsb = (raw_data >> 40) & 0xFF
+        t_lsb = (raw_data >> 32) & 0xFF
+        t_msb = (raw_data >> 24) & 0xFF
+        p_xlsb = (raw_data >> 16) & 0xFF
+        p_lsb = (raw_data >> 8) & 0xFF
+        p_msb = raw_data & 0xFF
+        self._p_raw = (p_msb << 12) | (p_lsb << 4) | (p_xlsb >> 4)
+        self._t_raw = (t_msb << 12) | (t_lsb << 4) | (t_xlsb >> 4)
+        return self._t_raw, self._p_raw
+
+    def _calculate_temperature_compensation_bmp280(self, raw_temp: float) -> float:
+        var1 = (((raw_temp / 16384) - (self.t1 / 1024)) * self.t2)
+        var2 = ((((raw_temp / 131072) - (self.t1 / 8192)) *
+                 ((raw_temp / 131072) - (self.t1 / 8192))) * self.t3)
+        self.t_fine = int(var1 + var2)  # Store t_fine as an instance variable
+        tempc = (var1 + var2) / 5120.0
+        return tempc
+
+    def _calculate_pressure_compensation_bmp280(self, raw_pressure: float, tempc: float) -> float:
+        var1 = (self.t_fine / 2.0) - 64000
+        var2 = var1 * var1 * self.p6 / 32768
+        var2 += var1 * self.p5 * 2.0
+        var2 = (var2 / 4.0) + (self.p4 * 65536)
+        var1 = ((self.p3 * var1 * var1 / 524288) + (self.p2 * var1)) / 524288
+        var1 = (1.0 + var1 / 32768) * self.p1
+
+        if var1 == 0.0:
+            return 0  # Avoid division by zero
+
+        p = 1048576.0 - raw_pressure
+        p = (p - (var2 / 4096)) * 6250 / var1
+        var1 = self.p9 * p * p / 2147483648
+        var2 = p * self.p8 / 32768
+
+        return p + (var1 + var2 + self.p7) / 16.0
+
+    @property
+    def temperature(self) -> float:
+        """
+        The temperature sensor in Celsius
+        :return: Temperature in Celsius
+        """
+        raw_temp, raw_pressure = self._get_raw_temp_pressure()
+        return self._calculate_temperature_compensation_bmp280(raw_temp)
+
+    @property
+    def pressure(self) -> float:
+        """
+        The sensor pressure in hPa
+        :return: Pressure in hPa
+        """
+        raw_temp, raw_pressure = self._get_raw_temp_pressure()
+
+        tempc = self._calculate_temperature_compensation_bmp280(raw_temp)
+        comp_press = self._calculate_pressure_compensation_bmp280(raw_pressure, tempc)
+        return comp_press / 100.0  # Convert to hPa
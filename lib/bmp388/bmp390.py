@@ -0,0 +1,383 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 Bradley Robert Carlile
+#
+# SPDX-License-Identifier: MIT
+# MIT License
+# 
+# Copyright (c) 2024 Bradley Robert Carlile
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+"""
+`bmp390`
+================================================================================
+
+MicroPython Driver for the Bosch BMP390 pressure sensor (part of the `bmpxxx` family)
+
+* Author: Brad Carlile
+
+Based on
+
+* micropython-bmp581/bmp581py. Author(s): Jose D. Montoya
+
+"""
+import time
+
+from micropython import const
+
+from lib.bmp388.i2c_helpers import CBits, RegisterStruct, deferred_writes
+from lib.bmp388.bmp581 import BMP581
+from lib.bmp388.bmpxxx import WORLD_AVERAGE_SEA_LEVEL_PRESSURE
+
+try:
+    import struct
+except ImportError:
+    import ustruct as struct
+
+# const() is substituted per module, so the shared register values and
+# settings used unqualified below are declared again here
+OSR1 = const(0x00)
+OSR2 = const(0x01)
+OSR4 = const(0x02)
+OSR8 = const(0x03)
+OSR16 = const(0x04)
+OSR32 = const(0x05)
+_SOFTRESET = const(0xB6)  # same value for 585,581,390,280
+
+
+class BMP390(BMP581):
+    """Driver for the BMP390 Sensor connected over I2C.
+
+    :param ~machine.I2C i2c: The I2C bus the BMP390 is connected to.
+    :param int address: The I2C device address. Defaults to :const:`0x7F`
+    :param bool shadow: Keep shadow copies of the configuration registers. Defaults to :const:`False`
+
+    :raises RuntimeError: if the sensor is not found
+
+    **Quickstart: Importing and using the device**
+
+    .. code-block:: python
+
+        from machine import Pin, I2C
+        from micropython_bmpxxx import bmpxxx
+
+    Once this is done you can define your `machine.I2C` object and define your sensor object
+
+    .. code-block:: python
+
+        i2c = I2C(1, sda=Pin(2), scl=Pin(3))
+        bmp = bmpxxx.BMP390(i2c)
+
+    Now you have access to the attributes
+
+    .. code-block:: python
+
+        press = bmp.pressure
+        temp = bmp.temperature
+
+        # Highest recommended resolution for bmp390
+        bmp.pressure_oversample_rate = bmp.OSR32
+        bmp.temperature_oversample_rate = bmp.OSR2
+        meters = bmp.altitude
+
+    """
+    # Power Modes for BMP390
+    BMP390_SLEEP_POWER = const(0x00)  # aka  STANDBY for bmp585/bmp581
+    BMP390_FORCED_ALT_POWER = const(0x01)
+    BMP390_FORCED_POWER = const(0x02)
+    BMP390_NORMAL_POWER = const(0x03)
+    power_mode_values = (BMP390_SLEEP_POWER, BMP390_FORCED_ALT_POWER, BMP390_FORCED_POWER, BMP390_NORMAL_POWER)
+
+    # oversampling rates
+    pressure_oversample_rate_values = (OSR1, OSR2, OSR4, OSR8, OSR16, OSR32)
+    temperature_oversample_rate_values = (OSR1, OSR2, OSR4, OSR8, OSR16, OSR32)
+
+    # ODR_SEL page 38 Bosch Data sheet
+    BMP390_ODR_25 = const(0x03)  # ODR_25 Hz = 40ms
+
+    BMP390_I2C_ADDRESS_DEFAULT = 0x7f
+    BMP390_I2C_ADDRESS_SECONDARY = 0x7e
+
+    ###  BMP390 Constants - notice very different than bmp581
+    _REG_WHOAMI_BMP390 = const(0x00)
+    _CMD_BMP390 = const(0x7e)
+    _CONFIG_BMP390 = const(0x1f)
+    _ODR_CONFIG_BMP390 = const(0x1d)
+    _OSR_CONF_BMP390 = const(0x1c)
+    _PWR_CTRL_BMP390 = const(0x1b)
+    _TEMP_DATA_BMP390 = const(0x07)
+    _PRESS_DATA_BMP390 = const(0x04)
+    _TRIM_COEFF_BMP390 = const(0x31)
+
+    _device_id = RegisterStruct(_REG_WHOAMI_BMP390, "B")
+
+    _mode = CBits(2, _PWR_CTRL_BMP390, 4)
+    _temperature_enabled = CBits(1, _PWR_CTRL_BMP390, 1)
+    _pressure_enabled = CBits(1, _PWR_CTRL_BMP390, 0)
+    _control_register_BMP390 = CBits(8, _PWR_CTRL_BMP390, 0)
+    _cmd_register_BMP390 = CBits(8, _CMD_BMP390, 0)
+
+    _temperature_oversample_rate = CBits(3, _OSR_CONF_BMP390, 3)
+    _pressure_oversample_rate = CBits(3, _OSR_CONF_BMP390, 0)
+    _iir_coefficient = CBits(3, _CONFIG_BMP390, 1)
+    _output_data_rate = CBits(5, _ODR_CONFIG_BMP390, 0)
+    _temperature = CBits(24, _TEMP_DATA_BMP390, 0, 3)
+    _pressure = CBits(24, _PRESS_DATA_BMP390, 0, 3)
+
+    # Pressure and temperature data (0x04-0x09), and PWR_CTRL (0x1b) through CONFIG (0x1f).
+    # ERR_REG (0x02), EVENT (0x10) and INT_STATUS (0x11) clear on read and reading
+    # FIFO_DATA (0x14) pops the FIFO, so they stay outside.
+    _snapshot_windows = ((_PRESS_DATA_BMP390, 6), (_PWR_CTRL_BMP390, _CONFIG_BMP390 - _PWR_CTRL_BMP390 + 1))
+    _shadow_registers = (_PWR_CTRL_BMP390, _OSR_CONF_BMP390, _ODR_CONFIG_BMP390, _CONFIG_BMP390)
+
+    def __init__(self, i2c, address: int = None, shadow: bool = False) -> None:
+        time.sleep_ms(3)  # t_powup done in 2ms
+        # If no address is provided, try the default, then secondary
+        if address is None:
+            if self._check_address(i2c, self.BMP390_I2C_ADDRESS_DEFAULT):
+                address = self.BMP390_I2C_ADDRESS_DEFAULT
+            elif self._check_address(i2c, self.BMP390_I2C_ADDRESS_SECONDARY):
+                address = self.BMP390_I2C_ADDRESS_SECONDARY
+            else:
+                raise RuntimeError("BMP390 sensor not found at I2C expected address (0x7f,0x7e).")
+        else:
+            # Check if the specified address is valid
+            if not self._check_address(i2c, address):
+                raise RuntimeError(f"BMP390 sensor not found at specified I2C address ({hex(address)}).")
+
+
+        self._i2c = i2c
+        self._address = address
+        if self._read_device_id() != 0x60:  # check _device_id after i2c established
+            raise RuntimeError("Failed to find the BMP390 sensor with id=0x60")
+
+        self._cmd_register_BMP390 = _SOFTRESET
+        time.sleep_ms(5)  # soft reset finishes in ?ms
+        self._start_shadow(shadow)
+
+        with deferred_writes(self):
+            self._pressure_enabled = True
+            self._temperature_enabled = True
+            self._output_data_rate = BMP390_ODR_25
+        self._mode = BMP390_NORMAL_POWER
+        time.sleep_ms(4)  # mode change takes 3ms
+
+        self.sea_level_pressure = WORLD_AVERAGE_SEA_LEVEL_PRESSURE
+        self._read_calibration_bmp390()
+
+    def _read_calibration_bmp390(self):
+        """
+        Read & save the calibration coefficients
+        Unpack data specified in string: "<HHbhhbbHHbbhbb"
+            Little-endian (<), 16-bit unsigned (H), 16-bit unsigned (H), 8-bit signed (b), 16-bit signed (h)
+        """
+        coeff = self._i2c.readfrom_mem(self._address, _TRIM_COEFF_BMP390, 21)
+        values = struct.unpack("<HHbhhbbHHbbhbb", coeff)
+        self.t1, self.t2, self.t3, self.p1, self.p2, self.p3, self.p4, self.p5, self.p6, self.p7, self.p8, self.p9, self.p10, self.p11 = values
+
+        #         #values for one of sensors in comments, each sensor different
+        #         print(f"t1 (16-bit unsigned, H): {self.t1}")    # 27778
+        #         print(f"t2 (16-bit unsigned, H): {self.t2}")    # 19674
+        #         print(f"t3 (8-bit signed, b): {self.t3}")       # -7
+        #         print(f"p1 (16-bit signed, h): {self.p1}")      # 7174
+        #         print(f"p2 (16-bit signed, h): {self.p2}")      # 5507
+        #         print(f"p3 (8-bit signed, b): {self.p3}")       # 6
+        #         print(f"p4 (8-bit signed, b): {self.p4}")       # 1
+        #         print(f"p5 (16-bit unsigned, H): {self.p5}")    # 19311
+        #         print(f"p6 (16-bit unsigned, H): {self.p6}")    # 24165
+        #         print(f"p7 (8-bit signed, b): {self.p7}")       # 3
+        #         print(f"p8 (8-bit signed, b): {self.p8}")       # -6
+        #         print(f"p9 (16-bit signed, h): {self.p9}")      # 4017
+        #         print(f"p10 (8-bit signed, b): {self.p10}")     # 7 
+        #         print(f"p11 (8-bit signed, b): {self.p11}")     # -11
+
+        # scaled coefficients (datasheet 8.4), computed once instead of on every sample
+        self.par_t1 = self.t1 * 2 ** 8
+        self.par_t2 = self.t2 / 2 ** 30
+        self.par_t3 = self.t3 / 2 ** 48
+        self.par_p1 = (self.p1 - 2 ** 14) / 2 ** 20
+        self.par_p2 = (self.p2 - 2 ** 14) / 2 ** 29
+        self.par_p3 = self.p3 / 2 ** 32
+        self.par_p4 = self.p4 / 2 ** 37
+        self.par_p5 = self.p5 * 2 ** 3
+        self.par_p6 = self.p6 / 2 ** 6
+        self.par_p7 = self.p7 / 2 ** 8
+        self.par_p8 = self.p8 / 2 ** 15
+        self.par_p9 = self.p9 / 2 ** 48
+        self.par_p10 = self.p10 / 2 ** 48
+        self.par_p11 = self.p11 / 2 ** 65
+        self._kernel_tempc = None
+        return
+
+    @property
+    def power_mode(self) -> str:
+        """
+        Sensor power_mode
+        notice: Bosch BMP280/BMP390 and BMP581/BMP585 have different power mode  numbers
+        +-----------------------------+------------------+------------------------------+------------------+
+        | Mode   rest of classes      | Value            | BMP390/BMP280 Mode           | Value            |
+        +=============================+==================+==============================+==================+
+        | :py:const:`bmp58x.STANDBY`  | :py:const:`0x00` | :py:const:`bmp390.SLEEP`     | :py:const:`0x00` |
+        | :py:const:`bmp581.NORMAL`   | :py:const:`0x01` | :py:const:`bmp390.FORCED_ALT`| :py:const:`0x01` |
+        | :py:const:`bmp58x.FORCED`   | :py:const:`0x02` | :py:const:`bmp390.FORCED`    | :py:const:`0x02` |
+        | :py:const:`bmp58x.NON_STOP` | :py:const:`0X03` | :py:const:`bmp390.NORMAL`    | :py:const:`0X03` |
+        +-----------------------------+------------------+------------------------------+------------------+
+        :return: power_mode as string
+        """
+        # Notice ordering is different only for BMP390 & BMP280
+        string_name = ("STANDBY", "FORCED", "FORCED", "NORMAL",)
+        return string_name[self._mode]
+
+    @power_mode.setter
+    def power_mode(self, value: int) -> None:
+        if value not in self.power_mode_values:
+            raise ValueError("Value must be a valid power_mode setting: STANDBY,FORCED,NORMAL")
+        if value == 0x01:  # NORMAL mode requested, change value to 0x03 for bmp390
+            value = BMP390_NORMAL_POWER
+        # if value == 0x02:  FORCED mode requested, no need to remap value
+        self._mode = value
+
+    @property
+    def pressure_oversample_rate(self) -> str:
+        """
+        Sensor pressure_oversample_rate
+        Oversampling extends the measurement time per measurement by the oversampling
+        factor. Higher oversampling factors offer decreased noise at the cost of
+        higher power consumption.
+        +---------------------------+------------------+
+        | Mode                      | Value            |
+        +===========================+==================+
+        | :py:const:`bmp390.OSR1`   | :py:const:`0x00` |
+        | :py:const:`bmp390.OSR2`   | :py:const:`0x01` |
+        | :py:const:`bmp390.OSR4`   | :py:const:`0x02` |
+        | :py:const:`bmp390.OSR8`   | :py:const:`0x03` |
+        | :py:const:`bmp390.OSR16`  | :py:const:`0x04` |
+        | :py:const:`bmp390.OSR32`  | :py:const:`0x05` |
+        +---------------------------+------------------+
+        :return: sampling rate as string
+        """
+        string_name = ("OSR1", "OSR2", "OSR4", "OSR8", "OSR16", "OSR32",)
+        return string_name[self._pressure_oversample_rate]
+
+    @pressure_oversample_rate.setter
+    def pressure_oversample_rate(self, value: int) -> None:
+        if value not in self.pressure_oversample_rate_values:
+            raise ValueError("Value must be a valid pressure_oversample_rate: OSR1,OSR2,OSR4,OSR8,OSR16,OSR32")
+        self._pressure_oversample_rate = value
+
+    @property
+    def temperature_oversample_rate(self) -> str:
+        """
+        Sensor temperature_oversample_rate
+        debug? if set OSR32, my temp/pressure do not change, so debug or only use OSR16
+        I've seen this in other drivers
+        +---------------------------+------------------+
+        | Mode                      | Value            |
+        +===========================+==================+
+        | :py:const:`bmp390.OSR1`   | :py:const:`0x00` |
+        | :py:const:`bmp390.OSR2`   | :py:const:`0x01` |
+        | :py:const:`bmp390.OSR4`   | :py:const:`0x02` |
+        | :py:const:`bmp390.OSR8`   | :py:const:`0x03` |
+        | :py:const:`bmp390.OSR16`  | :py:const:`0x04` |
+        | :py:const:`bmp390.OSR32`  | :py:const:`0x05` | * debug: sensor may not update?
+        +---------------------------+------------------+
+        :return: sampling rate as string
+        """
+        string_name = ("OSR1", "OSR2", "OSR4", "OSR8", "OSR16", "OSR32",)
+        return string_name[self._temperature_oversample_rate]
+
+    @temperature_oversample_rate.setter
+    def temperature_oversample_rate(self, value: int) -> None:
+        if value not in self.temperature_oversample_rate_values:
+            raise ValueError(
+                "Value must be a valid temperature_oversample_rate: OSR1,OSR2,OSR4,OSR8,OSR16,OSR32")
+        self._temperature_oversample_rate = value
+
+    @property
+    def iir_coefficient(self) -> str:
+        """
+        Sensor iir_coefficient
+
+        Bosch datasheet bmp390 4.3.21 Register 0x1F "CONFIG" uses thse names
+        Datasheet in 3.4.4, refers to the IIR filter coefficients using coefficient+1
+        IIR filter coefficient 4 is "COEF_3",  IIR filter coefficient 8 is"COEF_7"
+        +----------------------------+------------------+------------------+
+        | Mode                       | Value 4.3.21     | Value  3.4.4     |
+        +============================+==================+==================+
+        | :py:const:`bmpxxx.COEF_0`  | :py:const:`0x00` |        0         |
+        | :py:const:`bmpxxx.COEF_1`  | :py:const:`0x01` |        2         |
+        | :py:const:`bmpxxx.COEF_3`  | :py:const:`0x02` |        4         |
+        | :py:const:`bmpxxx.COEF_7`  | :py:const:`0x03` |        8         |
+        | :py:const:`bmpxxx.COEF_15` | :py:const:`0x04` |       16         |
+        | :py:const:`bmpxxx.COEF_31` | :py:const:`0x05` |       32         |
+        | :py:const:`bmpxxx.COEF_63` | :py:const:`0x06` |       64         |
+        | :py:const:`bmpxxx.COEF_127`| :py:const:`0x07` |      128         |
+        +----------------------------+------------------+------------------+
+        :return: coefficients as string
+        """
+        values = ("COEF_0", "COEF_1", "COEF_3", "COEF_7", "COEF_15", "COEF_31", "COEF_63", "COEF_127",)
+        return values[self._iir_coefficient]
+
+    @iir_coefficient.setter
+    def iir_coefficient(self, value: int) -> None:
+        if value not in self.iir_coefficient_values:
+            raise ValueError(
+                "Value must be a valid iir_coefficients: COEF_0,COEF_1,COEF_3,COEF_7,COEF_15,COEF_31,COEF_63,COEF_127")
+        self._iir_coefficient = value
+
+    # Helper method for temperature compensation
+    def _calculate_temperature_compensation(self, raw_temp: float) -> float:
+        partial_data1 = float(raw_temp - self.par_t1)
+        return partial_data1 * (self.par_t2 + partial_data1 * self.par_t3)
+
+    # Helper method for pressure compensation
+    def _calculate_pressure_compensation(self, raw_pressure: float, tempc: float) -> float:
+        # the temperature dependent terms only change with tempc, so they are cached
+        if tempc != self._kernel_tempc:
+            self._update_pressure_terms(tempc)
+        # offset + sensitivity * p + (p9 + p10 * t) * p^2 + p11 * p^3, in Horner form
+        return self._offset + raw_pressure * (
+            self._sensitivity + raw_pressure * (self._quadratic + raw_pressure * self.par_p11))
+
+    def _update_pressure_terms(self, tempc: float) -> None:
+        self._offset = self.par_p5 + tempc * (self.par_p6 + tempc * (self.par_p7 + tempc * self.par_p8))
+        self._sensitivity = self.par_p1 + tempc * (self.par_p2 + tempc * (self.par_p3 + tempc * self.par_p4))
+        self._quadratic = self.par_p9 + tempc * self.par_p10
+        self._kernel_tempc = tempc
+
+    @property
+    def temperature(self) -> float:
+        """
+        The temperature sensor in Celsius
+        :return: Temperature in Celsius
+        """
+        raw_temp = self._temperature
+        return self._calculate_temperature_compensation(raw_temp)
+
+    @property
+    def pressure(self) -> float:
+        """
+        The sensor pressure in hPa
+        :return: Pressure in hPa
+        """
+        raw_pressure = float(self._pressure)
+        raw_temp = float(self._temperature)
+
+        tempc = self._calculate_temperature_compensation(raw_temp)
+        comp_press = self._calculate_pressure_compensation(raw_pressure, tempc)
+        return comp_press / 100.0  # Convert to hPa
@@ -0,0 +1,138 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 Bradley Robert Carlile
+#
+# SPDX-License-Identifier: MIT
+# MIT License
+# 
+# Copyright (c) 2024 Bradley Robert Carlile
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+"""
+`bmp585`
+================================================================================
+
+MicroPython Driver for the Bosch BMP585 pressure sensor (part of the `bmpxxx` family)
+
+* Author: Brad Carlile
+
+Based on
+
+* micropython-bmp581/bmp581py. Author(s): Jose D. Montoya
+
+"""
+import time
+
+from micropython import const
+
+from lib.bmp388.i2c_helpers import CBits, deferred_writes
+from lib.bmp388.bmp581 import BMP581
+from lib.bmp388.bmpxxx import WORLD_AVERAGE_SEA_LEVEL_PRESSURE
+
+# const() is substituted per module, so the shared register values and
+# settings used unqualified below are declared again here
+STANDBY = const(0x00)
+NORMAL = const(0x01)
+COEF_0 = const(0x00)
+_SOFTRESET = const(0xB6)  # same value for 585,581,390,280
+
+
+class BMP585(BMP581):
+    """Driver for the BMP585 Sensor connected over I2C.
+
+    :param ~machine.I2C i2c: The I2C bus the BMP585 is connected to.
+    :param int address: The I2C device address. Defaults to :const:`0x47`
+    :param bool shadow: Keep shadow copies of the configuration registers. Defaults to :const:`False`
+
+    :raises RuntimeError: if the sensor is not found
+
+    **Quickstart: Importing and using the device**
+
+    .. code-block:: python
+
+        from machine import Pin, I2C
+        from micropython_bmpxxx import bmpxxx
+
+    Once this is done you can define your `machine.I2C` object and define your sensor object
+
+    .. code-block:: python
+
+        i2c = I2C(1, sda=Pin(2), scl=Pin(3))
+        bmp = bmpxxx.BMP585(i2c)
+
+    Now you have access to the attributes
+
+    .. code-block:: python
+
+        press = bmp.pressure
+        temp = bmp.temperature
+
+        # Highest recommended resolution for bmp585
+        bmp.pressure_oversample_rate = bmp.OSR128
+        bmp.temperature_oversample_rate = bmp.OSR8
+        meters = bmp.altitude
+
+    """
+    BMP585_I2C_ADDRESS_DEFAULT = 0x47
+    BMP585_I2C_ADDRESS_SECONDARY = 0x46
+
+    _CMD_BMP585 = const(0x7e)
+    _cmd_register_BMP585 = CBits(8, _CMD_BMP585, 0)
+
+    def __init__(self, i2c, address: int = None, shadow: bool = False) -> None:
+        time.sleep_ms(3)  # t_powup done in 2ms
+
+        # If no address is provided, try the default, then secondary
+        if address is None:
+            if self._check_address(i2c, self.BMP585_I2C_ADDRESS_DEFAULT):
+                address = self.BMP585_I2C_ADDRESS_DEFAULT
+            elif self._check_address(i2c, self.BMP585_I2C_ADDRESS_SECONDARY):
+                address = self.BMP585_I2C_ADDRESS_SECONDARY
+            else:
+                raise RuntimeError("BMP585 sensor not found at I2C expected address (0x47,0x46).")
+        else:
+            # Check if the specified address is valid
+            if not self._check_address(i2c, address):
+                raise RuntimeError(f"BMP585 sensor not found at specified I2C address ({hex(address)}).")
+
+        self._i2c = i2c
+        self._address = address
+        if self._read_device_id() != 0x51:  # check _device_id after i2c established
+            raise RuntimeError("Failed to find the BMP585 sensor")
+
+        self._cmd_register_BMP585 = _SOFTRESET
+        time.sleep_ms(5)  # soft reset finishes in 2ms
+        self._start_shadow(shadow)
+
+        # Must be in STANDBY to initialize _iir_coefficient    
+        self._power_mode = STANDBY
+        time.sleep_ms(5)  # mode change takes 4ms
+        with deferred_writes(self):
+            self._pressure_enabled = True
+            self._temperature_oversample_rate = self.OSR1  # Default oversampling
+            self._pressure_oversample_rate = self.OSR1  # Default oversampling
+            self._iir_coefficient = COEF_0
+            self._iir_temp_coefficient = COEF_0
+        self._power_mode = NORMAL
+        time.sleep_ms(5)  # mode change takes 4ms
+        #         self._write_reg(0x18, 0x01)  # Enable data ready interrupts
+        #         val = self._read_reg(0x27, 1)[0]  # Read Interrupt Status Register
+        #         drdy_data_reg = (val & 0x01) != 0  # Check Data Ready bit
+        # 
+        #         print(f"{drdy_data_reg=}")
+        self.sea_level_pressure = WORLD_AVERAGE_SEA_LEVEL_PRESSURE
@@ -44,6 +44,163 @@ SOFTWARE.
 import struct
 
 
+class RegisterSnapshot:
+    """
+    Register windows, each read in one burst. While loaded, descriptor reads that
+    fall inside a window are served from its buffer instead of the bus, until
+    :meth:`invalidate` is called or a descriptor writes into a window.
+    Keep clear-on-read registers (interrupt status, FIFO data) out of the windows:
+    the burst would acknowledge or pop them as a side effect.
+    """
+
+    def __init__(self, *windows) -> None:
+        self.windows = windows
+        self.views = [memoryview(bytearray(length)) for _, length in windows]
+        self.valid = False
+        self.bursts = 0
+        self.hits = 0
+
+    def load(self, obj) -> None:
+        for (start, _), view in zip(self.windows, self.views):
+            obj._i2c.readfrom_mem_into(obj._address, start, view)
+            self.bursts += 1
+        self.valid = True
+
+    def invalidate(self) -> None:
+        self.valid = False
+
+    def lookup(self, register: int, length: int):
+        if not self.valid:
+            return None
+        for (start, size), view in zip(self.windows, self.views):
+            offset = register - start
+            if offset >= 0 and offset + length <= size:
+                self.hits += 1
+                return view[offset:offset + length]
+        return None
+
+    def overlaps(self, register: int, length: int) -> bool:
+        for start, size in self.windows:
+            if register < start + size and register + length > start:
+                return True
+        return False
+
+    @property
+    def saved(self) -> int:
+        """Bus transactions avoided: buffered descriptor reads minus the bursts that filled the buffers"""
+        return self.hits - self.bursts
+
+
+def _read(obj, register: int, length: int):
+    snapshot = getattr(obj, "_snapshot", None)
+    if snapshot is not None:
+        data = snapshot.lookup(register, length)
+        if data is not None:
+            return data
+    return obj._i2c.readfrom_mem(obj._address, register, length)
+
+
+def _write(obj, register: int, data) -> None:
+    obj._i2c.writeto_mem(obj._address, register, data)
+    snapshot = getattr(obj, "_snapshot", None)
+    if snapshot is not None and snapshot.overlaps(register, len(data)):
+        snapshot.invalidate()
+
+
+class ShadowRegisters:
+    """
+    Last value written to each single-byte configuration register of one device.
+    Construction fails with ValueError if any CBits or RegisterStruct of the device
+    reads or writes a shadowed register more than one byte wide.
+    CBits writes to a shadowed register start from this value instead of reading
+    the register back over the bus. Inside a ``with`` block the writes are held
+    back and each touched register is written once, in first-touched order, when
+    the block ends. Bits the chip changes by itself (e.g. the power mode falling
+    back to standby after a forced measurement) are not tracked; call
+    :meth:`resync` after a reset or such a transition.
+    """
+
+    def __init__(self, obj, registers) -> None:
+        seen = set()
+        klasses = [type(obj)]
+        for klass in klasses:  # MicroPython classes have no __mro__
+            klasses.extend(base for base in klass.__bases__ if base is not object)
+            for name, descriptor in klass.__dict__.items():
+                if name in seen:
+                    continue  # overridden by a subclass
+                seen.add(name)
+                if (isinstance(descriptor, (CBits, RegisterStruct)) and descriptor.register in registers
+                        and descriptor.length != 1):
+                    raise ValueError(
+                        "Shadowed register 0x%02X is accessed %d bytes wide; only single-byte registers can be shadowed"
+                        % (descriptor.register, descriptor.length)
+                    )
+        self._obj = obj
+        self.registers = registers
+        self.values = {}
+        self._pending = []
+        self._deferred = False
+        self.reads_saved = 0
+        self.writes_saved = 0
+
+    def resync(self) -> None:
+        """Reload every shadowed register from the chip in one burst read"""
+        first = min(self.registers)
+        data = self._obj._i2c.readfrom_mem(self._obj._address, first, max(self.registers) - first + 1)
+        self.values = {}
+        for register in self.registers:
+            self.values[register] = data[register - first]
+        self._pending = []
+
+    def store(self, register: int, value: int) -> bool:
+        """Record a register write. Returns True when the write is deferred to the end of the ``with`` block"""
+        if register not in self.registers:
+            return False
+        self.values[register] = value
+        if not self._deferred:
+            return False
+        if register in self._pending:
+            self.writes_saved += 1
+        else:
+            self._pending.append(register)
+        return True
+
+    def flush(self) -> None:
+        for register in self._pending:
+            _write(self._obj, register, bytes((self.values[register],)))
+        self._pending = []
+
+    def __enter__(self):
+        self._deferred = True
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._deferred = False
+        self.flush()
+
+
+class _Immediate:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+
+_IMMEDIATE = _Immediate()
+
+
+def deferred_writes(obj):
+    """
+    Context manager that batches the shadowed register writes of ``obj``.
+    Writes go out immediately when the device has no shadow registers.
+    """
+    shadow = getattr(obj, "_shadow", None)
+    if shadow is None:
+        return _IMMEDIATE
+    return shadow
+
+
 class CBits:
     """
     Changes bits from a byte register
@@ -64,7 +221,7 @@ class CBits:
         self.lsb_first = lsb_first
 
     def __get__(self, obj, objtype=None) -> int:
-        mem_value = obj._i2c.readfrom_mem(obj._address, self.register, self.length)
+        mem_value = _read(obj, self.register, self.length)
 
         reg = 0
         order = range(len(mem_value) - 1, -1, -1)
@@ -78,21 +235,28 @@ class CBits:
         return reg
 
     def __set__(self, obj, value: int) -> None:
-        memory_value = obj._i2c.readfrom_mem(obj._address, self.register, self.length)
+        shadow = getattr(obj, "_shadow", None)
+        if shadow is not None and self.register in shadow.values:
+            reg = shadow.values[self.register]
+            shadow.reads_saved += 1
+        else:
+            memory_value = _read(obj, self.register, self.length)
 
-        reg = 0
-        order = range(len(memory_value) - 1, -1, -1)
-        if not self.lsb_first:
-            order = range(0, len(memory_value))
-        for i in order:
-            reg = (reg << 8) | memory_value[i]
+            reg = 0
+            order = range(len(memory_value) - 1, -1, -1)
+            if not self.lsb_first:
+                order = range(0, len(memory_value))
+            for i in order:
+                reg = (reg << 8) | memory_value[i]
         reg &= ~self.bit_mask
 
         value <<= self.start_bit
         reg |= value
+        if shadow is not None and shadow.store(self.register, reg):
+            return
         reg = reg.to_bytes(self.length, "big")
 
-        obj._i2c.writeto_mem(obj._address, self.register, reg)
+        _write(obj, self.register, reg)
 
 
 class RegisterStruct:
@@ -106,7 +270,7 @@ class RegisterStruct:
         self.length = struct.calcsize(form)
 
     def __get__(self, obj, objtype=None):
-        data = obj._i2c.readfrom_mem(obj._address, self.register, self.length)
+        data = _read(obj, self.register, self.length)
         if self.length <= 2:
             value = struct.unpack(self.format, memoryview(data))[0]
         else:
@@ -115,4 +279,4 @@ class RegisterStruct:
 
     def __set__(self, obj, value):
         mem_value = struct.pack(self.format, value)
-        obj._i2c.writeto_mem(obj._address, self.register, mem_value)
\ No newline at end of file
+        _write(obj, self.register, mem_value)
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""
+`coefficients`
+================================================================================
+
+DPS310 calibration coefficients shared by the DPS310 drivers
+
+The 18 coefficient bytes (registers 0x10 - 0x21) are read in a single burst
+and decoded with one bit-layout table into an immutable record.
+
+"""
+
+from micropython import const
+
+try:
+    from collections import namedtuple
+except ImportError:
+    from ucollections import namedtuple
+
+_DPS310_COEF = const(0x10)  # First calibration coefficient register
+COEFFICIENT_BYTES = const(18)
+
+DPS310Coefficients = namedtuple(
+    "DPS310Coefficients", ("c0", "c1", "c00", "c10", "c01", "c11", "c20", "c21", "c30")
+)
+
+# (bit offset, width) of each two's complement coefficient in the
+# big-endian coefficient block, in the field order of DPS310Coefficients
+_LAYOUT = (
+    (0, 12),  # c0
+    (12, 12),  # c1
+    (24, 20),  # c00
+    (44, 20),  # c10
+    (64, 16),  # c01
+    (80, 16),  # c11
+    (96, 16),  # c20
+    (112, 16),  # c21
+    (128, 16),  # c30
+)
+
+
+def decode_coefficients(data) -> DPS310Coefficients:
+    """
+    Decode the raw coefficient block
+
+    :param data: the 18 bytes read from registers 0x10 - 0x21
+    :raises ValueError: if ``data`` is not 18 bytes long
+    """
+    if len(data) != COEFFICIENT_BYTES:
+        raise ValueError("DPS310 coefficient block must be 18 bytes")
+
+    values = []
+    for offset, width in _LAYOUT:
+        last = offset + width - 1
+        value = 0
+        for index in range(offset >> 3, (last >> 3) + 1):
+            value = (value << 8) | data[index]
+        value = (value >> (7 - (last & 7))) & ((1 << width) - 1)
+        if value & (1 << (width - 1)):
+            value -= 1 << width
+        values.append(value)
+    return DPS310Coefficients(*values)
+
+
+def read_coefficients(i2c, address: int) -> DPS310Coefficients:
+    """Read the coefficient block in one bus transaction and decode it"""
+    return decode_coefficients(i2c.readfrom_mem(address, _DPS310_COEF, COEFFICIENT_BYTES))
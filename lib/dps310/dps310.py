@@ -25,11 +25,11 @@ This library depends on Micropython
 # pylint: disable=line-too-long
 
 import math
-import struct
 import time
 
 from micropython import const
-from dps310.i2c_helpers import CBits, RegisterStruct
+from lib.dps310.coefficients import read_coefficients
+from lib.dps310.i2c_helpers import CBits, RegisterSnapshot, RegisterStruct
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/jposada202020/MicroPython_DPS310.git"
@@ -48,6 +48,9 @@ _DPS310_RESET = const(0x0C)  # Soft reset
 _DPS310_PRODREVID = const(0x0D)  # Register that contains the part ID
 _DPS310_TMPCOEFSRCE = const(0x28)  # Temperature calibration src
 
+# Longest wait for a result: one period at the slowest rate (1 measurement/s) plus margin
+MEASUREMENT_TIMEOUT_MS = const(2000)
+
 
 class DPS310:
     """Main class for the Sensor
@@ -66,7 +69,7 @@ class DPS310:
     .. code-block:: python
 
         from machine import Pin, I2C
-        import micropython_dps310.dps310 as dps310
+        import lib.dps310.dps310 as dps310
 
     Once this is done you can define your `machine.I2C` object and define your sensor object
 
@@ -100,9 +103,12 @@ class DPS310:
     _sensor_ready = CBits(1, _DPS310_MEASCFG, 6)
     _temp_ready = CBits(1, _DPS310_MEASCFG, 5)
     _pressure_ready = CBits(1, _DPS310_MEASCFG, 4)
+    _results_ready = CBits(2, _DPS310_MEASCFG, 4)
 
     _raw_pressure = CBits(24, _DPS310_PRSB2, 0, 3, False)
     _raw_temperature = CBits(24, _DPS310_TMPB2, 0, 3, False)
+    # pressure and temperature result registers are adjacent (0x00 - 0x05)
+    _raw_results = CBits(48, _DPS310_PRSB2, 0, 6, False)
 
     _calib_coeff_temp_src_bit = CBits(1, _DPS310_TMPCOEFSRCE, 7)
 
@@ -110,6 +116,11 @@ class DPS310:
     _reg0f = CBits(8, 0x0F, 0)
     _reg62 = CBits(8, 0x62, 0)
 
+    # Results, configuration and status registers (0x00 - 0x09) read by snapshot().
+    # INT_STS (0x0A) clears on read, so the window stops before it.
+    _snapshot_window = (_DPS310_PRSB2, 0x0A)
+    _snapshot = None
+
     def __init__(self, i2c, address=0x77) -> None:
         self._i2c = i2c
         self._address = address
@@ -210,8 +221,7 @@ class DPS310:
         self._reset_register = 0x89
         # wait for hardware reset to finish
         time.sleep(0.010)
-        while not self._sensor_ready:
-            time.sleep(0.001)
+        self._wait_until(lambda: self._sensor_ready, 200, "sensor ready after reset")
         self._correct_temp()
         self._read_calibration()
         # make sure we're using the temperature source used for calibration
@@ -220,12 +230,21 @@ class DPS310:
     @property
     def pressure(self) -> float:
         """Returns the current pressure reading in hectoPascals (hPa)"""
+        return self._compensate(self._raw_results)[0]
 
-        temp_reading = self._raw_temperature
-        raw_temperature = self._twos_complement(temp_reading, 24)
+    def read(self, timeout_ms: int = MEASUREMENT_TIMEOUT_MS) -> tuple:
+        """Wait for a new pressure and temperature result and return both
+        as (hectoPascals, degrees Celsius). Readiness is polled once for both results
+        and the six result bytes are read in a single transaction.
 
-        pressure_reading = self._raw_pressure
-        raw_pressure = self._twos_complement(pressure_reading, 24)
+        :raises RuntimeError: if no result is ready within ``timeout_ms``"""
+        self._wait_until(lambda: self._results_ready == 3, timeout_ms, "pressure and temperature results")
+        return self._compensate(self._raw_results)
+
+    def _compensate(self, raw_results: int) -> tuple:
+        """Compensate a fused 48-bit pressure/temperature result"""
+        raw_pressure = self._twos_complement(raw_results >> 24, 24)
+        raw_temperature = self._twos_complement(raw_results & 0xFFFFFF, 24)
 
         scaled_rawtemp = raw_temperature / self._temp_scale
         scaled_rawpres = raw_pressure / self._pressure_scale
@@ -238,8 +257,7 @@ class DPS310:
             * (self._c01 + scaled_rawpres * (self._c11 + scaled_rawpres * self._c21))
         )
 
-        final_pressure = pres_calc / 100
-        return final_pressure
+        return pres_calc / 100, scaled_rawtemp * self._c1 + self._c0 / 2.0
 
     @property
     def altitude(self) -> float:
@@ -269,16 +287,44 @@ class DPS310:
     def sea_level_pressure(self, value: float) -> None:
         self._sea_level_pressure = value
 
-    def wait_temperature_ready(self) -> None:
-        """Wait until a temperature measurement is available."""
+    def snapshot(self) -> None:
+        """Burst-read the result, configuration and status registers in one transaction.
+        Register reads in that window are served from the copy until :meth:`invalidate`
+        is called or one of its registers is written."""
+        if self._snapshot is None:
+            self._snapshot = RegisterSnapshot(*self._snapshot_window)
+        self._snapshot.load(self)
 
-        while self._temp_ready is False:
-            time.sleep(0.001)
+    def invalidate(self) -> None:
+        """Drop the register snapshot so reads go to the bus again"""
+        if self._snapshot is not None:
+            self._snapshot.invalidate()
+
+    @property
+    def transactions_saved(self) -> int:
+        """Bus transactions avoided by :meth:`snapshot` since the driver was created"""
+        if self._snapshot is None:
+            return 0
+        return self._snapshot.saved
+
+    def wait_temperature_ready(self, timeout_ms: int = MEASUREMENT_TIMEOUT_MS) -> None:
+        """Wait until a temperature measurement is available."""
+        self._wait_until(lambda: self._temp_ready, timeout_ms, "temperature result")
 
-    def wait_pressure_ready(self) -> None:
+    def wait_pressure_ready(self, timeout_ms: int = MEASUREMENT_TIMEOUT_MS) -> None:
         """Wait until a pressure measurement is available"""
+        self._wait_until(lambda: self._pressure_ready, timeout_ms, "pressure result")
 
-        while self._pressure_ready is False:
+    @staticmethod
+    def _wait_until(ready, timeout_ms: int, what: str) -> None:
+        """Poll ``ready()`` every millisecond
+
+        :raises RuntimeError: if it is still false after ``timeout_ms``
+        """
+        start = time.ticks_ms()
+        while not ready():
+            if time.ticks_diff(time.ticks_ms(), start) >= timeout_ms:
+                raise RuntimeError("DPS310 timed out waiting for " + what)
             time.sleep(0.001)
 
     @staticmethod
@@ -292,29 +338,17 @@ class DPS310:
         """
         Read the calibration data from the sensor
         """
-        while not self._coefficients_ready:
-            time.sleep(0.001)
-
-        coeffs = [None] * 18
-        for offset in range(18):
-            register = 0x10 + offset
-            coeffs[offset] = struct.unpack(
-                "B", self._i2c.readfrom_mem(self._address, register, 1)
-            )[0]
-
-        self._c0 = (coeffs[0] << 4) | ((coeffs[1] >> 4) & 0x0F)
-        self._c0 = self._twos_complement(self._c0, 12)
-
-        self._c1 = self._twos_complement(((coeffs[1] & 0x0F) << 8) | coeffs[2], 12)
-
-        self._c00 = (coeffs[3] << 12) | (coeffs[4] << 4) | ((coeffs[5] >> 4) & 0x0F)
-        self._c00 = self._twos_complement(self._c00, 20)
-
-        self._c10 = ((coeffs[5] & 0x0F) << 16) | (coeffs[6] << 8) | coeffs[7]
-        self._c10 = self._twos_complement(self._c10, 20)
-
-        self._c01 = self._twos_complement((coeffs[8] << 8) | coeffs[9], 16)
-        self._c11 = self._twos_complement((coeffs[10] << 8) | coeffs[11], 16)
-        self._c20 = self._twos_complement((coeffs[12] << 8) | coeffs[13], 16)
-        self._c21 = self._twos_complement((coeffs[14] << 8) | coeffs[15], 16)
-        self._c30 = self._twos_complement((coeffs[16] << 8) | coeffs[17], 16)
+        self._wait_until(lambda: self._coefficients_ready, 200, "calibration coefficients")
+
+        self.coefficients = read_coefficients(self._i2c, self._address)
+        (
+            self._c0,
+            self._c1,
+            self._c00,
+            self._c10,
+            self._c01,
+            self._c11,
+            self._c20,
+            self._c21,
+            self._c30,
+        ) = self.coefficients
@@ -22,11 +22,11 @@ This library depends on Micropython
 # pylint: disable=line-too-long
 
 import math
-import struct
 import time
 
 from micropython import const
-from micropython_dps310.i2c_helpers import CBits, RegisterStruct
+from lib.dps310.coefficients import read_coefficients
+from lib.dps310.i2c_helpers import CBits, RegisterStruct
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/jposada202020/MicroPython_DPS310.git"
@@ -41,6 +41,9 @@ _RESET = const(0x0C)
 
 _TMPCOEFSRCE = const(0x28)  # Temperature calibration src
 
+# Longest wait for a result: one period at the slowest rate (1 measurement/s) plus margin
+MEASUREMENT_TIMEOUT_MS = const(2000)
+
 # DPS310 Pressure Oversampling Rate
 SAMPLE_PER_SECOND_1 = const(0b000)  # 1 time (Pressure Low Precision)
 SAMPLE_PER_SECOND_2 = const(0b001)  # 2 times (Pressure Low Power)
@@ -121,7 +124,7 @@ class DPS310:
     .. code-block:: python
 
         from machine import Pin, I2C
-        import micropython_dps310.dps310 as dps310
+        import lib.dps310.dps310 as dps310
 
     Once this is done you can define your `machine.I2C` object and define your sensor object
 
@@ -163,6 +166,7 @@ class DPS310:
     _sensor_ready = CBits(1, _MEAS_CFG, 6)
     _temp_ready = CBits(1, _MEAS_CFG, 5)
     _coefficients_ready = CBits(1, _MEAS_CFG, 7)
+    _results_ready = CBits(2, _MEAS_CFG, 4)
 
     # Register 0x09 Sensor interreupts
     # | INT_HL | INT_FIFO | INT_TMP | INT_PRS | T_SHIFT | P_SHIFT | FIFO_EN | SPI_MODE |
@@ -171,6 +175,8 @@ class DPS310:
 
     _raw_pressure = CBits(24, 0x00, 0, 3, False)
     _raw_temperature = CBits(24, 0x03, 0, 3, False)
+    # pressure and temperature result registers are adjacent (0x00 - 0x05)
+    _raw_results = CBits(48, 0x00, 0, 6, False)
 
     _calib_coeff_temp_src_bit = CBits(1, _TMPCOEFSRCE, 7)
 
@@ -483,29 +489,30 @@ class DPS310:
         while not self._coefficients_ready:
             time.sleep(0.001)
 
-        coeffs = [None] * 18
-        for offset in range(18):
-            register = 0x10 + offset
-            coeffs[offset] = struct.unpack(
-                "B", self._i2c.readfrom_mem(self._address, register, 1)
-            )[0]
-
-        self._c0 = (coeffs[0] << 4) | ((coeffs[1] >> 4) & 0x0F)
-        self._c0 = self._twos_complement(self._c0, 12)
-
-        self._c1 = self._twos_complement(((coeffs[1] & 0x0F) << 8) | coeffs[2], 12)
+        self.coefficients = read_coefficients(self._i2c, self._address)
+        (
+            self._c0,
+            self._c1,
+            self._c00,
+            self._c10,
+            self._c01,
+            self._c11,
+            self._c20,
+            self._c21,
+            self._c30,
+        ) = self.coefficients
 
-        self._c00 = (coeffs[3] << 12) | (coeffs[4] << 4) | ((coeffs[5] >> 4) & 0x0F)
-        self._c00 = self._twos_complement(self._c00, 20)
-
-        self._c10 = ((coeffs[5] & 0x0F) << 16) | (coeffs[6] << 8) | coeffs[7]
-        self._c10 = self._twos_complement(self._c10, 20)
+    @staticmethod
+    def _wait_until(ready, timeout_ms: int, what: str) -> None:
+        """Poll ``ready()`` every millisecond
 
-        self._c01 = self._twos_complement((coeffs[8] << 8) | coeffs[9], 16)
-        self._c11 = self._twos_complement((coeffs[10] << 8) | coeffs[11], 16)
-        self._c20 = self._twos_complement((coeffs[12] << 8) | coeffs[13], 16)
-        self._c21 = self._twos_complement((coeffs[14] << 8) | coeffs[15], 16)
-        self._c30 = self._twos_complement((coeffs[16] << 8) | coeffs[17], 16)
+        :raises RuntimeError: if it is still false after ``timeout_ms``
+        """
+        start = time.ticks_ms()
+        while not ready():
+            if time.ticks_diff(time.ticks_ms(), start) >= timeout_ms:
+                raise RuntimeError("DPS310 timed out waiting for " + what)
+            time.sleep(0.001)
 
     @staticmethod
     def _twos_complement(val: int, bits: int) -> int:
@@ -527,14 +534,21 @@ class DPS310:
     @property
     def pressure(self) -> float:
         """Returns the current pressure reading in hectoPascals (hPa)"""
+        return self._compensate(self._raw_results)[0]
 
-        temp_reading = self._raw_temperature
+    def read(self, timeout_ms: int = MEASUREMENT_TIMEOUT_MS) -> tuple:
+        """Wait for a new pressure and temperature result and return both
+        as (hectoPascals, degrees Celsius). Readiness is polled once for both results
+        and the six result bytes are read in a single transaction.
 
-        raw_temperature = self._twos_complement(temp_reading, 24)
+        :raises RuntimeError: if no result is ready within ``timeout_ms``"""
+        self._wait_until(lambda: self._results_ready == 3, timeout_ms, "pressure and temperature results")
+        return self._compensate(self._raw_results)
 
-        pressure_reading = self._raw_pressure
-
-        raw_pressure = self._twos_complement(pressure_reading, 24)
+    def _compensate(self, raw_results: int) -> tuple:
+        """Compensate a fused 48-bit pressure/temperature result"""
+        raw_pressure = self._twos_complement(raw_results >> 24, 24)
+        raw_temperature = self._twos_complement(raw_results & 0xFFFFFF, 24)
 
         scaled_rawtemp = raw_temperature / self._temp_scale
         scaled_rawpres = raw_pressure / self._pressure_scale
@@ -547,9 +561,7 @@ class DPS310:
             * (self._c01 + scaled_rawpres * (self._c11 + scaled_rawpres * self._c21))
         )
 
-        final_pressure = pres_calc / 100
-
-        return final_pressure
+        return pres_calc / 100, scaled_rawtemp * self._c1 + self._c0 / 2.0
 
     @property
     def altitude(self) -> float:
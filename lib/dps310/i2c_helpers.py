@@ -41,6 +41,62 @@ SOFTWARE.
 import struct
 
 
+class RegisterSnapshot:
+    """
+    Contiguous register window read in one burst. While loaded, descriptor
+    reads that fall inside the window are served from the buffer instead of
+    the bus, until :meth:`invalidate` is called or a descriptor writes into it.
+    """
+
+    def __init__(self, start_address: int, length: int) -> None:
+        self.start = start_address
+        self.length = length
+        self.buffer = bytearray(length)
+        self._view = memoryview(self.buffer)
+        self.valid = False
+        self.bursts = 0
+        self.hits = 0
+
+    def load(self, obj) -> None:
+        obj._i2c.readfrom_mem_into(obj._address, self.start, self.buffer)
+        self.valid = True
+        self.bursts += 1
+
+    def invalidate(self) -> None:
+        self.valid = False
+
+    def lookup(self, register: int, length: int):
+        offset = register - self.start
+        if not self.valid or offset < 0 or offset + length > self.length:
+            return None
+        self.hits += 1
+        return self._view[offset:offset + length]
+
+    def overlaps(self, register: int, length: int) -> bool:
+        return register < self.start + self.length and register + length > self.start
+
+    @property
+    def saved(self) -> int:
+        """Bus transactions avoided: buffered descriptor reads minus the bursts that filled the buffer"""
+        return self.hits - self.bursts
+
+
+def _read(obj, register: int, length: int):
+    snapshot = getattr(obj, "_snapshot", None)
+    if snapshot is not None:
+        data = snapshot.lookup(register, length)
+        if data is not None:
+            return data
+    return obj._i2c.readfrom_mem(obj._address, register, length)
+
+
+def _write(obj, register: int, data) -> None:
+    obj._i2c.writeto_mem(obj._address, register, data)
+    snapshot = getattr(obj, "_snapshot", None)
+    if snapshot is not None and snapshot.overlaps(register, len(data)):
+        snapshot.invalidate()
+
+
 class CBits:
     """
     Changes bits from a byte register
@@ -65,7 +121,7 @@ class CBits:
         obj,
         objtype=None,
     ) -> int:
-        mem_value = obj._i2c.readfrom_mem(obj._address, self.register, self.lenght)
+        mem_value = _read(obj, self.register, self.lenght)
 
         reg = 0
         order = range(len(mem_value) - 1, -1, -1)
@@ -79,7 +135,7 @@ class CBits:
         return reg
 
     def __set__(self, obj, value: int) -> None:
-        memory_value = obj._i2c.readfrom_mem(obj._address, self.register, self.lenght)
+        memory_value = _read(obj, self.register, self.lenght)
 
         reg = 0
         order = range(len(memory_value) - 1, -1, -1)
@@ -93,7 +149,7 @@ class CBits:
         reg |= value
         reg = reg.to_bytes(self.lenght, "big")
 
-        obj._i2c.writeto_mem(obj._address, self.register, reg)
+        _write(obj, self.register, reg)
 
 
 class RegisterStruct:
@@ -114,22 +170,18 @@ class RegisterStruct:
         if self.lenght <= 2:
             value = struct.unpack(
                 self.format,
-                memoryview(
-                    obj._i2c.readfrom_mem(obj._address, self.register, self.lenght)
-                ),
+                memoryview(_read(obj, self.register, self.lenght)),
             )[0]
         else:
             value = struct.unpack(
                 self.format,
-                memoryview(
-                    obj._i2c.readfrom_mem(obj._address, self.register, self.lenght)
-                ),
+                memoryview(_read(obj, self.register, self.lenght)),
             )
         return value
 
     def __set__(self, obj, value):
         mem_value = struct.pack(self.format, value)
-        obj._i2c.writeto_mem(obj._address, self.register, mem_value)
+        _write(obj, self.register, mem_value)
 
 
 def twos_complement(val: int, bits: int) -> int:
@@ -1,50 +1,75 @@
-from sensor_utils import SensorManager
 import time
 
+from sensor_utils import SensorManager
+from scheduler import Scheduler
+from telemetry import TelemetryRenderer
+from frame_protocol import FrameWriter
+from tsdb import TimeSeriesStore
+
+# 'binary'면 print 대신 바이너리 프레임 출력 (호스트: python frame_protocol.py /dev/ttyACM0)
+OUTPUT = 'text'
+
+# 파일 경로를 주면 RECORD_PERIOD_S마다 모든 센서를 시계열 저장소(tsdb)에 기록 (None이면 기록 안 함)
+TSDB_PATH = None
+RECORD_PERIOD_S = 60
+
 
 def main():
     mgr = SensorManager()
 
-    # 저전력 모드 설정
-    mgr.bmp280.set_low_power_mode()
-    mgr.dps310.set_low_power_mode()
-    mgr.bmp388.set_low_power_mode()
-
-    # 센서 매핑 딕셔너리
+    # 센서 매핑 딕셔너리 (찾지 못한 센서는 제외)
     sensor_map = {
         'BMP280': mgr.bmp280,
         'DPS310': mgr.dps310,
-        'BMP388': mgr.bmp388
+        'BMP388': mgr.bmp388,
+        'BMP390': mgr.bmp390
     }
+    sensor_map = {k: v for k, v in sensor_map.items() if v is not None}
+    if not sensor_map:
+        print("센서를 찾지 못했습니다. I2C 배선과 주소를 확인하세요.")
+        return
+
+    # 저전력 모드 설정
+    for sensor in sensor_map.values():
+        sensor.set_low_power_mode()
 
-    # 모드별 주기 결정
+    # 센서 작업은 값만 저장하고, 출력 작업이 같은 시각에 주기가 된 센서를 한 줄로 묶어 출력
+    telemetry = TelemetryRenderer(rate_hz=5, altitude=mgr.calculate_altitude)
+    frames = FrameWriter() if OUTPUT == 'binary' else None
+
+    def report(task):
+        # 주기가 된 센서만 읽기 (바이너리는 바로 전송, 텍스트는 render 작업이 출력)
+        if frames is not None:
+            pressure, temperature = sensor_map[task.name].read()
+            frames.write(task.name, time.ticks_ms(), pressure, temperature)
+        else:
+            telemetry.update(task.name, sensor_map[task.name].pressure)
+
+    # 모드별 주기로 작업 등록 (가장 가까운 마감 시각까지만 잠듦)
     mode = 'low_power'
-    periods = SensorManager.MODES[mode]
-    last_time = {k: 0 for k in periods}
-    vals = {k: None for k in periods}
+    sched = Scheduler()
+    for name, period in SensorManager.MODES[mode].items():
+        if name in sensor_map:
+            sched.add(name, int(period * 1000), report)
+    if frames is None:
+        # 센서 작업보다 늦게 등록하므로 마감 시각이 같으면 센서 작업이 모두 끝난 뒤 실행된다
+        # 출력 주기는 작업 주기가 정하므로 render()의 주기 검사는 건너뜀 (새 값이 없으면 출력 안 함)
+        sched.add('render', telemetry.interval_ms, lambda task: telemetry.render(force=True))
+
+    store = TimeSeriesStore(TSDB_PATH) if TSDB_PATH else None
+    if store is not None:
+        sched.add('record', RECORD_PERIOD_S * 1000, lambda task: mgr.record(store))
 
     try:
-        while True:
-            now = time.ticks_ms()
-            for name, period in periods.items():
-                # 센서별로 주기에 따라 측정
-                if time.ticks_diff(now, last_time[name]) >= int(period * 1000):
-                    vals[name] = sensor_map.get(name).pressure
-                    last_time[name] = now
-
-            ts = mgr.format_timestamp()
-            print(f"[{ts}]")
-            for name in periods:
-                value = vals[name]
-                if value is not None:
-                    altitude = mgr.calculate_altitude(value)
-                    print(f"['{name}', '{value:.2f} hPa', '{altitude:.2f} m']")
-            print("=" * 50)
-
-            time.sleep_ms(10)
+        sched.run()
 
     except KeyboardInterrupt:
+        print(sched.format_stats())
+        print(telemetry.format_stats())
         print("프로그램 종료")
+    finally:
+        if store is not None:
+            store.close()  # 채우는 중인 블록 기록
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,49 +1,67 @@
 from sensor_utils import SensorManager
-import time
+from scheduler import Scheduler
+from dual_core import DualCoreEngine
+from telemetry import TelemetryRenderer
+from frame_protocol import FrameWriter
+
+# 'binary'면 print 대신 바이너리 프레임 출력 (호스트: python frame_protocol.py /dev/ttyACM0)
+OUTPUT = 'text'
 
 
 def main():
     mgr = SensorManager()
 
-    # 고정밀 모드 설정
-    mgr.bmp280.set_normal_mode()
-    mgr.dps310.set_normal_mode()
-    mgr.bmp388.set_normal_mode()
-
-    # 센서 매핑 딕셔너리
+    # 센서 매핑 딕셔너리 (찾지 못한 센서는 제외)
     sensor_map = {
         'BMP280': mgr.bmp280,
         'DPS310': mgr.dps310,
-        'BMP388': mgr.bmp388
+        'BMP388': mgr.bmp388,
+        'BMP390': mgr.bmp390
     }
+    sensor_map = {k: v for k, v in sensor_map.items() if v is not None}
+    if not sensor_map:
+        print("센서를 찾지 못했습니다. I2C 배선과 주소를 확인하세요.")
+        return
+
+    # 고정밀 모드 설정
+    for sensor in sensor_map.values():
+        sensor.set_normal_mode()
 
-    # 모드별 주기 결정
+    # 코어 1: 모드별 주기로 I2C 읽기와 원시 샘플 저장
     mode = 'normal'
-    periods = SensorManager.MODES[mode]
-    last_time = {k: 0 for k in periods}
-    vals = {k: None for k in periods}
+    engine = DualCoreEngine()
+    periods = []
+    for name, period in SensorManager.MODES[mode].items():
+        if name in sensor_map:
+            engine.add(name, sensor_map[name], int(period * 1000))
+            periods.append(int(period * 1000))
+
+    # 새 샘플이 있을 때만 초당 최대 5줄로 묶어 출력 (고도는 출력할 때만 계산)
+    telemetry = TelemetryRenderer(rate_hz=5, altitude=mgr.calculate_altitude)
+    frames = FrameWriter() if OUTPUT == 'binary' else None
+
+    def report(task):
+        # 코어 0: 쌓인 원시 샘플 보정 후 센서별 최신 값만 출력 (바이너리는 모든 샘플 전송)
+        for name, ts, value, temperature in engine.process():
+            if frames is not None:
+                frames.write(name, ts, value, temperature)
+            else:
+                telemetry.update(name, value)
+        telemetry.render()
+
+    # 가장 짧은 측정 주기마다 출력 (가장 가까운 마감 시각까지만 잠듦)
+    sched = Scheduler()
+    sched.add('output', min(periods), report)
 
+    engine.start()
     try:
-        while True:
-            now = time.ticks_ms()
-            for name, period in periods.items():
-                # 센서별로 주기에 따라 측정
-                if time.ticks_diff(now, last_time[name]) >= int(period * 1000):
-                    vals[name] = sensor_map.get(name).pressure
-                    last_time[name] = now
-
-            ts = mgr.format_timestamp()
-            print(f"[{ts}]")
-            for name in periods:
-                value = vals[name]
-                if value is not None:
-                    altitude = mgr.calculate_altitude(value)
-                    print(f"['{name}', '{value:.2f}hPa', '{altitude:.2f}m']")
-            print("=" * 50)
-
-            time.sleep_ms(10)
+        sched.run()
 
     except KeyboardInterrupt:
+        engine.stop()
+        print(sched.format_stats())
+        print(f"captured {engine.captured} dropped {engine.ring.dropped} errors {engine.errors}")
+        print(telemetry.format_stats())
         print("프로그램 종료")
 
 if __name__ == "__main__":
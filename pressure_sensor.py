@@ -2,19 +2,18 @@
 import time
 from machine import Pin, I2C
 
-# 센서 모듈 임포트 (실제 라이브러리 또는 커스텀 모듈 필요)
-from .bmp280 import BMP280  # pico-bmp280 라이브러리
-from .bmp388 import BMP388  # BMP388 호환 라이브러리
-from .dps310 import DPS310  # 커스텀 또는 조정된 라이브러리 가정
+# 센서 자동 탐색 (드라이버는 찾은 칩에 맞춰 임포트됨)
+from .discovery import discover
 
 # I2C 버스 초기화
 i2c0 = I2C(0, sda=Pin(0), scl=Pin(1))  # DPS310, BMP280
 i2c1 = I2C(1, sda=Pin(6), scl=Pin(7))  # BMP388
 
-# 센서 초기화
-bmp280 = BMP280(i2c=i2c0, address=0x76)
-dps310 = DPS310(i2c=i2c0, address=0x77)
-bmp388 = BMP388(i2c=i2c1, address=0x77)
+# 센서 초기화 (버스마다 한 번 스캔해서 찾은 센서만 생성)
+registry = discover({0: i2c0, 1: i2c1})
+bmp280 = registry.get("BMP280")
+dps310 = registry.get("DPS310")
+bmp388 = registry.get("BMP388")
 
 # 모드 정의
 low_power_mode = {
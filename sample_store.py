@@ -0,0 +1,152 @@
+"""
+샘플 저장소
+측정 샘플을 튜플이나 dict 대신 고정 크기 배열 열(column)로 된 링 버퍼에 저장한다.
+수집(IrqAcquisition, DualCoreEngine), 필터, 기록 코드가 같은 버퍼 형식을 공유한다.
+
+열:
+    ts           array('i')  ticks_ms
+    raw_pressure array('i')  원시 압력 ADC 값
+    raw_temp     array('i')  원시 온도 ADC 값
+    pressure     array('f')  보정된 기압 (hPa)
+    temperature  array('f')  보정된 온도 (°C)
+    sensor       array('B')  센서 번호 (여러 센서가 한 버퍼를 쓸 때, 기본값 0)
+
+기록/전송 쪽은 Sample을 그대로 받는다: BinaryLog.log_sample, TimeSeriesStore.append_sample,
+FrameWriter.write_sample, TelemetryRenderer.update_sample (이때 sensor는 sensor_ids의 센서 ID).
+lib/bmp280 드라이버는 measure_into(sample)로 Sample을 바로 채운다.
+
+읽기는 peek()로 연속된 구간의 memoryview를 복사 없이 받아 처리한 뒤 consume()으로 반환한다.
+memoryview 열은 batch_compensation의 입력으로 바로 넘길 수 있다.
+
+사용 예:
+    ring = SampleRing(128)
+    ring.append(time.ticks_ms(), raw_p, raw_t, p, t)
+    ts, raw_p, raw_t, p, t, sensor = ring.peek()
+    ...
+    ring.consume(len(ts))
+"""
+from array import array
+
+
+class Sample:
+    """샘플 하나 (필드 고정 레코드)
+
+    pop()/get()에 같은 Sample을 계속 넘기면 샘플마다 새 객체를 만들지 않는다.
+    """
+    __slots__ = ("ts", "raw_pressure", "raw_temp", "pressure", "temperature", "sensor")
+
+    def __init__(self, ts=0, raw_pressure=0, raw_temp=0, pressure=0.0, temperature=0.0, sensor=0):
+        self.ts = ts
+        self.raw_pressure = raw_pressure
+        self.raw_temp = raw_temp
+        self.pressure = pressure
+        self.temperature = temperature
+        self.sensor = sensor
+
+    def __repr__(self):
+        return "Sample(ts=%d, raw_pressure=%d, raw_temp=%d, pressure=%.2f, temperature=%.2f, sensor=%d)" % (
+            self.ts, self.raw_pressure, self.raw_temp, self.pressure, self.temperature, self.sensor)
+
+
+class SampleRing:
+    """배열 열로 된 고정 크기 샘플 링 버퍼
+
+    쓰는 쪽은 head만, 읽는 쪽은 tail만 변경하므로 인터럽트 핸들러나 다른 코어에서
+    한쪽씩 사용할 수 있다. 가득 차면 새 샘플을 버리고 dropped를 증가시킨다.
+    """
+
+    def __init__(self, capacity=64):
+        """
+        :param capacity: 최대 샘플 수
+        """
+        self.capacity = capacity
+        self._n = n = capacity + 1  # 가득 참과 비어 있음을 구분하기 위한 여유 칸
+        self.ts = array('i', [0] * n)
+        self.raw_pressure = array('i', [0] * n)
+        self.raw_temp = array('i', [0] * n)
+        self.pressure = array('f', [0.0] * n)
+        self.temperature = array('f', [0.0] * n)
+        self.sensor = array('B', [0] * n)
+        self._columns = (self.ts, self.raw_pressure, self.raw_temp, self.pressure, self.temperature, self.sensor)
+        self._head = 0  # 쓰는 쪽만 변경
+        self._tail = 0  # 읽는 쪽만 변경
+        self.dropped = 0
+
+    def append(self, ts, raw_pressure=0, raw_temp=0, pressure=0.0, temperature=0.0, sensor=0):
+        """샘플 추가 (쓰는 쪽 전용)
+        :param sensor: 센서 번호 (0~255)
+        :return: 저장했으면 True, 가득 차서 버렸으면 False
+        """
+        head = self._head
+        nxt = (head + 1) % self._n
+        if nxt == self._tail:
+            self.dropped += 1
+            return False
+        self.ts[head] = ts
+        self.raw_pressure[head] = raw_pressure
+        self.raw_temp[head] = raw_temp
+        self.pressure[head] = pressure
+        self.temperature[head] = temperature
+        self.sensor[head] = sensor
+        self._head = nxt  # 슬롯을 다 채운 뒤 공개
+        return True
+
+    def append_sample(self, sample):
+        """Sample 레코드 추가"""
+        return self.append(sample.ts, sample.raw_pressure, sample.raw_temp, sample.pressure, sample.temperature,
+                           sample.sensor)
+
+    def available(self):
+        """버퍼에 쌓인 샘플 수"""
+        return (self._head - self._tail) % self._n
+
+    def __len__(self):
+        return self.available()
+
+    def get(self, index, sample=None):
+        """가장 오래된 샘플부터 index번째 샘플 읽기 (꺼내지 않음)
+        :param sample: 채울 Sample (None이면 새로 만듦)
+        """
+        if not 0 <= index < self.available():
+            raise IndexError("샘플 인덱스 범위를 벗어났습니다.")
+        i = (self._tail + index) % self._n
+        if sample is None:
+            sample = Sample()
+        sample.ts = self.ts[i]
+        sample.raw_pressure = self.raw_pressure[i]
+        sample.raw_temp = self.raw_temp[i]
+        sample.pressure = self.pressure[i]
+        sample.temperature = self.temperature[i]
+        sample.sensor = self.sensor[i]
+        return sample
+
+    def pop(self, sample=None):
+        """가장 오래된 샘플 꺼내기 (읽는 쪽 전용)
+        :param sample: 채울 Sample (None이면 새로 만듦)
+        :return: Sample 또는 비어 있으면 None
+        """
+        if self._tail == self._head:
+            return None
+        sample = self.get(0, sample)
+        self._tail = (self._tail + 1) % self._n
+        return sample
+
+    def peek(self):
+        """가장 오래된 샘플부터 연속된 구간의 열 memoryview (복사 없음)
+        버퍼 끝에서 이어지는 샘플은 consume() 후 다음 peek()에서 돌려준다
+        :return: (ts, raw_pressure, raw_temp, pressure, temperature, sensor) memoryview 튜플
+        """
+        tail = self._tail
+        head = self._head
+        end = head if head >= tail else self._n
+        return tuple(memoryview(column)[tail:end] for column in self._columns)
+
+    def consume(self, count):
+        """peek()로 처리한 샘플 반환 (읽는 쪽 전용)"""
+        if count > self.available():
+            raise ValueError("쌓인 샘플보다 많이 반환할 수 없습니다.")
+        self._tail = (self._tail + count) % self._n
+
+    def clear(self):
+        """쌓인 샘플 모두 버리기 (읽는 쪽 전용)"""
+        self._tail = self._head
@@ -0,0 +1,137 @@
+"""
+마감 시각 기반 협력 스케줄러
+작업마다 다음 실행 시각을 최소 힙에 넣고, 가장 이른 마감 시각까지 정확히 잠든 뒤 작업을 실행한다.
+고정 간격(예: 10ms)으로 깨어나 모든 센서의 시간을 확인하는 폴링 루프를 대체한다.
+
+- 다음 마감 시각은 실제 실행 시각이 아니라 이전 마감 시각 + 주기로 잡아 오차가 누적되지 않음
+- 작업이 늦어져 마감을 한 주기 이상 놓치면 밀린 실행을 몰아서 하지 않고 건너뛴 뒤 overrun으로 집계
+- 작업별로 실제 실행 간격과 주기의 차이(지터)와 마감 대비 지연 시간을 기록
+
+사용 예:
+    sched = Scheduler()
+    sched.add("BMP388", 50, lambda task: print(sensor.pressure))
+    sched.run()
+"""
+import time
+
+try:
+    import heapq
+except ImportError:
+    import uheapq as heapq
+
+
+class Task:
+    """스케줄러에 등록된 주기 작업과 지터 통계"""
+
+    def __init__(self, name, period_ms, callback):
+        self.name = name
+        self.period_ms = period_ms
+        self.callback = callback
+        self.due = 0  # 다음 마감 시각 (스케줄러 기준 ms)
+        self.last = None  # 마지막 실행 시각
+        self.runs = 0
+        self.overruns = 0  # 마감을 한 주기 이상 놓친 횟수
+        self.skipped = 0  # 건너뛴 주기 수
+        self.jitter_sum = 0  # |실행 간격 - 주기| 합계
+        self.jitter_max = 0
+        self.late_max = 0  # 마감 시각 대비 최대 지연
+
+    def record(self, now):
+        """실행 시각 기록 및 지터 갱신"""
+        if self.last is not None:
+            jitter = abs(now - self.last - self.period_ms)
+            self.jitter_sum += jitter
+            if jitter > self.jitter_max:
+                self.jitter_max = jitter
+        late = now - self.due
+        if late > self.late_max:
+            self.late_max = late
+        self.last = now
+        self.runs += 1
+
+    @property
+    def jitter_mean(self):
+        """평균 지터 (ms)"""
+        return self.jitter_sum / (self.runs - 1) if self.runs > 1 else 0.0
+
+
+class Scheduler:
+    """최소 힙으로 다음 마감 시각을 관리하는 단일 스레드 스케줄러"""
+
+    def __init__(self):
+        self.tasks = []
+        self.wakeups = 0  # 잠들었다가 깨어난 횟수
+        self._heap = []  # (마감 시각, 등록 순서, 작업)
+        self._elapsed = 0  # 스케줄러 시작 후 경과 시간 (ticks_ms 랩어라운드와 무관)
+        self._ticks = time.ticks_ms()
+
+    def _now(self):
+        """스케줄러 기준 현재 시각 (ms)"""
+        ticks = time.ticks_ms()
+        self._elapsed += time.ticks_diff(ticks, self._ticks)
+        self._ticks = ticks
+        return self._elapsed
+
+    def add(self, name, period_ms, callback, delay_ms=0):
+        """주기 작업 등록
+        :param period_ms: 실행 주기 (ms)
+        :param callback: callback(task) 형태로 호출
+        :param delay_ms: 첫 실행까지의 지연
+        :return: Task
+        """
+        if period_ms <= 0:
+            raise ValueError("period_ms는 0보다 커야 합니다.")
+        task = Task(name, period_ms, callback)
+        task.due = self._now() + delay_ms
+        heapq.heappush(self._heap, (task.due, len(self.tasks), task))
+        self.tasks.append(task)
+        return task
+
+    def run_once(self):
+        """가장 이른 작업의 마감 시각까지 잠든 뒤 실행
+        :return: 실행한 Task (등록된 작업이 없으면 None)
+        """
+        if not self._heap:
+            return None
+        due, order, task = heapq.heappop(self._heap)
+        wait = due - self._now()
+        if wait > 0:
+            time.sleep_ms(wait)
+            self.wakeups += 1
+
+        now = self._now()
+        task.record(now)
+
+        # 한 주기 이상 늦었으면 밀린 실행은 건너뛰고 가장 최근 마감 시각으로 맞춤
+        late = now - due
+        if late >= task.period_ms:
+            missed = late // task.period_ms
+            due += missed * task.period_ms
+            task.skipped += missed
+            task.overruns += 1
+
+        task.callback(task)
+
+        # 다음 마감 시각: 실행 시각이 아니라 이전 마감 + 주기 (오차 누적 없음)
+        task.due = due + task.period_ms
+        heapq.heappush(self._heap, (task.due, order, task))
+        return task
+
+    def run(self, duration_ms=None):
+        """작업 실행 반복
+        :param duration_ms: 실행 시간 (None이면 계속)
+        """
+        end = None if duration_ms is None else self._now() + duration_ms
+        while self._heap:
+            if end is not None and self._heap[0][0] >= end:
+                break
+            self.run_once()
+
+    def format_stats(self):
+        """작업별 지터 통계를 출력용 문자열로 변환"""
+        lines = [f"{'task':<10}{'runs':>6}{'jit avg':>9}{'jit max':>9}{'late':>7}{'over':>6}{'skip':>6}"]
+        for task in self.tasks:
+            lines.append(f"{task.name:<10}{task.runs:>6}{task.jitter_mean:>9.2f}{task.jitter_max:>9}"
+                         f"{task.late_max:>7}{task.overruns:>6}{task.skipped:>6}")
+        lines.append(f"wakeups {self.wakeups}")
+        return "\n".join(lines)
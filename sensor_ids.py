@@ -0,0 +1,18 @@
+"""
+센서 ID
+시계열 저장소(tsdb), 바이너리 프레임(frame_protocol), SensorManager가 같은 번호를 쓴다.
+저장소를 쓰지 않는 모듈도 tsdb를 불러오지 않고 ID만 가져갈 수 있도록 따로 둔다.
+"""
+SENSOR_BMP280 = 1
+SENSOR_DPS310 = 2
+SENSOR_BMP388 = 3
+SENSOR_BMP390 = 4
+
+# 센서 이름 <-> ID
+SENSOR_IDS = {
+    'BMP280': SENSOR_BMP280,
+    'DPS310': SENSOR_DPS310,
+    'BMP388': SENSOR_BMP388,
+    'BMP390': SENSOR_BMP390,
+}
+SENSOR_NAMES = {v: k for k, v in SENSOR_IDS.items()}
@@ -1,20 +1,51 @@
 from machine import Pin, I2C
 import time
-import bmp280
-import bmp388
-import dps310
+from calib_cache import CalibrationCache
+from bringup import staged_bringup, format_boot_report
+from discovery import discover
+from sensor_ids import SENSOR_BMP280, SENSOR_DPS310, SENSOR_BMP388, SENSOR_BMP390
 
 class SensorManager:
-    def __init__(self):
-        """I2C 버스 및 센서 초기화 (에러 처리 없음)"""
+    def __init__(self, calib_cache_path=None):
+        """I2C 버스 및 센서 초기화 (에러 처리 없음, 찾지 못한 센서는 None)
+        :param calib_cache_path: 보정 계수 캐시 파일 경로 (주면 웜 부팅에서 NVM 읽기와 리셋 대기 생략)
+        """
         # I2C 버스 설정
         self.i2c0 = I2C(0, sda=Pin(0), scl=Pin(1), freq=400000)
         self.i2c1 = I2C(1, sda=Pin(6), scl=Pin(7), freq=400000)
 
-        # 센서 초기화
-        self.bmp280 = bmp280.BMP280(self.i2c0, addr=0x76)
-        self.dps310 = dps310.DPS310(self.i2c0, addr=0x77)
-        self.bmp388 = bmp388.BMP388(self.i2c1, addr=0x77)
+        cache = CalibrationCache(calib_cache_path) if calib_cache_path else None
+
+        # 센서 탐색 (버스마다 한 번 스캔, 주소마다 ID 한 번 읽음)
+        start = time.ticks_ms()
+        self.registry = discover({0: self.i2c0, 1: self.i2c1}, cache=cache, start=False)
+        self.bmp280 = self.registry.get("BMP280")
+        self.dps310 = self.registry.get("DPS310")
+        self.bmp388 = self.registry.get("BMP388")
+        self.bmp390 = self.registry.get("BMP390")  # BMP388 드라이버
+        self.boot_timing = {"probe": time.ticks_diff(time.ticks_ms(), start)}
+
+        # 단계별 초기화: 리셋을 모두 보낸 뒤 한 번에 준비 대기
+        # (start=False를 지원하지 않는 lib 드라이버는 탐색 시점에 이미 시작됨)
+        staged = [entry[3] for entry in self.registry if hasattr(entry[3], "wait_ready")]
+        self.boot_timing.update(staged_bringup(staged))
+
+    def boot_report(self):
+        """부팅 단계별 소요 시간 (ms)"""
+        return format_boot_report(self.boot_timing)
+
+    def record(self, store, ts_ms=None):
+        """찾은 센서를 모두 읽어 시계열 저장소에 추가
+        :param store: tsdb.TimeSeriesStore
+        :param ts_ms: 샘플 시각 (ms, 기본값 time.time_ns() // 1000000)
+        """
+        if ts_ms is None:
+            ts_ms = time.time_ns() // 1000000
+        for sensor_id, sensor in ((SENSOR_BMP280, self.bmp280), (SENSOR_DPS310, self.dps310),
+                                  (SENSOR_BMP388, self.bmp388), (SENSOR_BMP390, self.bmp390)):
+            if sensor is not None:
+                pressure, temperature = sensor.read()
+                store.append(sensor_id, ts_ms, pressure, temperature)
 
     @staticmethod
     def calculate_altitude(pressure_hpa, sea_level=1013.25):
@@ -48,10 +79,12 @@ class SensorManager:
             'BMP280': 1.0,
             'DPS310': 1.0,
             'BMP388': 1.0,
+            'BMP390': 1.0,
         },
         'normal': {
             'BMP280': 0.2,
             'DPS310': 0.13,
             'BMP388': 0.05,
+            'BMP390': 0.05,
         }
     }
\ No newline at end of file
@@ -0,0 +1,158 @@
+"""
+콘솔 텔레메트리 출력
+샘플이 들어올 때마다 출력하지 않고 센서별 최신 값만 저장해 두었다가, 새 값이 있을 때
+설정한 표시 주기마다 한 줄로 묶어 출력한다. USB CDC 출력이 측정 루프를 막지 않도록
+줄은 f-string 대신 재사용하는 bytearray에 직접 숫자를 써서 만든다.
+표시되기 전에 새 값으로 덮어쓴 샘플은 dropped로 집계한다.
+
+출력 예:
+    [12:34:56:789] BMP280 1006.53 hPa 57.92 m | BMP388 1006.61 hPa 57.23 m
+
+사용 예:
+    telemetry = TelemetryRenderer(rate_hz=5, altitude=mgr.calculate_altitude)
+    telemetry.update("BMP388", pressure)
+    telemetry.render()
+"""
+import sys
+import time
+
+from sensor_ids import SENSOR_NAMES
+
+_SEPARATOR = b" | "
+_HPA = b" hPa"
+_METER = b" m"
+_FIELD_SIZE = 48  # 센서 하나당 최대 바이트 수
+
+
+def _put_bytes(buf, pos, data):
+    buf[pos:pos + len(data)] = data
+    return pos + len(data)
+
+
+def _put_uint(buf, pos, value, width=1):
+    """부호 없는 정수를 width 자리 이상(앞을 0으로 채움)으로 기록"""
+    digits = 1
+    n = value
+    while n >= 10:
+        n //= 10
+        digits += 1
+    if digits < width:
+        digits = width
+    end = pos + digits
+    for i in range(end - 1, pos - 1, -1):
+        buf[i] = 48 + value % 10
+        value //= 10
+    return end
+
+
+def _put_fixed(buf, pos, value, decimals=2):
+    """실수를 소수점 이하 decimals 자리 고정 소수점으로 기록"""
+    scale = 10 ** decimals
+    n = int(value * scale + (0.5 if value >= 0 else -0.5))
+    if n < 0:
+        buf[pos] = 45  # '-'
+        pos += 1
+        n = -n
+    pos = _put_uint(buf, pos, n // scale)
+    buf[pos] = 46  # '.'
+    return _put_uint(buf, pos + 1, n % scale, decimals)
+
+
+class TelemetryRenderer:
+    """표시 주기로 묶어 출력하는 텔레메트리 렌더러"""
+
+    def __init__(self, rate_hz=5, altitude=None, stream=None):
+        """
+        :param rate_hz: 최대 표시 횟수 (초당 줄 수)
+        :param altitude: 기압(hPa) -> 고도(m) 함수 (None이면 고도 생략, 출력할 때만 계산)
+        :param stream: 출력 스트림 (기본값 sys.stdout)
+        """
+        self.interval_ms = int(1000 / rate_hz)
+        self.altitude = altitude
+        if stream is None:
+            stream = getattr(sys.stdout, "buffer", sys.stdout)
+        self._stream = stream
+        self._buf = bytearray(32)
+        self._names = []  # 표시 순서
+        self._labels = []  # 센서 이름 바이트
+        self._values = []  # 센서별 최신 기압
+        self._fresh = []  # 아직 표시하지 않은 새 값인지
+        self._pending = False
+        self._last = None
+        self.acquired = 0  # update()로 받은 샘플 수
+        self.displayed = 0  # 실제로 출력된 샘플 수
+        self.dropped = 0  # 표시 전에 새 값으로 덮어쓴 샘플 수
+        self.lines = 0
+
+    def update(self, name, pressure):
+        """센서의 새 기압 값 저장 (출력은 render()에서)"""
+        try:
+            i = self._names.index(name)
+        except ValueError:
+            i = len(self._names)
+            self._names.append(name)
+            self._labels.append(name.encode())
+            self._values.append(0.0)
+            self._fresh.append(False)
+            self._buf = bytearray(32 + _FIELD_SIZE * len(self._names))
+        if self._fresh[i]:
+            self.dropped += 1
+        self._values[i] = pressure
+        self._fresh[i] = True
+        self._pending = True
+        self.acquired += 1
+
+    def update_sample(self, sample):
+        """sample_store.Sample의 기압 저장 (sample.sensor는 센서 ID, 표시 이름은 SENSOR_NAMES)"""
+        self.update(SENSOR_NAMES[sample.sensor], sample.pressure)
+
+    def render(self, force=False):
+        """새 값이 있고 표시 주기가 지났으면 한 줄 출력
+        :param force: True면 표시 주기와 관계없이 출력
+        :return: 출력했으면 True
+        """
+        if not self._pending:
+            return False
+        now = time.ticks_ms()
+        if not force and self._last is not None and time.ticks_diff(now, self._last) < self.interval_ms:
+            return False
+
+        buf = self._buf
+        t = time.localtime()
+        buf[0] = 91  # '['
+        pos = _put_uint(buf, 1, t[3], 2)
+        buf[pos] = 58  # ':'
+        pos = _put_uint(buf, pos + 1, t[4], 2)
+        buf[pos] = 58
+        pos = _put_uint(buf, pos + 1, t[5], 2)
+        buf[pos] = 58
+        pos = _put_uint(buf, pos + 1, now % 1000, 3)
+        buf[pos] = 93  # ']'
+        buf[pos + 1] = 32  # ' '
+        pos += 2
+
+        for i in range(len(self._names)):
+            if i:
+                pos = _put_bytes(buf, pos, _SEPARATOR)
+            pos = _put_bytes(buf, pos, self._labels[i])
+            buf[pos] = 32
+            pos = _put_fixed(buf, pos + 1, self._values[i])
+            pos = _put_bytes(buf, pos, _HPA)
+            if self.altitude is not None:
+                buf[pos] = 32
+                pos = _put_fixed(buf, pos + 1, self.altitude(self._values[i]))
+                pos = _put_bytes(buf, pos, _METER)
+            if self._fresh[i]:
+                self._fresh[i] = False
+                self.displayed += 1
+        buf[pos] = 10  # '\n'
+        self._stream.write(memoryview(buf)[:pos + 1])
+
+        self._pending = False
+        self._last = now
+        self.lines += 1
+        return True
+
+    def format_stats(self):
+        """획득/표시/표시 생략 샘플 수"""
+        return f"acquired {self.acquired} displayed {self.displayed} dropped {self.dropped} lines {self.lines}"
@@ -0,0 +1,45 @@
+"""
+온도 보정항 갱신 정책
+주변 온도는 수 초 단위로 변하므로 20~50Hz 기압 측정마다 온도를 다시 읽을 필요가 없다.
+드라이버는 due()가 True일 때만 온도를 읽어 보정항(t_fine, t_lin, scaled_temp)을 갱신하고,
+나머지 샘플에서는 저장된 보정항으로 압력만 읽어 보정한다.
+"""
+import time
+
+
+class TemperatureRefresh:
+    """N 샘플마다 또는 T 밀리초마다 온도 갱신
+
+    둘 다 주지 않으면(기본값) 매 샘플 온도를 갱신하므로 기존 동작과 같다.
+    period_ms만 주면 샘플 수로는 갱신하지 않고 시간 간격으로만 갱신한다.
+    """
+
+    def __init__(self, every=None, period_ms=None):
+        """
+        :param every: 온도를 갱신할 샘플 간격 (1 이상, None이면 사용 안 함)
+        :param period_ms: 온도를 갱신할 최대 시간 간격 (None이면 사용 안 함)
+        """
+        if every is None and period_ms is None:
+            every = 1
+        if every is not None and every < 1:
+            raise ValueError("every는 1 이상이어야 합니다.")
+        self.every = every
+        self.period_ms = period_ms
+        self._samples = 0
+        self._last = None
+
+    def due(self):
+        """이번 샘플에서 온도를 갱신해야 하는지 확인 (샘플마다 한 번 호출)"""
+        self._samples += 1
+        now = time.ticks_ms()
+        if (self._last is None or (self.every is not None and self._samples >= self.every) or
+                (self.period_ms is not None and time.ticks_diff(now, self._last) >= self.period_ms)):
+            self._samples = 0
+            self._last = now
+            return True
+        return False
+
+    def reset(self):
+        """다음 샘플에서 온도를 강제로 갱신 (측정 설정 변경 시)"""
+        self._samples = 0
+        self._last = None
@@ -0,0 +1,6 @@
+"""
+CPython(Linux)에서 드라이버와 런타임을 시험하기 위한 설정 (host.install() 참고)
+"""
+import host
+
+host.install()
@@ -0,0 +1,138 @@
+"""
+하드웨어 대역 (Linux에서 드라이버 시험용)
+FakeI2C는 주소별 256바이트 레지스터 메모리를 가진 I2C 버스로, machine.I2C의 메모리 접근 API를 흉내 낸다.
+FakePin은 machine.Pin의 irq()를 흉내 내며, pulse()로 센서 INT 출력의 상승 에지를 만든다.
+make_*()는 보정 계수와 측정값을 채운 버스에 최상위 드라이버를 만들어 돌려준다.
+"""
+
+# 실제 칩에서 읽은 보정 계수 NVM 바이트
+BMP280_CALIBRATION = bytes((0x70, 0x6B, 0x43, 0x67, 0x18, 0xFC, 0x7D, 0x8E, 0x43, 0xD6, 0xD0, 0x0B,
+                            0x27, 0x0B, 0x8C, 0x00, 0xF9, 0xFF, 0x8C, 0x3C, 0xF8, 0xC6, 0x70, 0x17))
+BMP388_CALIBRATION = bytes((0x10, 0x6B, 0x4C, 0x4B, 0xF6, 0x98, 0xF2, 0x25, 0xF6, 0x23, 0x00,
+                            0x80, 0x62, 0x30, 0x76, 0x03, 0xFA, 0x85, 0x37, 0x05, 0xC4))
+
+
+class FakeI2C:
+    """레지스터 메모리 기반 가짜 I2C 버스"""
+
+    def __init__(self):
+        self.mem = {}  # 주소 -> bytearray(256)
+        self.transactions = 0
+        self.clear_on_read = set()  # 읽으면 0이 되는 (주소, 레지스터) (인터럽트 상태 등)
+
+    def device(self, addr):
+        """주소에 장치 추가 (이미 있으면 그대로) 후 레지스터 메모리 반환"""
+        return self.mem.setdefault(addr, bytearray(256))
+
+    def set(self, addr, register, data):
+        """레지스터 내용 설정 (정수 하나 또는 바이트열)"""
+        regs = self.device(addr)
+        if isinstance(data, int):
+            data = bytes((data,))
+        regs[register:register + len(data)] = data
+
+    def _regs(self, addr):
+        if addr not in self.mem:
+            raise OSError(19)  # ENODEV: 응답 없음
+        return self.mem[addr]
+
+    def scan(self):
+        self.transactions += 1
+        return sorted(self.mem)
+
+    def writeto(self, addr, data):
+        self.transactions += 1
+        self._regs(addr)
+        return len(data)
+
+    def _clear(self, addr, register, nbytes):
+        for reg in range(register, register + nbytes):
+            if (addr, reg) in self.clear_on_read:
+                self.mem[addr][reg] = 0
+
+    def readfrom_mem(self, addr, register, nbytes):
+        self.transactions += 1
+        data = bytes(self._regs(addr)[register:register + nbytes])
+        self._clear(addr, register, nbytes)
+        return data
+
+    def readfrom_mem_into(self, addr, register, buf):
+        self.transactions += 1
+        regs = self._regs(addr)
+        for i in range(len(buf)):
+            buf[i] = regs[register + i]
+        self._clear(addr, register, len(buf))
+
+    def writeto_mem(self, addr, register, data):
+        self.transactions += 1
+        regs = self._regs(addr)
+        regs[register:register + len(data)] = bytes(data)
+
+
+class FakePin:
+    """인터럽트 입력 핀 대역"""
+    IN = 0
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, value=0):
+        self._value = value
+        self.handler = None
+        self.trigger = 0
+
+    def value(self, level=None):
+        if level is None:
+            return self._value
+        rising = level and not self._value
+        falling = self._value and not level
+        self._value = level
+        if self.handler is not None and ((rising and self.trigger & self.IRQ_RISING) or
+                                         (falling and self.trigger & self.IRQ_FALLING)):
+            self.handler(self)
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING):
+        self.handler = handler
+        self.trigger = trigger
+
+    def pulse(self):
+        """상승 에지 후 다시 0 (센서의 펄스 인터럽트)"""
+        self.value(1)
+        self.value(0)
+
+
+def make_bmp280():
+    """보정 계수와 측정값이 채워진 버스 위의 BMP280 (0x76)"""
+    from bmp280 import BMP280
+
+    i2c = FakeI2C()
+    i2c.set(0x76, 0xD0, 0x58)
+    i2c.set(0x76, 0x88, BMP280_CALIBRATION)
+    sensor = BMP280(i2c)
+    i2c.set(0x76, 0xF7, bytes((0x65, 0x5A, 0xC0, 0x7E, 0xED, 0x00)))
+    return sensor
+
+
+def make_bmp388(**kwargs):
+    """보정 계수와 측정값이 채워진 버스 위의 BMP388 (0x77)"""
+    from bmp388 import BMP388
+
+    i2c = FakeI2C()
+    i2c.set(0x77, 0x00, 0x50)
+    i2c.set(0x77, 0x31, BMP388_CALIBRATION)
+    sensor = BMP388(i2c, **kwargs)
+    i2c.set(0x77, 0x03, 0x70)  # 명령 준비, 압력/온도 데이터 준비
+    i2c.set(0x77, 0x04, bytes((0x00, 0x60, 0x6B, 0x00, 0x80, 0x81)))
+    return sensor
+
+
+def make_dps310():
+    """보정 계수와 측정값이 채워진 버스 위의 DPS310 (0x77)"""
+    from dps310 import DPS310
+
+    i2c = FakeI2C()
+    i2c.set(0x77, 0x0D, 0x10)
+    i2c.set(0x77, 0x08, 0xF0)  # 계수/센서 준비
+    sensor = DPS310(i2c)
+    i2c.set(0x77, 0x08, 0xF7)  # 연속 측정, 압력/온도 결과 준비
+    i2c.set(0x77, 0x00, bytes((0xF5, 0x12, 0x34, 0x08, 0x56, 0x78)))
+    return sensor
@@ -0,0 +1,69 @@
+"""
+CPython(Linux)에서 MicroPython 전용 내장 기능을 같은 의미로 채운다 (tests/conftest.py와 benchmarks 공용)
+micropython.const, ustruct/utime 별칭, 30비트 time.ticks_*, time.sleep_ms/sleep_us, 클래스 본문 const() 이름 (class_consts)
+MicroPython(unix 포트 포함)에서는 아무것도 바꾸지 않는다.
+"""
+import sys
+import time
+
+TESTS = __file__.rsplit("/", 1)[0] if "/" in __file__ else "."  # MicroPython에는 os.path가 없음
+ROOT = TESTS + "/.."
+
+
+def install():
+    """저장소 루트와 tests를 sys.path에 넣고 빠진 내장 기능 채우기"""
+    for path in (TESTS, ROOT):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    if "micropython" not in sys.modules:
+        try:
+            import micropython  # noqa: F401
+        except ImportError:
+            micropython = type(sys)("micropython")
+            micropython.const = lambda value: value
+            sys.modules["micropython"] = micropython
+
+    for alias, name in (("ustruct", "struct"), ("utime", "time")):  # lib/bmp280이 쓰는 옛 이름
+        if alias not in sys.modules:
+            try:
+                __import__(alias)
+            except ImportError:
+                sys.modules[alias] = __import__(name)
+
+    if hasattr(time, "ticks_ms"):
+        return
+    period = 1 << 30  # MicroPython과 같은 30비트 ticks
+    start = time.perf_counter()
+
+    def ticks_ms():
+        return int((time.perf_counter() - start) * 1000) & (period - 1)
+
+    def ticks_us():
+        return int((time.perf_counter() - start) * 1000000) & (period - 1)
+
+    def ticks_diff(a, b):
+        return ((a - b + period // 2) & (period - 1)) - period // 2
+
+    def ticks_add(a, b):
+        return (a + b) & (period - 1)
+
+    time.ticks_ms = ticks_ms
+    time.ticks_us = ticks_us
+    time.ticks_diff = ticks_diff
+    time.ticks_add = ticks_add
+    time.sleep_ms = lambda ms: time.sleep(ms / 1000)
+    time.sleep_us = lambda us: time.sleep(us / 1000000)
+
+
+def class_consts(module):
+    """MicroPython 파서는 클래스 본문에서 const()로 정의한 이름도 모듈 전체에서 치환한다.
+    lib 드라이버의 메서드가 그 이름을 그대로 쓰므로 CPython에서는 모듈 전역으로 복사해 흉내 낸다.
+    """
+    klasses = [value for value in vars(module).values() if isinstance(value, type)]
+    for klass in klasses:
+        klasses.extend(base for base in klass.__bases__ if base is not object and base not in klasses)
+        for name, value in vars(klass).items():
+            if isinstance(value, int) and name.lstrip("_").isupper() and not hasattr(module, name):
+                setattr(module, name, value)
+    return module
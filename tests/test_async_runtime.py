@@ -0,0 +1,81 @@
+"""
+asyncio 측정 런타임 시험: 변환 시간이 다른 두 센서가 이벤트 루프에서 서로를 막지 않고 번갈아 측정되는지
+"""
+import asyncio
+import time
+
+from async_runtime import AsyncRuntime, read_async
+from fakes import make_bmp388, make_dps310
+
+
+class ConvertingI2C:
+    """측정 하나에 conversion_ms가 걸리는 버스 감싸기
+    결과 레지스터를 읽으면 상태 레지스터의 준비 비트가 내려가고, conversion_ms가 지나면 다시 선다.
+    """
+
+    def __init__(self, i2c, status_reg, ready_bits, data_reg, conversion_ms):
+        self.i2c = i2c
+        self.status_reg = status_reg
+        self.ready_bits = ready_bits
+        self.data_reg = data_reg
+        self.conversion_ms = conversion_ms
+        self.started = time.ticks_ms()
+
+    def readfrom_mem_into(self, addr, register, buf):
+        self.i2c.readfrom_mem_into(addr, register, buf)
+        if register == self.data_reg:
+            self.started = time.ticks_ms()
+        elif register == self.status_reg and time.ticks_diff(time.ticks_ms(), self.started) < self.conversion_ms:
+            buf[0] &= ~self.ready_bits
+
+    def __getattr__(self, name):
+        return getattr(self.i2c, name)
+
+
+def sensors(fast_ms, slow_ms):
+    """(변환 fast_ms인 BMP388, 변환 slow_ms인 DPS310)"""
+    bmp388 = make_bmp388()
+    bmp388.i2c = ConvertingI2C(bmp388.i2c, 0x03, 0x60, 0x04, fast_ms)
+    dps310 = make_dps310()
+    dps310.i2c = ConvertingI2C(dps310.i2c, 0x08, 0x30, 0x00, slow_ms)
+    return bmp388, dps310
+
+
+def test_read_async_yields_while_waiting():
+    bmp388, dps310 = sensors(10, 60)
+    finished = []
+
+    async def read(name, sensor):
+        await read_async(sensor, poll_ms=2)
+        finished.append(name)
+
+    async def main():
+        await asyncio.gather(read("DPS310", dps310), read("BMP388", bmp388))
+
+    asyncio.run(main())
+    assert finished == ["BMP388", "DPS310"]  # 느린 센서를 먼저 기다려도 빠른 센서가 먼저 끝남
+
+
+def test_two_sensors_interleave():
+    bmp388, dps310 = sensors(10, 60)
+    runtime = AsyncRuntime()
+    runtime.add("BMP388", bmp388, 10, poll_ms=2)
+    runtime.add("DPS310", dps310, 60, poll_ms=2)
+
+    async def main():
+        runtime.start()
+        await asyncio.sleep(0.4)
+        runtime.stop()
+        samples = []
+        while runtime.queue.qsize():
+            samples.append(await runtime.queue.get())
+        return samples
+
+    names = [sample[0] for sample in asyncio.run(main())]
+    assert runtime.errors == 0 and runtime.queue.dropped == 0
+    assert names.count("DPS310") >= 3
+    assert names.count("BMP388") >= 3 * names.count("DPS310")
+    # DPS310 변환을 기다리는 동안에도 BMP388 샘플이 계속 들어옴
+    dps310_at = [i for i, name in enumerate(names) if name == "DPS310"]
+    for before, after in zip(dps310_at, dps310_at[1:]):
+        assert "BMP388" in names[before + 1:after]
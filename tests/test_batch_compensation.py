@@ -0,0 +1,76 @@
+"""
+배치 보정 시험: 각 compensate_*가 드라이버의 스칼라 보정 경로와 비트 단위로 같은 값을 내는지
+원시 값 범위의 양 끝과 부호 경계를 포함한 값들을 훑는다 (array 경로, NumPy가 있으면 NumPy 경로도).
+"""
+import pytest
+
+import batch_compensation
+from fakes import BMP280_CALIBRATION, FakeI2C, make_bmp280, make_bmp388, make_dps310
+
+# 20비트 BMP280 ADC, 24비트 BMP388 ADC (부호 없음), 24비트 DPS310 결과 (부호 있음)
+ADC20 = (0, 1, 0x3FFFF, 0x655AC, 0x7EED0, 0x80000, 0xC0000, 0xFFFFE, 0xFFFFF)
+ADC24 = (0, 1, 0x3FFFFF, 0x6B6000, 0x808000, 0x800000, 0xC00000, 0xFFFFFE, 0xFFFFFF)
+SIGNED24 = (-0x800000, -0x7FFFFF, -0xADCC, -1, 0, 1, 0x12345, 0x7FFFFE, 0x7FFFFF)
+
+
+def sweep(values):
+    """values의 모든 (압력, 온도) 조합을 두 배열로"""
+    press = [p for p in values for _ in values]
+    temp = [t for _ in values for t in values]
+    return press, temp
+
+
+def lib_bmp280():
+    from lib.bmp280 import BMP280I2C
+
+    i2c = FakeI2C()
+    i2c.set(0x76, 0x88, BMP280_CALIBRATION)
+    return BMP280I2C(0x76, i2c)
+
+
+def scalar(sensor, p, t):
+    """최상위 드라이버: compensate()가 (hPa, °C)"""
+    return sensor.compensate(p, t)
+
+
+def scalar_lib_bmp280(sensor, p, t):
+    temperature, t_fine = sensor._calculate_temperature(t)
+    return sensor._calculate_pressure(p, t_fine), temperature
+
+
+# (배치 함수, 드라이버 만들기, 스칼라 경로, 원시 값, 추가 인자)
+CASES = {
+    "bmp280": (batch_compensation.compensate_bmp280, make_bmp280, scalar, ADC20, ()),
+    "bmp280_float": (batch_compensation.compensate_bmp280_float, lib_bmp280, scalar_lib_bmp280, ADC20, ()),
+    "bmp388": (batch_compensation.compensate_bmp388, make_bmp388, scalar, ADC24, ()),
+    "dps310": (batch_compensation.compensate_dps310, make_dps310, scalar, SIGNED24, ("press_scale", "temp_scale")),
+}
+
+
+def check(name):
+    compensate, make, reference, values, scale_names = CASES[name]
+    sensor = make()
+    press, temp = sweep(values)
+    scales = [getattr(sensor, scale) for scale in scale_names]
+    pressure, temperature = compensate(sensor.coefficients, press, temp, *scales)
+    assert len(pressure) == len(temperature) == len(press)
+    for i, (p, t) in enumerate(zip(press, temp)):
+        expected = reference(sensor, p, t)
+        assert (float(pressure[i]), float(temperature[i])) == expected, (name, p, t)
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_array_matches_scalar(name, monkeypatch):
+    monkeypatch.setattr(batch_compensation, "np", None)
+    check(name)
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_numpy_matches_scalar(name, monkeypatch):
+    monkeypatch.setattr(batch_compensation, "np", pytest.importorskip("numpy"))
+    check(name)
+
+
+def test_length_mismatch():
+    with pytest.raises(ValueError):
+        batch_compensation.compensate_bmp388(make_bmp388().coefficients, [1, 2], [1])
@@ -0,0 +1,92 @@
+"""
+BMP388 정수 보정 경로 적합성 시험
+1) Bosch BMP3 정수 참조 구현(C 의미론: 0 방향 버림 나눗셈)을 따로 옮긴 기준과 비트 단위로 같은지
+2) 원시 ADC 전 범위(24비트)에서 실수 경로와의 차이가 허용 오차 안인지
+   - 기압: 동작 범위(300~1250 hPa)에 드는 결과에서 0.05 Pa 이하 (정수 출력 분해능 0.01 Pa)
+   - 온도: -40~85 °C에서 0.001 °C 이하 (t_lin 정수는 °C x 65536)
+"""
+import struct
+
+import pytest
+
+from bmp388 import BMP388
+from fakes import FakeI2C
+
+PRESSURE_TOLERANCE_PA = 0.05
+TEMPERATURE_TOLERANCE_C = 0.001
+
+# 실제 칩에서 읽은 보정 NVM 값
+CALIBRATION = dict(T1=27554, T2=19224, T3=-10, P1=-3432, P2=-2523, P3=35, P4=0, P5=25216, P6=30256,
+                   P7=3, P8=-6, P9=14213, P10=5, P11=-60)
+_ORDER = ("T1", "T2", "T3", "P1", "P2", "P3", "P4", "P5", "P6", "P7", "P8", "P9", "P10", "P11")
+
+
+@pytest.fixture(scope="module")
+def sensor():
+    i2c = FakeI2C()
+    i2c.set(0x77, 0x00, 0x50)
+    i2c.set(0x77, 0x31, struct.pack("<HHbhhbbHHbbhbb", *[CALIBRATION[k] for k in _ORDER]))
+    return BMP388(i2c, integer=True)
+
+
+def _cdiv(a, b):
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+
+def reference_temperature(c, raw):
+    p1 = raw - 256 * c["T1"]
+    p5 = c["T2"] * p1 * 262144 + p1 * p1 * c["T3"]
+    return _cdiv(p5, 4294967296)
+
+
+def reference_pressure(c, raw, t_lin):
+    pd1 = t_lin * t_lin
+    pd3 = _cdiv(_cdiv(pd1, 64) * t_lin, 256)
+    offset = c["P5"] * 140737488355328 + _cdiv(c["P8"] * pd3, 32) + c["P7"] * pd1 * 16 + c["P6"] * t_lin * 4194304
+    sensitivity = ((c["P1"] - 16384) * 70368744177664 + _cdiv(c["P4"] * pd3, 32) + c["P3"] * pd1 * 4 +
+                   (c["P2"] - 16384) * t_lin * 2097152)
+    pd1 = _cdiv(sensitivity, 16777216) * raw
+    pd4 = _cdiv((c["P10"] * t_lin + 65536 * c["P9"]) * raw, 8192)
+    pd5 = _cdiv(raw * _cdiv(pd4, 10), 512) * 10
+    pd3 = _cdiv(_cdiv(c["P11"] * raw * raw, 65536) * raw, 128)
+    return (_cdiv(offset, 4) + pd1 + pd5 + pd3) * 25 // 1099511627776
+
+
+RAW_TEMPS = range(0, 1 << 24, 1 << 16)
+RAW_PRESSURES = range(0, 1 << 24, 1 << 13)
+
+
+def test_matches_bosch_integer_reference(sensor):
+    for raw_temp in range(0, 1 << 24, 1 << 18):
+        t_lin = sensor.compensate_temperature_int(raw_temp)
+        assert t_lin == reference_temperature(CALIBRATION, raw_temp)
+        for raw_press in range(0, 1 << 24, 1 << 16):
+            assert sensor.compensate_pressure_int(raw_press, t_lin) == reference_pressure(CALIBRATION, raw_press, t_lin)
+
+
+def test_integer_path_within_tolerance_of_float_path(sensor):
+    compared = 0
+    worst_pa = worst_c = 0.0
+    for raw_temp in RAW_TEMPS:
+        t_float = sensor.compensate_temperature(raw_temp)
+        if not -40.0 <= t_float <= 85.0:
+            continue
+        t_int = sensor.compensate_temperature_int(raw_temp)
+        worst_c = max(worst_c, abs(t_int / 65536 - t_float))
+        for raw_press in RAW_PRESSURES:
+            p_float = sensor.compensate_pressure(raw_press, t_float)
+            if not 30000.0 <= p_float <= 125000.0:
+                continue
+            worst_pa = max(worst_pa, abs(sensor.compensate_pressure_int(raw_press, t_int) / 100 - p_float))
+            compared += 1
+    assert compared > 10000
+    assert worst_c <= TEMPERATURE_TOLERANCE_C
+    assert worst_pa <= PRESSURE_TOLERANCE_PA
+
+
+def test_compensate_dispatches_on_integer_flag(sensor):
+    pressure, temperature = sensor.compensate(6000000, 8000000)
+    t_lin = sensor.compensate_temperature(8000000)
+    assert pressure == pytest.approx(sensor.compensate_pressure(6000000, t_lin) / 100, abs=PRESSURE_TOLERANCE_PA / 100)
+    assert temperature == pytest.approx(t_lin, abs=0.01)
@@ -0,0 +1,75 @@
+"""
+센서 자동 탐색 시험 (칩 판별 순서와 드라이버의 ID 재확인)
+"""
+import pytest
+
+import discovery
+from fakes import FakeI2C
+
+
+def bmp388_bus(sensortime_1):
+    i2c = FakeI2C()
+    i2c.set(0x77, 0x00, 0x50)
+    i2c.set(0x77, 0x0D, sensortime_1)  # BMP3 SENSORTIME_1: 계속 증가하는 카운터
+    return i2c
+
+
+def dps310_bus(psr_b2=0x00):
+    i2c = FakeI2C()
+    i2c.set(0x77, 0x00, psr_b2)  # 압력 데이터 최상위 바이트
+    i2c.set(0x77, 0x0D, 0x10)
+    return i2c
+
+
+def test_bmp388_never_identified_as_dps310():
+    for sensortime_1 in range(256):  # 0x10일 때 DPS310 ID와 같아짐
+        chip, chip_id = discovery.identify(bmp388_bus(sensortime_1), 0x77)
+        assert (chip[0], chip_id) == ("BMP388", 0x50)
+
+
+def test_dps310_identified():
+    for psr_b2 in (0x00, 0x0F, 0xF3, 0xFF):
+        chip, chip_id = discovery.identify(dps310_bus(psr_b2), 0x77)
+        assert (chip[0], chip_id) == ("DPS310", 0x10)
+
+
+def test_discover_builds_drivers():
+    registry = discovery.discover({0: bmp388_bus(0x10), 1: dps310_bus()}, start=False)
+    assert [(name, bus, addr) for name, bus, addr, _ in registry] == [("BMP388", 0, 0x77), ("DPS310", 1, 0x77)]
+    assert registry.scans == 2
+
+
+def test_driver_rechecks_id_after_discovery():
+    # 칩 표가 다른 레지스터에서 DPS310 ID 값을 읽어 잘못 판별해도 드라이버가 0x0D를 직접 읽어 거부
+    i2c = FakeI2C()
+    i2c.set(0x77, 0x00, 0x10)
+    chips = (("DPS310", (0x77,), 0x00, 0x10, discovery._dps310),)
+    with pytest.raises(RuntimeError):
+        discovery.discover({0: i2c}, start=False, chips=chips)
+
+
+def test_bmp390_uses_bmp388_driver():
+    from bmp388 import BMP388
+    from fakes import BMP388_CALIBRATION
+
+    i2c = FakeI2C()
+    i2c.set(0x77, 0x00, 0x60)
+    i2c.set(0x77, 0x03, 0x70)  # 명령 준비, 압력/온도 데이터 준비
+    i2c.set(0x77, 0x31, BMP388_CALIBRATION)
+    i2c.set(0x77, 0x04, bytes((0x00, 0x60, 0x6B, 0x00, 0x80, 0x81)))
+    registry = discovery.discover({0: i2c})
+    sensor = registry.get("BMP390")
+    assert isinstance(sensor, BMP388) and sensor.chip_id == 0x60
+    pressure, temperature = sensor.read()
+    assert 300 < pressure < 1250 and -40 < temperature < 85
+
+
+def test_lib_bmp388_imports_with_repo_root_first():
+    # 장치의 sys.path 순서('' 다음 '/lib')에서는 최상위 bmp388.py가 bmp388 이름을 가린다
+    import sys
+
+    import bmp388
+    from lib.bmp388 import bmpxxx
+
+    assert bmpxxx.BMP390.__module__ == "lib.bmp388.bmp390"
+    assert sys.modules["bmp388"] is bmp388 and hasattr(bmp388, "BMP388")
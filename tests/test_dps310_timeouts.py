@@ -0,0 +1,61 @@
+"""
+DPS310 대기 루프 시간 제한 시험 (센서가 멈추거나 버스에 결과가 오지 않을 때 무한 대기하지 않음)
+"""
+import time
+
+import pytest
+
+from dps310 import DPS310
+from fakes import FakeI2C, make_dps310
+from lib.dps310 import dps310 as lib_dps310
+from lib.dps310 import dps310_ORG
+
+_MEAS_CFG = 0x08
+
+
+def lib_sensor(status=0xF7, module=lib_dps310):
+    i2c = FakeI2C()
+    i2c.set(0x77, 0x0D, 0x10)
+    i2c.set(0x77, _MEAS_CFG, status)
+    return i2c, module.DPS310(i2c)
+
+
+def test_read_times_out_without_results():
+    sensor = make_dps310()
+    sensor.MEASUREMENT_TIMEOUT_MS = 20
+    sensor.i2c.set(0x77, _MEAS_CFG, 0xC7)  # 연속 측정 중이지만 결과 없음
+    for read in (sensor.read, sensor.read_raw_pressure, sensor.read_raw_temperature):
+        start = time.monotonic()
+        with pytest.raises(RuntimeError):
+            read()
+        assert time.monotonic() - start < 1
+
+
+def test_calibration_wait_times_out():
+    i2c = FakeI2C()
+    i2c.set(0x77, 0x0D, 0x10)  # 계수 준비 비트가 서지 않음
+    with pytest.raises(RuntimeError):
+        DPS310(i2c)
+
+
+def test_lib_read_returns_when_ready():
+    i2c, sensor = lib_sensor()
+    i2c.set(0x77, 0x00, bytes((0xF5, 0x12, 0x34, 0x08, 0x56, 0x78)))
+    pressure, temperature = sensor.read()
+    assert isinstance(pressure, float) and isinstance(temperature, float)
+
+
+@pytest.mark.parametrize("module", (lib_dps310, dps310_ORG))
+def test_lib_read_times_out_without_results(module):
+    i2c, sensor = lib_sensor(module=module)
+    i2c.set(0x77, _MEAS_CFG, 0xC7)
+    with pytest.raises(RuntimeError):
+        sensor.read(timeout_ms=20)
+    if module is lib_dps310:
+        with pytest.raises(RuntimeError):
+            sensor.wait_pressure_ready(timeout_ms=20)
+
+
+def test_lib_calibration_wait_times_out():
+    with pytest.raises(RuntimeError):
+        lib_sensor(status=0x40)  # 센서 준비, 계수 준비 안 됨
@@ -0,0 +1,41 @@
+"""
+듀얼 코어 측정 엔진 시험 (CPython에서는 _thread 스레드가 코어 1 역할)
+"""
+import time
+
+import pytest
+
+from dual_core import DualCoreEngine
+from fakes import make_bmp388, make_dps310
+
+
+def run(engine, seconds):
+    engine.start()
+    time.sleep(seconds)
+    engine.stop()
+
+
+def test_samples_keep_their_sensor():
+    bmp388, dps310 = make_bmp388(), make_dps310()
+    engine = DualCoreEngine()
+    engine.add("BMP388", bmp388, 10)
+    engine.add("DPS310", dps310, 20)
+    run(engine, 0.1)
+
+    samples = engine.process()
+    assert engine.errors == 0 and engine.ring.dropped == 0
+    assert len(samples) == engine.captured
+    expected = {"BMP388": bmp388.read(wait=False), "DPS310": dps310.read(wait=False)}
+    assert {name for name, _, _, _ in samples} == set(expected)
+    for name, _, pressure, temperature in samples:
+        assert (pressure, temperature) == pytest.approx(expected[name])
+    assert engine.process() == []
+
+
+def test_full_ring_drops_new_samples():
+    engine = DualCoreEngine(size=4)
+    engine.add("BMP388", make_bmp388(), 1)
+    run(engine, 0.05)
+
+    assert len(engine.process()) == 4
+    assert engine.ring.dropped == engine.captured - 4
@@ -0,0 +1,60 @@
+"""
+BMP388/DPS310 FIFO 시험
+"""
+import pytest
+
+from fakes import FakeI2C, make_bmp388, make_dps310
+
+_FIFO_DATA = 0x14
+
+
+class FifoI2C(FakeI2C):
+    """FIFO_DATA(0x14) 읽기에 준비한 프레임과 센서 시간 프레임을 돌려주는 버스"""
+
+    def __init__(self):
+        super().__init__()
+        self.frames = b""
+
+    def readfrom_mem_into(self, addr, register, buf):
+        if register != _FIFO_DATA:
+            return super().readfrom_mem_into(addr, register, buf)
+        self.transactions += 1
+        data = self.frames + bytes((0xA0, 0x34, 0x12, 0x00)) + b"\x80" * len(buf)
+        buf[:] = data[:len(buf)]
+
+
+def test_fifo_length_before_enable():
+    sensor = make_bmp388()
+    assert sensor.fifo_length() == 0
+    with pytest.raises(RuntimeError):
+        sensor.read_fifo()
+
+
+def test_read_fifo_one_burst():
+    sensor = make_bmp388()
+    i2c = FifoI2C()
+    i2c.mem = sensor.i2c.mem
+    sensor.i2c = i2c
+    sensor.enable_fifo(watermark=16)
+    regs = i2c.device(0x77)
+    assert regs[0x15] | regs[0x16] << 8 == 16 * 7
+
+    frames = b""
+    expected = []
+    for k in range(5):
+        raw_temp, raw_press = 8000000 + k * 100, 6000000 + k * 50
+        frames += bytes((0x94,)) + raw_temp.to_bytes(3, "little") + raw_press.to_bytes(3, "little")
+        t_lin = sensor.compensate_temperature(raw_temp)
+        expected.append((sensor.compensate_pressure(raw_press, t_lin) / 100.0, t_lin))
+    i2c.frames = frames
+    regs[0x12], regs[0x13] = len(frames) & 0xFF, len(frames) >> 8
+
+    before = i2c.transactions
+    assert sensor.read_fifo() == expected
+    assert i2c.transactions - before == 2  # FIFO 길이 + 버스트 읽기
+    assert sensor.sensor_time == 0x1234
+
+
+def test_dps310_read_fifo_before_enable():
+    with pytest.raises(RuntimeError):
+        make_dps310().read_fifo()
@@ -0,0 +1,98 @@
+"""
+바이너리 텔레메트리 프레임 시험: 인코드/디코드, 재동기화, 손실 집계, pty 왕복
+"""
+import binascii
+import os
+import threading
+import time
+
+import pytest
+
+import frame_protocol
+from frame_protocol import FRAME_SIZE, FrameDecoder, FrameWriter, receive
+from sensor_ids import SENSOR_IDS
+
+
+class Capture:
+    """FrameWriter 출력 스트림 대역"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+
+    def data(self):
+        return b"".join(self.chunks)
+
+
+def frames(count, gap_at=None, gap=0):
+    """count개 프레임 바이트열 (gap_at번째 앞에서 순번을 gap만큼 건너뜀)"""
+    out = Capture()
+    writer = FrameWriter(out)
+    names = ("BMP280", "DPS310", "BMP388")
+    for i in range(count):
+        if i == gap_at:
+            writer.seq += gap
+        writer.write(names[i % 3], i, 1000.0 + (i % 500) * 0.01, 20.0 + (i % 100) / 100)
+    return out.data()
+
+
+def test_crc_table_matches_crc_hqx(monkeypatch):
+    monkeypatch.setattr(frame_protocol, "crc_hqx", None)
+    for data in (b"", b"123456789", bytes(range(13))):
+        assert frame_protocol.crc16(data) == binascii.crc_hqx(data, 0xFFFF)
+
+
+def test_round_trip_values():
+    decoder = FrameDecoder()
+    decoded = decoder.feed(frames(3))
+    assert len(frames(3)) == 3 * FRAME_SIZE
+    assert [(seq, sensor, ts) for seq, sensor, ts, _, _ in decoded] == [
+        (0, SENSOR_IDS["BMP280"], 0), (1, SENSOR_IDS["DPS310"], 1), (2, SENSOR_IDS["BMP388"], 2)]
+    assert decoded[1][3] == pytest.approx(1000.01, abs=1e-4)  # 0.1 Pa 단위
+    assert decoded[1][4] == pytest.approx(20.01, abs=1e-6)
+
+
+def test_resync_after_noise_and_corruption():
+    data = frames(100)
+    data = data[:500] + b"print noise\r\n\xaa\xaa\x55junk" + data[500:]  # 프레임 중간에 끼어든 출력
+    data = bytearray(data)
+    data[1200] ^= 0xFF  # CRC 오류
+    decoder = FrameDecoder()
+    decoded = []
+    for k in range(0, len(data), 7):  # 작은 조각으로 나눠 도착
+        decoded.extend(decoder.feed(bytes(data[k:k + 7])))
+    assert len(decoded) == 98
+    assert decoder.crc_errors >= 1
+    assert decoder.dropped == 2
+
+
+def test_pty_round_trip():
+    pty = pytest.importorskip("pty")
+    count = 20000
+    data = frames(count, gap_at=1000, gap=5)  # 장치 쪽에서 5프레임 손실
+    master, slave = pty.openpty()
+    path = os.ttyname(slave)
+    received = []
+    result = {}
+
+    def reader():
+        result["decoder"] = receive(path, received.extend)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    try:
+        time.sleep(0.2)  # receive()가 raw 모드로 열 때까지 기다렸다가 보냄 (그 전에는 개행 변환이 일어남)
+        os.close(slave)
+        for k in range(0, len(data), 997):
+            os.write(master, data[k:k + 997])
+        time.sleep(0.3)
+    finally:
+        os.close(master)
+        thread.join(10)
+
+    decoder = result["decoder"]
+    assert len(received) == count
+    assert decoder.dropped == 5 and decoder.crc_errors == 0
+    assert [frame[2] for frame in received] == list(range(count))
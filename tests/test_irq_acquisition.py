@@ -0,0 +1,106 @@
+"""
+인터럽트 기반 수집 시험 (FakePin 상승 에지 -> handle_drdy -> SampleRing)
+"""
+import pytest
+
+from fakes import FakePin, make_bmp388, make_dps310
+from irq_acquisition import IrqAcquisition
+
+_BMP388 = 0x77
+_BMP388_INT_STATUS = 0x11
+_BMP388_INT_CTRL = 0x19
+_DPS310 = 0x77
+_DPS310_CFG_REG = 0x09
+_DPS310_INT_STS = 0x0A
+
+
+def bmp388_acquisition(size=8, **kwargs):
+    sensor = make_bmp388(**kwargs)
+    sensor.i2c.clear_on_read.add((_BMP388, _BMP388_INT_STATUS))
+    pin = FakePin()
+    acq = IrqAcquisition(sensor, pin, size=size)
+    acq.start()
+    return sensor, pin, acq
+
+
+def bmp388_measure(sensor, pin, raw_press, raw_temp):
+    """변환 완료: 데이터 레지스터와 INT_STATUS를 채우고 INT 펄스"""
+    sensor.i2c.set(_BMP388, 0x04, raw_press.to_bytes(3, "little") + raw_temp.to_bytes(3, "little"))
+    sensor.i2c.set(_BMP388, _BMP388_INT_STATUS, 0x08)
+    pin.pulse()
+
+
+@pytest.mark.parametrize("integer", [False, True])
+def test_bmp388_edge_stores_raw_and_compensated(integer):
+    sensor, pin, acq = bmp388_acquisition(integer=integer)
+    assert sensor.i2c.mem[_BMP388][_BMP388_INT_CTRL] == 0x42  # DRDY_EN | 액티브 하이
+    assert pin.trigger == FakePin.IRQ_RISING
+
+    bmp388_measure(sensor, pin, 6000000, 8000000)
+    bmp388_measure(sensor, pin, 6000100, 8000050)
+
+    assert acq.acquired == 2
+    ring = acq.ring
+    assert list(ring.raw_pressure[:2]) == [6000000, 6000100]
+    assert list(ring.raw_temp[:2]) == [8000000, 8000050]
+
+    reference = make_bmp388(integer=integer)
+    for i, (raw_press, raw_temp) in enumerate(((6000000, 8000000), (6000100, 8000050))):
+        pressure, temperature = reference.compensate(raw_press, raw_temp)
+        assert ring.pressure[i] == pytest.approx(pressure, rel=1e-6)
+        assert ring.temperature[i] == pytest.approx(temperature, abs=1e-4)
+    # 정수 설정이면 정수 경로만 사용
+    assert (sensor.t_lin_int is not None) == integer
+
+
+def test_bmp388_edge_without_new_data_is_ignored():
+    sensor, pin, acq = bmp388_acquisition()
+    bmp388_measure(sensor, pin, 6000000, 8000000)
+    before = sensor.i2c.transactions
+    pin.pulse()  # INT_STATUS는 읽을 때 지워졌으므로 데이터 없음
+    assert acq.acquired == 1
+    assert sensor.i2c.transactions - before == 1  # INT_STATUS만 읽음
+
+
+def test_bmp388_full_ring_drops_new_samples():
+    sensor, pin, acq = bmp388_acquisition(size=2)
+    for k in range(3):
+        bmp388_measure(sensor, pin, 6000000 + k, 8000000)
+    assert acq.available() == 2 and acq.dropped == 1
+    assert list(acq.ring.raw_pressure[:2]) == [6000000, 6000001]  # 마지막 샘플을 버림
+    assert len(acq.drain()) == 2 and acq.available() == 0
+
+
+def test_bmp388_stop_releases_pin():
+    sensor, pin, acq = bmp388_acquisition()
+    acq.stop()
+    assert pin.handler is None
+    assert sensor.i2c.mem[_BMP388][_BMP388_INT_CTRL] == 0x02
+    bmp388_measure(sensor, pin, 6000000, 8000000)
+    assert acq.acquired == 0
+
+
+def test_dps310_pairs_temperature_with_next_pressure():
+    sensor = make_dps310()
+    i2c = sensor.i2c
+    i2c.clear_on_read.add((_DPS310, _DPS310_INT_STS))
+    pin = FakePin()
+    acq = IrqAcquisition(sensor, pin)
+    acq.start()
+    assert i2c.mem[_DPS310][_DPS310_CFG_REG] & 0xB0 == 0xB0  # 액티브 하이, 압력/온도 인터럽트
+
+    i2c.set(_DPS310, 0x00, bytes((0xF5, 0x12, 0x34, 0x08, 0x56, 0x78)))
+    i2c.set(_DPS310, _DPS310_INT_STS, 0x01)
+    pin.pulse()  # 온도가 아직 없으므로 압력만으로는 샘플 없음
+    assert acq.acquired == 0
+
+    i2c.set(_DPS310, _DPS310_INT_STS, 0x03)
+    pin.pulse()
+    assert acq.acquired == 1
+    raw_press, raw_temp = 0xF51234 - 0x1000000, 0x085678
+    assert acq.ring.raw_pressure[0] == raw_press
+    assert acq.ring.raw_temp[0] == raw_temp
+    pressure, temperature = make_dps310().compensate(raw_press, raw_temp)
+    ts, p, t = acq.pop()
+    assert p == pytest.approx(pressure, rel=1e-6)
+    assert t == pytest.approx(temperature, abs=1e-4)
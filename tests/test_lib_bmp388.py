@@ -0,0 +1,108 @@
+"""
+lib/bmp388 드라이버 레지스터 접근 시험: 버스트 스냅숏, 섀도 레지스터
+"""
+import pytest
+
+import host
+from fakes import BMP388_CALIBRATION, FakeI2C
+from lib.bmp388 import bmp390, bmp581
+from lib.bmp388.i2c_helpers import ShadowRegisters, deferred_writes
+
+host.class_consts(bmp581)
+host.class_consts(bmp390)
+
+
+def make_bmp581():
+    i2c = FakeI2C()
+    i2c.set(0x47, 0x01, 0x50)
+    i2c.set(0x47, 0x1D, bytes((0x00, 0x00, 0x19, 0x00, 0xCC, 0x62)))  # 25 C, 1013 hPa
+    return i2c, bmp581.BMP581(i2c)
+
+
+def make_bmp390(shadow=False):
+    i2c = FakeI2C()
+    i2c.set(0x7F, 0x00, 0x60)
+    i2c.set(0x7F, 0x31, BMP388_CALIBRATION)
+    i2c.set(0x7F, 0x04, bytes((0x00, 0x60, 0x6B, 0x00, 0x80, 0x81)))
+    return i2c, bmp390.BMP390(i2c, shadow=shadow)
+
+
+# 읽으면 지워지거나(인터럽트/오류/이벤트 상태) 꺼내지는(FIFO_DATA) 레지스터
+CLEAR_ON_READ = {
+    make_bmp581: (0x47, (0x27, 0x29)),
+    make_bmp390: (0x7F, (0x02, 0x10, 0x11, 0x14)),
+}
+
+
+@pytest.mark.parametrize("make", list(CLEAR_ON_READ))
+def test_snapshot_leaves_clear_on_read_registers(make, capsys):
+    i2c, sensor = make()
+    address, registers = CLEAR_ON_READ[make]
+    for register in registers:
+        i2c.set(address, register, 0xA5)
+        i2c.clear_on_read.add((address, register))
+    sensor.snapshot()
+    sensor.config
+    sensor.invalidate()
+    assert "pressure" in capsys.readouterr().out
+    assert [i2c.mem[address][register] for register in registers] == [0xA5] * len(registers)
+
+
+@pytest.mark.parametrize("make", list(CLEAR_ON_READ))
+def test_transactions_saved_matches_bus(make, capsys):
+    i2c, sensor = make()
+    start = i2c.transactions
+    sensor.config
+    buffered = i2c.transactions - start
+    saved = sensor.transactions_saved
+    sensor.snapshot = lambda: None  # 같은 config를 스냅숏 없이
+    start = i2c.transactions
+    sensor.config
+    direct = i2c.transactions - start
+    assert saved > 0
+    assert direct - buffered == saved
+    out = capsys.readouterr().out
+    assert out[:len(out) // 2] == out[len(out) // 2:]  # 스냅숏 값과 버스 값이 같음
+
+
+def test_shadow_write_skips_read_back():
+    for shadow, expected in ((False, 2), (True, 1)):
+        i2c, sensor = make_bmp390(shadow)
+        start = i2c.transactions
+        sensor.iir_coefficient = bmp390.COEF_3
+        assert i2c.transactions - start == expected  # 섀도가 있으면 쓰기만
+        assert i2c.mem[0x7F][0x1F] == bmp390.COEF_3 << 1
+    assert sensor._shadow.reads_saved >= 1
+
+
+def test_deferred_writes_coalesce_per_register():
+    i2c, sensor = make_bmp390(shadow=True)
+    saved = sensor._shadow.writes_saved
+    start = i2c.transactions
+    with deferred_writes(sensor):
+        sensor.pressure_oversample_rate = bmp390.OSR8
+        sensor.temperature_oversample_rate = bmp390.OSR2
+        sensor.iir_coefficient = bmp390.COEF_7
+        assert i2c.transactions == start  # 블록 안에서는 버스에 가지 않음
+    assert i2c.transactions - start == 2  # OSR(0x1c) 한 번, CONFIG(0x1f) 한 번
+    assert sensor._shadow.writes_saved - saved == 1
+    assert i2c.mem[0x7F][0x1C] == bmp390.OSR2 << 3 | bmp390.OSR8
+    assert i2c.mem[0x7F][0x1F] == bmp390.COEF_7 << 1
+    assert (sensor.pressure_oversample_rate, sensor.temperature_oversample_rate) == ("OSR8", "OSR2")
+
+
+def test_resync_picks_up_chip_side_changes():
+    i2c, sensor = make_bmp390(shadow=True)
+    i2c.set(0x7F, 0x1B, 0x03)  # 칩이 스스로 슬립으로 돌아감 (모드 비트 0)
+    sensor.resync()
+    assert sensor._shadow.values[0x1B] == 0x03
+    start = i2c.transactions
+    sensor.power_mode = bmp390.BMP390_NORMAL_POWER
+    assert i2c.transactions - start == 1
+    assert i2c.mem[0x7F][0x1B] == 0x33
+
+
+def test_shadow_rejects_multi_byte_registers():
+    _, sensor = make_bmp390()
+    with pytest.raises(ValueError):
+        ShadowRegisters(sensor, (0x1B, 0x04))  # 0x04는 3바이트 압력 데이터
@@ -0,0 +1,55 @@
+"""
+샘플 경로 힙 증가 시험
+드라이버가 고정 버퍼(readfrom_mem_into)만 쓰는지 가짜 버스에서 10,000번 읽고
+드라이버 소스에서 할당된 채 남은 메모리가 없는지 tracemalloc으로 확인한다.
+"""
+import tracemalloc
+
+import pytest
+
+import bmp280
+import bmp388
+import dps310
+from fakes import make_bmp280, make_bmp388, make_dps310
+
+READS = 10000
+_DRIVER_FILES = tuple(tracemalloc.Filter(True, module.__file__) for module in (bmp280, bmp388, dps310))
+
+
+SAMPLE_PATHS = [
+    (make_bmp280, "read_raw_pressure"),
+    (make_bmp280, "read_raw_temperature"),
+    (make_bmp280, "read_raw_data"),
+    (make_bmp388, "read_raw_data"),
+    (make_bmp388, "read_raw_pressure"),
+    (make_dps310, "read_raw_pressure"),
+    (make_dps310, "read_raw_temperature"),
+    (make_dps310, "read_raw_data"),
+]
+
+
+@pytest.mark.parametrize("factory, method", SAMPLE_PATHS,
+                         ids=["%s.%s" % (f.__name__[5:], m) for f, m in SAMPLE_PATHS])
+def test_no_heap_growth(factory, method):
+    read = getattr(factory(), method)
+    read()  # 지연 생성되는 상태가 있으면 먼저 만들어 둠
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(_DRIVER_FILES)
+        for _ in range(READS):
+            read()
+        after = tracemalloc.take_snapshot().filter_traces(_DRIVER_FILES)
+    finally:
+        tracemalloc.stop()
+
+    growth = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    assert growth == 0, "%s: %d bytes retained after %d reads" % (method, growth, READS)
+
+
+def test_reads_use_one_transaction():
+    """준비 플래그가 선 상태에서 융합 읽기는 상태 확인 1번 + 버스트 읽기 1번"""
+    sensor = make_dps310()
+    before = sensor.i2c.transactions
+    sensor.read()
+    assert sensor.i2c.transactions - before == 2
@@ -0,0 +1,79 @@
+"""
+Sample 경로 시험: lib/bmp280이 Sample을 채우고, 기록/전송 모듈이 같은 Sample을 그대로 받는지
+"""
+import io
+
+import pytest
+
+import binlog
+from fakes import BMP280_CALIBRATION, FakeI2C
+from frame_protocol import FrameDecoder, FrameWriter
+from sample_store import Sample
+from sensor_ids import SENSOR_BMP280, SENSOR_BMP388
+from telemetry import TelemetryRenderer
+from tsdb import TimeSeriesStore
+
+
+def lib_bmp280():
+    from lib.bmp280 import BMP280I2C
+
+    i2c = FakeI2C()
+    i2c.set(0x76, 0x88, BMP280_CALIBRATION)
+    sensor = BMP280I2C(0x76, i2c)
+    i2c.set(0x76, 0xF7, bytes((0x65, 0x5A, 0xC0, 0x7E, 0xED, 0x00)))
+    return sensor
+
+
+def test_measurements_returns_a_fresh_dict():
+    sensor = lib_bmp280()
+    first = sensor.measurements
+    first['p'] = None
+    second = sensor.measurements
+    assert second is not first and second['p'] is not None
+    assert second['p_adc'] == 0x655AC and second['t_adc'] == 0x7EED0
+
+
+def test_measure_into_fills_sample():
+    sensor = lib_bmp280()
+    sample = Sample(ts=5, sensor=SENSOR_BMP280)
+    assert sensor.measure_into(sample) is sample
+    expected = sensor.measurements
+    assert (sample.raw_pressure, sample.raw_temp) == (expected['p_adc'], expected['t_adc'])
+    assert (sample.pressure, sample.temperature) == (expected['p'], expected['t'])
+    assert (sample.ts, sample.sensor) == (5, SENSOR_BMP280)
+
+
+def sample():
+    return Sample(ts=1234, raw_pressure=415148, raw_temp=519888, pressure=1006.53, temperature=21.5,
+                  sensor=SENSOR_BMP388)
+
+
+def test_binlog_log_sample(tmp_path):
+    path = str(tmp_path / "log.bin")
+    with binlog.BinaryLog(path) as log:
+        log.log_sample(sample())
+    assert binlog.decode(path) == [(1234, SENSOR_BMP388, binlog.EV_MEASUREMENT, binlog.STATUS_OK, 0, 415148, 519888)]
+
+
+def test_tsdb_append_sample(tmp_path):
+    with TimeSeriesStore(str(tmp_path / "p.tsdb")) as store:
+        store.append_sample(sample())
+        ((ts, pressure, temperature),) = store.query(SENSOR_BMP388)
+    assert ts == 1234
+    assert (pressure, temperature) == pytest.approx((1006.53, 21.5))
+
+
+def test_frame_write_sample():
+    out = io.BytesIO()
+    FrameWriter(out).write_sample(sample())
+    ((_, sensor, ts, pressure, temperature),) = FrameDecoder().feed(out.getvalue())
+    assert (sensor, ts) == (SENSOR_BMP388, 1234)
+    assert (pressure, temperature) == pytest.approx((1006.53, 21.5))
+
+
+def test_telemetry_update_sample():
+    out = io.BytesIO()
+    telemetry = TelemetryRenderer(stream=out)
+    telemetry.update_sample(sample())
+    assert telemetry.render()
+    assert b"BMP388 1006.53 hPa" in out.getvalue()
@@ -0,0 +1,83 @@
+"""
+콘솔 텔레메트리 시험: 표시 주기 제한, 덮어쓴 샘플 집계, 숫자 형식(음수 포함), 같은 시각 센서 묶음 출력
+"""
+import io
+import time
+
+import pytest
+
+from scheduler import Scheduler
+from telemetry import TelemetryRenderer
+
+
+def lines(out):
+    """시각 접두사('[hh:mm:ss:mmm] ')를 뗀 출력 줄 목록"""
+    return [line.split("] ", 1)[1] for line in out.getvalue().decode().splitlines()]
+
+
+def test_rate_limit():
+    out = io.BytesIO()
+    telemetry = TelemetryRenderer(rate_hz=20, stream=out)
+    assert not telemetry.render()  # 새 값 없음
+    telemetry.update("BMP388", 1000.0)
+    assert telemetry.render()
+    telemetry.update("BMP388", 1000.1)
+    assert not telemetry.render()  # 표시 주기(50 ms) 안
+    assert telemetry.render(force=True)
+    assert not telemetry.render(force=True)  # force여도 새 값이 없으면 출력 안 함
+    telemetry.update("BMP388", 1000.2)
+    time.sleep(0.06)
+    assert telemetry.render()
+    assert telemetry.lines == 3 and len(lines(out)) == 3
+
+
+def test_dropped_counts_overwritten_samples():
+    out = io.BytesIO()
+    telemetry = TelemetryRenderer(stream=out)
+    for pressure in (1000.0, 1000.1, 1000.2):
+        telemetry.update("BMP388", pressure)
+    telemetry.update("DPS310", 999.0)
+    telemetry.render()
+    assert (telemetry.acquired, telemetry.displayed, telemetry.dropped) == (4, 2, 2)
+    assert lines(out) == ["BMP388 1000.20 hPa | DPS310 999.00 hPa"]
+    assert telemetry.format_stats() == "acquired 4 displayed 2 dropped 2 lines 1"
+
+
+@pytest.mark.parametrize("value, text", [
+    (1006.534, "1006.53"),
+    (0.004, "0.00"),
+    (9.999, "10.00"),
+    (-0.05, "-0.05"),
+    (-0.5, "-0.50"),
+    (-12.3, "-12.30"),
+    (-57.92, "-57.92"),
+])
+def test_number_format(value, text):
+    out = io.BytesIO()
+    telemetry = TelemetryRenderer(altitude=lambda pressure: value, stream=out)
+    telemetry.update("BMP280", value)
+    telemetry.render()
+    assert lines(out) == ["BMP280 %s hPa %s m" % (text, text)]
+
+
+def test_no_trailing_space_without_altitude():
+    out = io.BytesIO()
+    telemetry = TelemetryRenderer(stream=out)
+    telemetry.update("BMP280", 1006.53)
+    telemetry.update("BMP388", 1006.61)
+    telemetry.render()
+    assert out.getvalue().endswith(b"BMP280 1006.53 hPa | BMP388 1006.61 hPa\n")
+
+
+def test_render_task_combines_sensors_due_together():
+    """low_power_press와 같은 배치: 센서 작업 뒤에 등록한 출력 작업이 한 줄로 묶음"""
+    out = io.BytesIO()
+    telemetry = TelemetryRenderer(rate_hz=20, stream=out)
+    sched = Scheduler()
+    for name, pressure in (("BMP280", 1006.53), ("DPS310", 1006.58), ("BMP388", 1006.61)):
+        sched.add(name, 50, lambda task, pressure=pressure: telemetry.update(task.name, pressure))
+    sched.add("render", telemetry.interval_ms, lambda task: telemetry.render(force=True))
+    sched.run(300)
+
+    assert telemetry.lines >= 5 and telemetry.dropped == 0
+    assert set(lines(out)) == {"BMP280 1006.53 hPa | DPS310 1006.58 hPa | BMP388 1006.61 hPa"}
@@ -0,0 +1,61 @@
+"""
+온도 보정항 갱신 정책 시험: period_ms만 주면 갱신 사이에는 온도 바이트를 읽지 않고 온도 보정식도 돌리지 않음
+"""
+import pytest
+
+from fakes import make_bmp280, make_bmp388, make_dps310
+from temperature_refresh import TemperatureRefresh
+
+
+class ReadLog:
+    """읽은 (레지스터, 길이)를 기록하는 버스 감싸기"""
+
+    def __init__(self, i2c):
+        self.i2c = i2c
+        self.reads = []
+
+    def readfrom_mem(self, addr, register, nbytes):
+        self.reads.append((register, nbytes))
+        return self.i2c.readfrom_mem(addr, register, nbytes)
+
+    def readfrom_mem_into(self, addr, register, buf):
+        self.reads.append((register, len(buf)))
+        self.i2c.readfrom_mem_into(addr, register, buf)
+
+    def __getattr__(self, name):
+        return getattr(self.i2c, name)
+
+
+# 드라이버별 (만들기, 온도 데이터 레지스터 범위, 온도 보정식을 돌리는 메서드)
+DRIVERS = {
+    "BMP280": (make_bmp280, range(0xFA, 0xFD), "compensate_temperature"),
+    "BMP388": (make_bmp388, range(0x07, 0x0A), "compensate_temperature"),
+    "DPS310": (make_dps310, range(0x03, 0x06), "compensate"),
+}
+
+
+def test_period_only_disables_sample_count():
+    refresh = TemperatureRefresh(period_ms=60000)
+    assert refresh.every is None
+    assert [refresh.due() for _ in range(5)] == [True, False, False, False, False]
+    assert TemperatureRefresh().every == 1
+
+
+@pytest.mark.parametrize("name", DRIVERS)
+def test_temperature_skipped_between_refreshes(name, monkeypatch):
+    make, temperature_registers, method = DRIVERS[name]
+    sensor = make()
+    sensor.i2c = bus = ReadLog(sensor.i2c)
+    compensations = []
+    compensate = getattr(sensor, method)
+    monkeypatch.setattr(sensor, method, lambda *raw: compensations.append(raw) or compensate(*raw))
+    sensor.set_temperature_refresh(period_ms=60000)
+
+    first = sensor.pressure
+    assert len(compensations) == 1
+    refreshed = len(bus.reads)
+    for _ in range(5):
+        assert sensor.pressure == pytest.approx(first)
+    assert len(compensations) == 1
+    for register, nbytes in bus.reads[refreshed:]:
+        assert not set(range(register, register + nbytes)) & set(temperature_registers)
@@ -0,0 +1,142 @@
+"""
+시계열 저장소 시험: 왕복, 다시 열기와 색인 재구성, CRC 손상 블록, 잘린 끝 블록 복구, 이진 탐색 조회
+"""
+import pytest
+
+import tsdb
+from sensor_ids import SENSOR_BMP280, SENSOR_BMP388
+from tsdb import HEADER_SIZE, TimeSeriesStore
+
+BLOCK = 512
+
+
+def samples(count, start=1000000, period=40, gap_every=None, gap=600000):
+    """(시각 ms, 기압 hPa, 온도 °C) 목록 (gap_every마다 gap ms 공백)"""
+    out = []
+    ts = start
+    for i in range(count):
+        if gap_every and i and i % gap_every == 0:
+            ts += gap
+        out.append((ts, 1000.0 + (i % 200) * 0.013 - (i % 7) * 0.002, 20.0 + (i % 50) * 0.01))
+        ts += period
+    return out
+
+
+def fill(store, sensor, data):
+    for ts, pressure, temperature in data:
+        store.append(sensor, ts, pressure, temperature)
+
+
+def same(got, expected):
+    assert [s[0] for s in got] == [s[0] for s in expected]
+    for (_, p, t), (_, ep, et) in zip(got, expected):
+        assert p == pytest.approx(ep, abs=0.0006) and t == pytest.approx(et, abs=0.006)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "pressure.tsdb")
+
+
+def test_round_trip(path):
+    data = samples(1500)
+    with TimeSeriesStore(path, BLOCK) as store:
+        fill(store, SENSOR_BMP388, data)
+        fill(store, SENSOR_BMP280, data[:10])
+        same(store.query(SENSOR_BMP388), data)  # 아직 기록하지 않은 블록 포함
+    with TimeSeriesStore(path, BLOCK) as store:
+        same(store.query(SENSOR_BMP388), data)
+        same(store.query(SENSOR_BMP280), data[:10])
+        assert store.corrupt == 0
+
+
+def test_long_gaps_share_blocks(path):
+    """저전력 모드처럼 샘플 사이가 몇 분씩 비어도 블록을 새로 열지 않음 (u16 시각 차이였다면 샘플마다 블록)"""
+    data = samples(600, period=60000, gap_every=10)
+    with TimeSeriesStore(path, BLOCK) as store:
+        fill(store, SENSOR_BMP388, data)
+        store.flush()
+        assert store.blocks <= 10
+        same(store.query(SENSOR_BMP388), data)
+
+
+def test_reopen_rebuilds_index(path):
+    data = samples(2000)
+    with TimeSeriesStore(path, BLOCK) as store:
+        fill(store, SENSOR_BMP388, data)
+        store.flush()
+        blocks, summary = store.blocks, store.summary(SENSOR_BMP388)
+    with TimeSeriesStore(path, BLOCK) as store:
+        assert store.blocks == blocks > 5
+        assert store.summary(SENSOR_BMP388) == summary
+        fill(store, SENSOR_BMP388, samples(100, start=data[-1][0] + 40))  # 이어서 기록
+        assert len(store.query(SENSOR_BMP388)) == 2100
+
+
+def test_corrupt_block_is_skipped_and_counted(path):
+    data = samples(2000)
+    with TimeSeriesStore(path, BLOCK) as store:
+        fill(store, SENSOR_BMP388, data)
+        store.flush()
+    with open(path, "r+b") as f:
+        f.seek(BLOCK + HEADER_SIZE + 20)  # 두 번째 블록 데이터 한 바이트
+        byte = f.read(1)
+        f.seek(-1, 1)
+        f.write(bytes((byte[0] ^ 0xFF,)))
+    with TimeSeriesStore(path, BLOCK) as store:
+        got = store.query(SENSOR_BMP388)
+        assert store.corrupt == 1
+    with open(path, "rb") as f:
+        kept = tsdb.decode_block(f.read(BLOCK))[1]  # 첫 블록은 그대로
+    assert got[:len(kept)] == kept
+    assert {s[0] for s in got} < {s[0] for s in data}  # 손상된 블록의 샘플만 빠짐
+
+
+def test_truncated_tail_is_recovered(path):
+    data = samples(1000)
+    with TimeSeriesStore(path, BLOCK) as store:
+        fill(store, SENSOR_BMP388, data)
+        store.flush()
+        blocks = store.blocks
+    with open(path, "ab") as f:
+        f.write(b"TB" + bytes(BLOCK // 2))  # 기록 중 전원 차단으로 잘린 블록
+    with TimeSeriesStore(path, BLOCK) as store:
+        assert store.blocks == blocks
+        same(store.query(SENSOR_BMP388), data)
+        more = samples(200, start=data[-1][0] + 40)
+        fill(store, SENSOR_BMP388, more)
+    with TimeSeriesStore(path, BLOCK) as store:
+        same(store.query(SENSOR_BMP388), data + more)
+        assert store.corrupt == 0
+
+
+class CountingFile:
+    """readinto 호출 수를 세는 파일 감싸기"""
+
+    def __init__(self, f):
+        self.f = f
+        self.reads = 0
+
+    def readinto(self, buf):
+        self.reads += 1
+        return self.f.readinto(buf)
+
+    def __getattr__(self, name):
+        return getattr(self.f, name)
+
+
+def test_range_query_uses_binary_search(path):
+    data = samples(5000)
+    with TimeSeriesStore(path, BLOCK) as store:
+        fill(store, SENSOR_BMP388, data)
+        store.flush()
+    with TimeSeriesStore(path, BLOCK) as store:
+        lasts = store._index[SENSOR_BMP388][1]
+        t_start, t_end = data[3000][0], data[3050][0]
+        first = store._seek(SENSOR_BMP388, t_start)
+        assert lasts[first] >= t_start and lasts[first - 1] < t_start
+        store._file = counting = CountingFile(store._file)
+        got = store.query(SENSOR_BMP388, t_start, t_end)
+        same(got, data[3000:3051])
+        assert counting.reads <= 2  # 구간이 걸친 블록만 읽음
+        assert len(lasts) > 20
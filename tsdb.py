@@ -0,0 +1,302 @@
+"""
+시계열 저장소
+며칠 동안 기록하는 기압 데이터를 텍스트 대신 고정 크기 블록으로 플래시에 추가 기록한다.
+블록은 다 찼을 때만 한 번에 쓰고(덮어쓰기 없음), 각 블록 헤더에 시간 범위, 최소/최대 기압과
+CRC32를 둔다. 센서별 블록 색인으로 시간 구간 조회 시 이진 탐색(O(log n))으로 시작 블록을 찾는다.
+MicroPython VFS와 Linux 파일에서 똑같이 동작한다.
+
+블록 형식 (리틀 엔디언, block_size 바이트):
+    헤더: b"TB" | 버전 u8 | 센서 ID u8 | 샘플 수 u16 | 데이터 길이 u16 |
+          첫 시각 u64 | 마지막 시각 u64 | 최소 기압 i32 | 최대 기압 i32 | CRC32 u32
+    데이터: 첫 샘플 (시각 u64 | 기압 i32 | 온도 i16)
+            이후 샘플은 이전 샘플과의 차이 (시각 varint | 기압 i16 | 온도 i16)
+    시각 차이는 7비트씩 나눠 쓰는 부호 없는 varint라 측정 간격이 127 ms 이하면 1바이트이고,
+    저전력 모드처럼 몇 분씩 비어도 블록을 새로 열지 않는다 (버전 1 블록의 u16 시각 차이는 읽기만 지원)
+    기압은 0.1 Pa, 온도는 0.01 °C 단위 정수, 시각은 ms (기본값 time.time_ns() // 1000000)
+    CRC32는 CRC 필드를 0으로 둔 헤더와 데이터로 계산
+
+사용 예:
+    store = TimeSeriesStore("pressure.tsdb")
+    mgr.record(store, ts_ms)
+    for ts, p, t in store.query(SENSOR_BMP388, t0, t1):
+        ...
+"""
+try:
+    import struct
+except ImportError:
+    import ustruct as struct
+
+try:
+    from binascii import crc32
+except ImportError:
+    from ubinascii import crc32
+
+from array import array
+
+from sensor_ids import SENSOR_BMP280, SENSOR_DPS310, SENSOR_BMP388  # noqa: F401 (기존 tsdb.SENSOR_* 경로 유지)
+
+_MAGIC = b"TB"
+_VERSION = 2
+_HEADER = "<2sBBHHQQiiI"
+HEADER_SIZE = struct.calcsize(_HEADER)  # 36바이트
+_FIRST = "<Qih"
+_FIRST_SIZE = struct.calcsize(_FIRST)
+_DELTA = "<hh"  # 시각 varint 뒤의 기압/온도 차이
+_DELTA_SIZE = struct.calcsize(_DELTA)
+_DELTA_V1 = "<Hhh"
+_DELTA_V1_SIZE = struct.calcsize(_DELTA_V1)
+
+
+def _fits16(value, low=-32768, high=32767):
+    return low <= value <= high
+
+
+def _varint_size(value):
+    size = 1
+    while value > 0x7F:
+        value >>= 7
+        size += 1
+    return size
+
+
+def _put_varint(buf, pos, value):
+    while value > 0x7F:
+        buf[pos] = (value & 0x7F) | 0x80
+        value >>= 7
+        pos += 1
+    buf[pos] = value
+    return pos + 1
+
+
+def _get_varint(data, pos):
+    """:return: (값, 다음 위치)"""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class _Block:
+    """RAM에서 채우는 중인 블록"""
+
+    def __init__(self, sensor, size):
+        self.sensor = sensor
+        self.buf = bytearray(size)
+        self.pos = HEADER_SIZE
+        self.count = 0
+        self.first = 0
+        self.last = 0
+        self.p_min = 0
+        self.p_max = 0
+        self._prev = None  # 이전 샘플 (시각, 기압, 온도)
+
+    def add(self, ts, press, temp):
+        """샘플 추가 (블록이 가득 찼거나, 시각이 거꾸로 가거나, 기압/온도 차이가 16비트를 넘으면 False)"""
+        prev = self._prev
+        if prev is None:
+            struct.pack_into(_FIRST, self.buf, self.pos, ts, press, temp)
+            self.pos += _FIRST_SIZE
+            self.first = ts
+            self.p_min = self.p_max = press
+        else:
+            dt, dp, dtemp = ts - prev[0], press - prev[1], temp - prev[2]
+            if (dt < 0 or self.pos + _varint_size(dt) + _DELTA_SIZE > len(self.buf) or
+                    not _fits16(dp) or not _fits16(dtemp)):
+                return False
+            pos = _put_varint(self.buf, self.pos, dt)
+            struct.pack_into(_DELTA, self.buf, pos, dp, dtemp)
+            self.pos = pos + _DELTA_SIZE
+            if press < self.p_min:
+                self.p_min = press
+            elif press > self.p_max:
+                self.p_max = press
+        self.last = ts
+        self.count += 1
+        self._prev = (ts, press, temp)
+        return True
+
+    def seal(self):
+        """헤더와 CRC를 채운 블록 바이트 반환"""
+        buf = self.buf
+        struct.pack_into(_HEADER, buf, 0, _MAGIC, _VERSION, self.sensor, self.count, self.pos - HEADER_SIZE,
+                         self.first, self.last, self.p_min, self.p_max, 0)
+        crc = crc32(memoryview(buf)[:self.pos]) & 0xFFFFFFFF
+        struct.pack_into("<I", buf, HEADER_SIZE - 4, crc)
+        return buf
+
+
+def decode_block(data):
+    """블록 바이트를 샘플 목록으로 변환 (CRC 확인)
+    :return: (센서 ID, [(시각 ms, 기압 hPa, 온도 °C), ...]) 또는 손상된 블록이면 None
+    """
+    magic, version, sensor, count, length, first, last, p_min, p_max, crc = struct.unpack_from(_HEADER, data, 0)
+    if magic != _MAGIC or version not in (1, _VERSION) or HEADER_SIZE + length > len(data):
+        return None
+    check = bytearray(data[:HEADER_SIZE + length])
+    struct.pack_into("<I", check, HEADER_SIZE - 4, 0)
+    if crc32(check) & 0xFFFFFFFF != crc:
+        return None
+
+    samples = []
+    ts, press, temp = struct.unpack_from(_FIRST, data, HEADER_SIZE)
+    samples.append((ts, press / 1000.0, temp / 100.0))
+    pos = HEADER_SIZE + _FIRST_SIZE
+    for _ in range(count - 1):
+        if version == 1:
+            dt, dp, dtemp = struct.unpack_from(_DELTA_V1, data, pos)
+            pos += _DELTA_V1_SIZE
+        else:
+            dt, pos = _get_varint(data, pos)
+            dp, dtemp = struct.unpack_from(_DELTA, data, pos)
+            pos += _DELTA_SIZE
+        ts += dt
+        press += dp
+        temp += dtemp
+        samples.append((ts, press / 1000.0, temp / 100.0))
+    return sensor, samples
+
+
+class TimeSeriesStore:
+    """추가 전용 블록 시계열 저장소"""
+
+    def __init__(self, path="pressure.tsdb", block_size=512):
+        """
+        :param path: 저장 파일 경로
+        :param block_size: 블록 크기 (플래시 페이지/섹터 크기의 약수나 배수 권장)
+        """
+        if block_size < HEADER_SIZE + _FIRST_SIZE + 1 + _DELTA_SIZE:
+            raise ValueError("block_size가 너무 작습니다.")
+        self.path = path
+        self.block_size = block_size
+        self.blocks = 0  # 파일에 있는 블록 수
+        self.corrupt = 0  # 조회 중 CRC가 맞지 않아 건너뛴 블록 수
+        self._index = {}  # 센서 ID -> (첫 시각 배열, 마지막 시각 배열, 블록 번호 배열)
+        self._open = {}  # 센서 ID -> 채우는 중인 _Block
+        try:
+            self._file = open(path, "r+b")
+        except OSError:
+            self._file = open(path, "w+b")
+        self._load_index()
+
+    def _load_index(self):
+        """파일의 블록 헤더만 읽어 센서별 색인 생성
+        끝에 잘린 블록(기록 중 전원 차단)이 있으면 무시하고 다음 기록 때 덮어쓴다
+        """
+        f = self._file
+        f.seek(0, 2)
+        self.blocks = f.tell() // self.block_size
+        header = bytearray(HEADER_SIZE)
+        for block in range(self.blocks):
+            f.seek(block * self.block_size)
+            f.readinto(header)
+            magic, _, sensor, _, _, first, last, _, _, _ = struct.unpack_from(_HEADER, header, 0)
+            if magic == _MAGIC:
+                self._index_block(sensor, first, last, block)
+
+    def _index_block(self, sensor, first, last, block):
+        entry = self._index.get(sensor)
+        if entry is None:
+            entry = self._index[sensor] = (array('q'), array('q'), array('I'))
+        entry[0].append(first)
+        entry[1].append(last)
+        entry[2].append(block)
+
+    def append(self, sensor, ts_ms, pressure_hpa, temperature_c):
+        """샘플 추가 (블록이 차면 파일에 기록)
+        :param sensor: 센서 ID (SENSOR_*)
+        :param ts_ms: 시각 (ms, 센서별로 증가해야 함)
+        """
+        press = int(round(pressure_hpa * 1000))  # 0.1 Pa
+        temp = int(round(temperature_c * 100))  # 0.01 °C
+        block = self._open.get(sensor)
+        if block is None:
+            block = self._open[sensor] = _Block(sensor, self.block_size)
+        if not block.add(ts_ms, press, temp):
+            self._write(block)
+            block = self._open[sensor] = _Block(sensor, self.block_size)
+            block.add(ts_ms, press, temp)
+
+    def append_sample(self, sample):
+        """sample_store.Sample 추가 (sample.sensor는 센서 ID)"""
+        self.append(sample.sensor, sample.ts, sample.pressure, sample.temperature)
+
+    def _write(self, block):
+        """블록을 파일 끝(블록 경계)에 기록하고 색인에 추가"""
+        f = self._file
+        f.seek(self.blocks * self.block_size)
+        f.write(block.seal())
+        self._index_block(block.sensor, block.first, block.last, self.blocks)
+        self.blocks += 1
+
+    def flush(self):
+        """채우는 중인 블록을 모두 기록 (종료 전에 호출, 남은 공간은 비워 둠)"""
+        for sensor, block in self._open.items():
+            if block.count:
+                self._write(block)
+        self._open = {}
+        self._file.flush()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _seek(self, sensor, t_start):
+        """t_start 이후 샘플이 있는 첫 블록의 색인 위치 (마지막 시각에 대한 이진 탐색)"""
+        lasts = self._index[sensor][1]
+        lo, hi = 0, len(lasts)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if lasts[mid] < t_start:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def query(self, sensor, t_start=0, t_end=1 << 62):
+        """시간 구간의 샘플 조회 (아직 기록하지 않은 블록 포함)
+        :return: [(시각 ms, 기압 hPa, 온도 °C), ...]
+        """
+        samples = []
+        entry = self._index.get(sensor)
+        if entry is not None:
+            firsts, _, blocks = entry
+            data = bytearray(self.block_size)
+            for i in range(self._seek(sensor, t_start), len(blocks)):
+                if firsts[i] > t_end:
+                    break
+                self._file.seek(blocks[i] * self.block_size)
+                self._file.readinto(data)
+                decoded = decode_block(data)
+                if decoded is None:
+                    self.corrupt += 1
+                    continue
+                samples.extend(s for s in decoded[1] if t_start <= s[0] <= t_end)
+
+        block = self._open.get(sensor)
+        if block is not None and block.count:
+            samples.extend(s for s in decode_block(bytes(block.seal()))[1] if t_start <= s[0] <= t_end)
+        return samples
+
+    def summary(self, sensor):
+        """블록 헤더만 읽어 (첫 시각, 마지막 시각, 최소 hPa, 최대 hPa) 목록 반환 (데이터는 읽지 않음)"""
+        result = []
+        entry = self._index.get(sensor)
+        if entry is None:
+            return result
+        header = bytearray(HEADER_SIZE)
+        for block in entry[2]:
+            self._file.seek(block * self.block_size)
+            self._file.readinto(header)
+            _, _, _, _, _, first, last, p_min, p_max, _ = struct.unpack_from(_HEADER, header, 0)
+            result.append((first, last, p_min / 1000.0, p_max / 1000.0))
+        return result